@@ -1,4 +1,5 @@
 from src.agents.agent import Agent, NeedType
-from src.agents.memory import Memory
+from src.agents.memory import Memory, MemoryItem
+from src.agents.population import ActionType, Population
 
 # Import other agent types as they are implemented 
\ No newline at end of file
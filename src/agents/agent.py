@@ -1,24 +1,204 @@
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from enum import IntEnum
+from typing import Dict, List, Tuple, Optional, Any, Union
+from collections.abc import MutableMapping
+from types import MappingProxyType
 import pygame
+import itertools
 import random
 import uuid
 
 from src.utils.config import Config
+from src.agents.population import (
+    ActionType, Population, intern_action, action_name, BUILTIN_ACTION_COUNT,
+    NEED_FOOD, NEED_WATER, NEED_REST, NEED_SHELTER, NEED_SOCIAL,
+    ITEM_FOOD, ITEM_WATER, ITEM_NAMES, DEFAULT_NEED_DECAY
+)
 
-class NeedType:
-    """Types of needs an agent can have"""
-    FOOD = "food"
-    WATER = "water"
-    REST = "rest"
-    SHELTER = "shelter"
-    SOCIAL = "social"
+class NeedType(IntEnum):
+    """Types of needs an agent can have; each value is the need's population column"""
+    FOOD = NEED_FOOD
+    WATER = NEED_WATER
+    REST = NEED_REST
+    SHELTER = NEED_SHELTER
+    SOCIAL = NEED_SOCIAL
+    
+    @property
+    def key(self) -> str:
+        """Lowercase name used as the key in need dicts (e.g. "food")"""
+        return self.name.lower()
     
     @staticmethod
     def get_all_needs():
         """Get all available need types"""
-        return [NeedType.FOOD, NeedType.WATER, NeedType.REST, 
-                NeedType.SHELTER, NeedType.SOCIAL]
+        return list(NeedType)
+
+# Need dict keys, in column order
+_NEED_KEYS = tuple(need.key for need in NeedType)
+
+# Column of each need in the population needs matrix, by key or NeedType
+_NEED_INDEX = {key: i for i, key in enumerate(_NEED_KEYS)}
+_NEED_INDEX.update({need: int(need) for need in NeedType})
+
+# Slot of each carried item in the population inventory matrix
+_ITEM_INDEX = {name: i for i, name in enumerate(ITEM_NAMES)}
+
+# Points of need satisfied per unit consumed
+FOOD_EFFECTIVENESS = 5.0
+WATER_EFFECTIVENESS = 8.0
+
+# Name parts for generated agent names
+_FIRST_NAMES_MALE = ("John", "William", "Robert", "Thomas", "Edward", "Henry",
+                     "Richard", "Walter", "Hugh", "Simon", "Peter", "Geoffrey")
+_FIRST_NAMES_FEMALE = ("Alice", "Emma", "Matilda", "Isabella", "Margaret", "Joan",
+                       "Agnes", "Eleanor", "Catherine", "Cecily", "Anne", "Elizabeth")
+_SURNAMES = ("Smith", "Miller", "Baker", "Carpenter", "Wright", "Fletcher", "Cook",
+             "Taylor", "Carter", "Shepherd", "Cooper", "Fisher", "Hunter", "Farmer")
+
+# Source of compact integer agent ids (e.g. for building occupant arrays)
+_AGENT_UIDS = itertools.count()
+
+# Skills every agent starts with, and the range of their starting levels
+_SKILL_KEYS = ("farming", "mining", "woodcutting", "building", "crafting", "trading", "cooking")
+_STARTING_SKILL_RANGE = (0.1, 0.3)
+
+# Cell offsets searched for someone to socialize with (the agent's own cell excluded)
+_SOCIAL_SEARCH_RADIUS = 2
+_SOCIAL_OFFSETS = tuple(
+    (dx, dy)
+    for dx in range(-_SOCIAL_SEARCH_RADIUS, _SOCIAL_SEARCH_RADIUS + 1)
+    for dy in range(-_SOCIAL_SEARCH_RADIUS, _SOCIAL_SEARCH_RADIUS + 1)
+    if dx or dy
+)
+
+# Needs below this value take priority over job activities
+NEED_ATTENTION_THRESHOLD = 30.0
+
+# Action used to address each need column when it is the lowest; rest and
+# shelter fall back to "find_shelter" for agents without a home
+NEED_ACTIONS = (ActionType.FIND_FOOD, ActionType.FIND_WATER, ActionType.GO_HOME,
+                ActionType.GO_HOME, ActionType.SOCIALIZE)
+NEED_ACTION_CODES = np.array(NEED_ACTIONS, dtype=np.int16)
+
+def select_need_actions(needs: np.ndarray, has_home: np.ndarray) -> np.ndarray:
+    """
+    Pick the need-driven action for each row of a needs block.
+    
+    Args:
+        needs: (n, NUM_NEEDS) need values
+        has_home: (n,) whether each agent has a home
+        
+    Returns:
+        (n,) action codes; ActionType.NONE where no need is below the threshold
+    """
+    lowest = np.argmin(needs, axis=1)
+    lowest_value = np.take_along_axis(needs, lowest[:, None], axis=1).ravel()
+    
+    codes = NEED_ACTION_CODES[lowest]
+    codes[lowest_value >= NEED_ATTENTION_THRESHOLD] = ActionType.NONE
+    
+    # Agents without a home look for shelter instead of going home
+    codes[(codes == ActionType.GO_HOME) & ~has_home] = ActionType.FIND_SHELTER
+    return codes
+
+# Progress method for each built-in action
+_PROGRESS_METHODS = {
+    ActionType.WANDER: "_progress_wander",
+    ActionType.GO_HOME: "_progress_go_home",
+    ActionType.FIND_FOOD: "_progress_find_food",
+    ActionType.FIND_WATER: "_progress_find_water",
+    ActionType.SLEEPING: "_progress_sleeping",
+    ActionType.FIND_SHELTER: "_progress_find_shelter",
+    ActionType.SOCIALIZE: "_progress_socialize",
+}
+
+def _build_progress_table(cls) -> Tuple:
+    """Build a tuple of progress functions indexed by ActionType code"""
+    table = [None] * BUILTIN_ACTION_COUNT
+    for action, method in _PROGRESS_METHODS.items():
+        table[action] = getattr(cls, method)
+    return tuple(table)
+
+class NeedsView(MutableMapping):
+    """Dict-style view of one agent's row in the population needs matrix"""
+    
+    __slots__ = ("_agent",)
+    
+    def __init__(self, agent):
+        self._agent = agent
+    
+    def __getitem__(self, need_type):
+        agent = self._agent
+        return float(agent.population.needs[agent.idx, _NEED_INDEX[need_type]])
+    
+    def __setitem__(self, need_type, value):
+        agent = self._agent
+        agent.population.needs[agent.idx, _NEED_INDEX[need_type]] = value
+    
+    def __delitem__(self, need_type):
+        raise TypeError("Agent needs cannot be removed")
+    
+    def __iter__(self):
+        return iter(_NEED_KEYS)
+    
+    def __len__(self):
+        return len(_NEED_KEYS)
+    
+    def copy(self) -> Dict[str, float]:
+        """Get a plain dict snapshot of the needs"""
+        return dict(self.items())
+
+class InventoryView(MutableMapping):
+    """Dict-style view of one agent's row in the population inventory matrix.
+    Like the old inventory dict, only items with a positive amount are present.
+    Items without a matrix column (anything but food and water) are kept in a
+    plain per-agent dict."""
+    
+    __slots__ = ("_agent", "_other")
+    
+    def __init__(self, agent):
+        self._agent = agent
+        self._other: Dict[Any, float] = {}
+    
+    def __getitem__(self, item):
+        column = _ITEM_INDEX.get(item)
+        if column is None:
+            return self._other[item]
+        agent = self._agent
+        amount = float(agent.population.inventory[agent.idx, column])
+        if amount <= 0:
+            raise KeyError(item)
+        return amount
+    
+    def __setitem__(self, item, amount):
+        column = _ITEM_INDEX.get(item)
+        if column is None:
+            self._other[item] = amount
+            return
+        agent = self._agent
+        agent.population.inventory[agent.idx, column] = amount
+    
+    def __delitem__(self, item):
+        if item not in _ITEM_INDEX:
+            del self._other[item]
+            return
+        self[item]  # Raise KeyError if not carried
+        self[item] = 0.0
+    
+    def __iter__(self):
+        agent = self._agent
+        row = agent.population.inventory[agent.idx]
+        carried = [name for name, amount in zip(ITEM_NAMES, row) if amount > 0]
+        carried.extend(self._other)
+        return iter(carried)
+    
+    def __len__(self):
+        agent = self._agent
+        return int(np.count_nonzero(agent.population.inventory[agent.idx] > 0)) + len(self._other)
+    
+    def copy(self) -> Dict[str, float]:
+        """Get a plain dict snapshot of the carried items"""
+        return dict(self.items())
 
 class Agent:
     """
@@ -26,60 +206,62 @@ class Agent:
     Each agent has needs, skills, and the ability to perform actions.
     """
     
-    def __init__(self, config: Config, name: Optional[str] = None):
+    __slots__ = (
+        "config", "id", "uid", "_name", "_name_key",
+        "population", "idx", "_needs_view", "_inventory_view",
+        "age", "gender", "carrying_capacity", "action_target",
+        "job", "job_data", "skills", "relationships", "memory", "known_locations",
+    )
+    
+    # Need decay rates in units per hour, keyed by NeedType; shared by all agents
+    need_decay_rates = MappingProxyType(dict(zip(_NEED_KEYS, DEFAULT_NEED_DECAY)))
+    
+    # Progress functions indexed by ActionType code; set after the class body
+    _PROGRESS_TABLE: Tuple = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Pick up any progress methods the subclass overrides
+        cls._PROGRESS_TABLE = _build_progress_table(cls)
+    
+    def __init__(self, config: Config, name: Optional[str] = None,
+                 population: Optional[Population] = None):
         """
         Initialize a new agent.
         
         Args:
             config: Configuration object
             name: Optional name for the agent, randomly generated if not provided
+            population: Population to store the agent's state in; a private one is
+                created if not provided (the world adopts the agent when it is added)
         """
         self.config = config
         self.id = str(uuid.uuid4())
-        self.name = name or self._generate_name()
+        self.uid = next(_AGENT_UIDS)  # Unique integer id, for array-based bookkeeping
+        # Generated names are built on first read; the random key is drawn now so
+        # reading (or never reading) names doesn't shift the shared random stream
+        self._name = name or None
+        self._name_key = random.getrandbits(32) if self._name is None else 0
+        
+        # Needs, health, position and action progress live in a population row.
+        # Needs: 0 = starving/dehydrated/exhausted/exposed/lonely, 100 = fully satisfied
+        self.population = population if population is not None else Population(capacity=1)
+        self.idx = self.population.allocate(self)
+        self._needs_view = NeedsView(self)
+        self._inventory_view = InventoryView(self)
         
         # Physical attributes
         self.age = random.randint(18, 50)  # Start as an adult
         self.gender = random.choice(["male", "female"])
-        self.health = 100.0  # Max health
-        self.position = (0, 0)  # Will be set when added to world
-        self.home_position = None  # Will be set later
-        self.inventory = {}  # What the agent is carrying
         self.carrying_capacity = 100.0
         
-        # Needs system
-        self.needs = {
-            NeedType.FOOD: 100.0,  # 0 = starving, 100 = full
-            NeedType.WATER: 100.0,  # 0 = dehydrated, 100 = hydrated
-            NeedType.REST: 100.0,   # 0 = exhausted, 100 = well-rested
-            NeedType.SHELTER: 100.0,  # 0 = exposed, 100 = sheltered
-            NeedType.SOCIAL: 100.0,   # 0 = lonely, 100 = socially fulfilled
-        }
-        
-        self.need_decay_rates = {
-            NeedType.FOOD: 1.0,      # Units per hour
-            NeedType.WATER: 2.0,     # Units per hour
-            NeedType.REST: 1.5,      # Units per hour when awake
-            NeedType.SHELTER: 0.5,   # Units per hour when exposed
-            NeedType.SOCIAL: 0.3,    # Units per hour when alone
-        }
-        
-        # Current action/state
-        self.current_action = None
-        self.action_progress = 0.0
+        # Current action/state (action code and progress live in the population row)
         self.action_target = None
         
         # Job and skills
         self.job = None  # Will be assigned later
-        self.skills = {
-            "farming": random.uniform(0.1, 0.3),
-            "mining": random.uniform(0.1, 0.3),
-            "woodcutting": random.uniform(0.1, 0.3),
-            "building": random.uniform(0.1, 0.3),
-            "crafting": random.uniform(0.1, 0.3),
-            "trading": random.uniform(0.1, 0.3),
-            "cooking": random.uniform(0.1, 0.3),
-        }
+        low, high = _STARTING_SKILL_RANGE
+        self.skills = {skill: random.uniform(low, high) for skill in _SKILL_KEYS}
         
         # Relationships with other agents
         self.relationships = {}  # agent_id -> relationship value (-100 to 100)
@@ -88,22 +270,89 @@ class Agent:
         self.memory = []  # List of important events/information
         self.known_locations = {}  # type -> list of positions
     
-    def _generate_name(self) -> str:
-        """Generate a random name for the agent"""
-        first_names_male = ["John", "William", "Robert", "Thomas", "Edward", "Henry", 
-                           "Richard", "Walter", "Hugh", "Simon", "Peter", "Geoffrey"]
-        first_names_female = ["Alice", "Emma", "Matilda", "Isabella", "Margaret", "Joan",
-                             "Agnes", "Eleanor", "Catherine", "Cecily", "Anne", "Elizabeth"]
-        surnames = ["Smith", "Miller", "Baker", "Carpenter", "Wright", "Fletcher", "Cook",
-                   "Taylor", "Carter", "Shepherd", "Cooper", "Fisher", "Hunter", "Farmer"]
-        
-        gender = random.choice(["male", "female"])
-        if gender == "male":
-            first_name = random.choice(first_names_male)
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = self._generate_name()
+        return self._name
+    
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+    
+    @property
+    def needs(self) -> NeedsView:
+        """Current need values, keyed by NeedType"""
+        return self._needs_view
+    
+    @property
+    def inventory(self) -> InventoryView:
+        """What the agent is carrying, keyed by item name"""
+        return self._inventory_view
+    
+    @property
+    def health(self) -> float:
+        return float(self.population.health[self.idx])
+    
+    @health.setter
+    def health(self, value: float):
+        self.population.health[self.idx] = value
+    
+    @property
+    def position(self) -> Tuple[int, int]:
+        x, y = self.population.positions[self.idx]
+        return (int(x), int(y))
+    
+    @position.setter
+    def position(self, value: Tuple[int, int]):
+        self.population.positions[self.idx] = value
+    
+    @property
+    def home_position(self) -> Optional[Tuple[int, int]]:
+        idx = self.idx
+        if not self.population.has_home[idx]:
+            return None
+        x, y = self.population.home_positions[idx]
+        return (int(x), int(y))
+    
+    @home_position.setter
+    def home_position(self, value: Optional[Tuple[int, int]]):
+        idx = self.idx
+        if value is None:
+            self.population.has_home[idx] = False
         else:
-            first_name = random.choice(first_names_female)
-            
-        surname = random.choice(surnames)
+            self.population.home_positions[idx] = value
+            self.population.has_home[idx] = True
+    
+    @property
+    def current_action(self) -> Optional[str]:
+        return action_name(self.population.actions[self.idx])
+    
+    @current_action.setter
+    def current_action(self, value: Optional[str]):
+        self.population.actions[self.idx] = intern_action(value)
+    
+    @property
+    def action_code(self) -> int:
+        """Integer code of the current action (an ActionType for built-in actions)"""
+        return int(self.population.actions[self.idx])
+    
+    @property
+    def action_progress(self) -> float:
+        return float(self.population.action_progress[self.idx])
+    
+    @action_progress.setter
+    def action_progress(self, value: float):
+        self.population.action_progress[self.idx] = value
+    
+    def _generate_name(self) -> str:
+        """Generate a random name for the agent from its name key"""
+        key = self._name_key
+        
+        # Low bit picks the name list, the rest of the key picks the names
+        first_names = _FIRST_NAMES_MALE if key & 1 else _FIRST_NAMES_FEMALE
+        first_name = first_names[(key >> 1) % len(first_names)]
+        surname = _SURNAMES[(key >> 16) % len(_SURNAMES)]
         return f"{first_name} {surname}"
     
     def step(self, world, time_delta: float):
@@ -117,78 +366,29 @@ class Agent:
         Returns:
             Action result if any
         """
-        # Update needs based on time passed
-        self._update_needs(world, time_delta)
+        # Needs and health are updated for the whole village by World.update_all_needs
         
         # Check if current action is complete
-        if self.current_action and self._is_action_complete():
+        if self.action_code and self._is_action_complete():
             self._complete_action(world)
-            self.current_action = None
-            self.action_target = None
-            self.action_progress = 0.0
+            self._set_action(ActionType.NONE, None)
         
         # If no current action, decide what to do next
-        if not self.current_action:
+        if not self.action_code:
             self._decide_next_action(world)
         
         # Progress current action if there is one
-        if self.current_action:
+        if self.action_code:
             result = self._progress_action(world, time_delta)
             return result
         
         return None
     
-    def _update_needs(self, world, time_delta: float):
-        """
-        Update agent needs based on time passed and current conditions.
-        
-        Args:
-            world: Reference to the world
-            time_delta: Time elapsed since last step
-        """
-        # Time delta is in ticks, convert to hours for need decay
-        hours = time_delta / world.time_system.ticks_per_hour
-        
-        # Decay needs based on time and conditions
-        for need_type, current_value in self.needs.items():
-            decay_rate = self.need_decay_rates[need_type]
-            
-            # Modify decay rate based on conditions
-            if need_type == NeedType.REST and self.current_action == "sleeping":
-                # Resting improves rest need
-                self.needs[need_type] = min(100.0, current_value + 10.0 * hours)
-                continue
-                
-            if need_type == NeedType.SHELTER:
-                # Only decay shelter need if not in a shelter
-                if self._is_in_shelter(world):
-                    continue
-            
-            # Apply decay
-            new_value = max(0.0, current_value - decay_rate * hours)
-            self.needs[need_type] = new_value
-        
-        # Update health based on needs
-        self._update_health()
-    
     def _is_in_shelter(self, world) -> bool:
         """Check if the agent is currently in a shelter"""
         # Simple implementation - will be expanded with actual building checks
         return self.home_position is not None and self.position == self.home_position
     
-    def _update_health(self):
-        """Update agent health based on current needs"""
-        # If any need is critically low, health starts to decrease
-        critical_needs = sum(1 for need, value in self.needs.items() 
-                            if value < 20.0)
-        
-        if critical_needs > 0:
-            health_loss = 0.5 * critical_needs  # Health points lost per hour with critical needs
-            self.health = max(0.0, self.health - health_loss)
-        elif self.health < 100.0 and all(value > 50.0 for value in self.needs.values()):
-            # Recover health slowly if all needs are moderately satisfied
-            self.health = min(100.0, self.health + 0.2)
-    
     def _decide_next_action(self, world):
         """
         Decide the next action for the agent based on their current needs and situation.
@@ -196,47 +396,37 @@ class Agent:
         Args:
             world: Reference to the world
         """
-        # Simple decision making - prioritize the lowest need
-        lowest_need = min(self.needs.items(), key=lambda x: x[1])
-        need_type, need_value = lowest_need
+        # Simple decision making - prioritize the lowest need (same rule as
+        # World._assign_need_actions, which handles idle agents in bulk)
+        idx = self.idx
+        population = self.population
+        action = int(select_need_actions(population.needs[idx:idx + 1],
+                                         population.has_home[idx:idx + 1])[0])
         
         # If any need is below threshold, address it
-        if need_value < 30.0:
-            if need_type == NeedType.FOOD:
-                self._set_action("find_food", None)
-            elif need_type == NeedType.WATER:
-                self._set_action("find_water", None)
-            elif need_type == NeedType.REST:
-                if self.home_position:
-                    self._set_action("go_home", self.home_position)
-                else:
-                    self._set_action("find_shelter", None)
-            elif need_type == NeedType.SHELTER:
-                if self.home_position:
-                    self._set_action("go_home", self.home_position)
-                else:
-                    self._set_action("find_shelter", None)
-            elif need_type == NeedType.SOCIAL:
-                self._set_action("socialize", None)
+        if action:
+            target = self.home_position if action == ActionType.GO_HOME else None
+            self._set_action(ActionType(action), target)
         else:
             # If all needs are satisfied, perform job-related activities
             if self.job:
                 self.job.decide_action(self, world)
             else:
                 # Wander around if no job
-                self._set_action("wander", None)
+                self._set_action(ActionType.WANDER, None)
     
-    def _set_action(self, action: str, target: Any):
+    def _set_action(self, action: Union[ActionType, str, None], target: Any):
         """
         Set the current action for the agent.
         
         Args:
-            action: Action type
+            action: Action type, or the name of a job-specific action
             target: Target for the action, if any
         """
-        self.current_action = action
+        idx = self.idx
+        self.population.actions[idx] = intern_action(action)
+        self.population.action_progress[idx] = 0.0
         self.action_target = target
-        self.action_progress = 0.0
     
     def _is_action_complete(self) -> bool:
         """Check if the current action is complete"""
@@ -250,11 +440,12 @@ class Agent:
             world: Reference to the world
         """
         # Apply effects based on action type
-        if self.current_action == "find_food" and self.action_target:
+        action = self.action_code
+        if action == ActionType.FIND_FOOD and self.action_target:
             self._consume_food()
-        elif self.current_action == "find_water" and self.action_target:
+        elif action == ActionType.FIND_WATER and self.action_target:
             self._consume_water()
-        elif self.current_action == "sleeping":
+        elif action == ActionType.SLEEPING:
             # Rest need is already updated during the action
             pass
     
@@ -269,21 +460,12 @@ class Agent:
         Returns:
             Result of progressing the action
         """
-        # Action specific logic
-        if self.current_action == "wander":
-            return self._progress_wander(world, time_delta)
-        elif self.current_action == "go_home":
-            return self._progress_go_home(world, time_delta)
-        elif self.current_action == "find_food":
-            return self._progress_find_food(world, time_delta)
-        elif self.current_action == "find_water":
-            return self._progress_find_water(world, time_delta)
-        elif self.current_action == "sleeping":
-            return self._progress_sleeping(world, time_delta)
-        elif self.current_action == "find_shelter":
-            return self._progress_find_shelter(world, time_delta)
-        elif self.current_action == "socialize":
-            return self._progress_socialize(world, time_delta)
+        # Built-in actions dispatch straight through the progress table
+        action = self.action_code
+        if action < BUILTIN_ACTION_COUNT:
+            progress = self._PROGRESS_TABLE[action]
+            if progress is not None:
+                return progress(self, world, time_delta)
         
         # For job-specific actions, delegate to the job
         if self.job:
@@ -291,17 +473,24 @@ class Agent:
             
         return None
     
+    def _has_tick_deltas(self, world) -> bool:
+        """Check if World.step filled the population's movement deltas for this tick"""
+        return self.population.deltas_tick == world.time_system.get_tick()
+    
     def _progress_wander(self, world, time_delta: float):
         """Progress the wandering action"""
         # Simple random movement
         current_x, current_y = self.position
         
-        # Pick a random direction
-        dx = random.choice([-1, 0, 1])
-        dy = random.choice([-1, 0, 1])
+        # Random direction, pre-drawn for the whole population this tick; drawn
+        # here when updated outside World.step
+        if self._has_tick_deltas(world):
+            dx, dy = self.population.wander_deltas[self.idx]
+        else:
+            dx, dy = world.rng.integers(-1, 2, size=2)
         
         # Try to move
-        new_x, new_y = current_x + dx, current_y + dy
+        new_x, new_y = current_x + int(dx), current_y + int(dy)
         world.move_agent(self, new_x, new_y)
         
         # Wandering is always "in progress" until interrupted
@@ -323,14 +512,17 @@ class Agent:
             self.action_progress = 1.0
             # Start sleeping when we get home if we're tired
             if self.needs[NeedType.REST] < 50.0:
-                self._set_action("sleeping", None)
+                self._set_action(ActionType.SLEEPING, None)
             return None
         
-        # Move towards home
-        dx = 1 if target_x > current_x else (-1 if target_x < current_x else 0)
-        dy = 1 if target_y > current_y else (-1 if target_y < current_y else 0)
+        # Move towards home, using the step computed for the whole population this tick
+        if self._has_tick_deltas(world):
+            dx, dy = self.population.home_deltas[self.idx]
+        else:
+            dx = (target_x > current_x) - (target_x < current_x)
+            dy = (target_y > current_y) - (target_y < current_y)
         
-        new_x, new_y = current_x + dx, current_y + dy
+        new_x, new_y = current_x + int(dx), current_y + int(dy)
         world.move_agent(self, new_x, new_y)
         
         # Check if we've arrived
@@ -344,7 +536,8 @@ class Agent:
     def _progress_find_food(self, world, time_delta: float):
         """Progress the find food action"""
         # Check if we already have food in inventory
-        if "food" in self.inventory and self.inventory["food"] > 0:
+        inventory = self.population.inventory[self.idx]
+        if inventory[ITEM_FOOD] > 0:
             self._consume_food()
             self.action_progress = 1.0
             return None
@@ -353,14 +546,13 @@ class Agent:
         x, y = self.position
         resources = world.resource_manager.get_resources_at(x, y)
         
-        food_resources = [r for r in resources if "FOOD" in r.resource_type.name]
-        if food_resources:
+        food = next((r for r in resources if r.is_food), None)
+        if food is not None:
             # Found food, extract and consume it
-            food = food_resources[0]
             amount = food.extract(10.0)  # Extract some food
             
             if amount > 0:
-                self.inventory["food"] = self.inventory.get("food", 0) + amount
+                inventory[ITEM_FOOD] += amount
                 self._consume_food()
                 self.action_progress = 1.0
                 return {"agent": self.name, "action": "gathered_food", "amount": amount}
@@ -372,7 +564,8 @@ class Agent:
     def _progress_find_water(self, world, time_delta: float):
         """Progress the find water action"""
         # Check if we already have water in inventory
-        if "water" in self.inventory and self.inventory["water"] > 0:
+        inventory = self.population.inventory[self.idx]
+        if inventory[ITEM_WATER] > 0:
             self._consume_water()
             self.action_progress = 1.0
             return None
@@ -381,14 +574,13 @@ class Agent:
         x, y = self.position
         resources = world.resource_manager.get_resources_at(x, y)
         
-        water_resources = [r for r in resources if r.resource_type.name == "WATER"]
-        if water_resources:
+        water = next((r for r in resources if r.is_water), None)
+        if water is not None:
             # Found water, extract and consume it
-            water = water_resources[0]
             amount = water.extract(10.0)  # Extract some water
             
             if amount > 0:
-                self.inventory["water"] = self.inventory.get("water", 0) + amount
+                inventory[ITEM_WATER] += amount
                 self._consume_water()
                 self.action_progress = 1.0
                 return {"agent": self.name, "action": "gathered_water", "amount": amount}
@@ -401,13 +593,10 @@ class Agent:
         """Progress the sleeping action"""
         # Ensure we're at home
         if self.position != self.home_position:
-            self._set_action("go_home", self.home_position)
+            self._set_action(ActionType.GO_HOME, self.home_position)
             return None
         
-        # Convert time_delta to hours for rest improvement
-        hours = time_delta / world.time_system.ticks_per_hour
-        
-        # Rest need is already updated in _update_needs, but we can add logic here if needed
+        # Rest need is already updated by World.update_all_needs, but we can add logic here if needed
         
         # Complete sleeping if fully rested
         if self.needs[NeedType.REST] >= 95.0:
@@ -431,27 +620,26 @@ class Agent:
             )
             
         # Now go home
-        self._set_action("go_home", self.home_position)
+        self._set_action(ActionType.GO_HOME, self.home_position)
         return None
     
     def _progress_socialize(self, world, time_delta: float):
         """Progress the socialize action"""
-        # Look for other agents nearby
+        # Look for other agents nearby, using the world's agent-only index
         x, y = self.position
-        neighbors = world.get_neighboring_cells(x, y, 2)
-        
-        other_agents = []
-        for nx, ny in neighbors:
-            entities = world.get_entities_at(nx, ny)
-            agents = [e for e in entities if isinstance(e, Agent) and e != self]
-            other_agents.extend(agents)
+        agent_grid = world.agent_grid
+        other_agents = [
+            other
+            for dx, dy in _SOCIAL_OFFSETS
+            for other in agent_grid.get((x + dx, y + dy), ())
+        ]
         
         if other_agents:
             # Found someone to socialize with
             other = random.choice(other_agents)
             
             # Socialize (update relationships and social need)
-            self._socialize_with(other)
+            self._socialize_with(other, world)
             self.action_progress = 1.0
             
             return {"agent": self.name, "action": "socialized", "with": other.name}
@@ -460,12 +648,13 @@ class Agent:
             self._progress_wander(world, time_delta)
             return None
     
-    def _socialize_with(self, other_agent):
+    def _socialize_with(self, other_agent, world):
         """
         Socialize with another agent.
         
         Args:
             other_agent: The agent to socialize with
+            world: Reference to the world (provides the pre-drawn random values)
         """
         # Update social need
         social_gain = 20.0
@@ -475,44 +664,34 @@ class Agent:
         other_id = other_agent.id
         if other_id not in self.relationships:
             # First meeting, start with a slightly positive or negative bias
-            initial_opinion = random.uniform(-10, 10)
+            initial_opinion = world.first_opinion_draws.next()
             self.relationships[other_id] = initial_opinion
         
         # Improve relationship slightly (more complex social dynamics will be added later)
-        relationship_change = random.uniform(0.5, 2.0)
+        relationship_change = world.relationship_gain_draws.next()
         self.relationships[other_id] = min(100.0, self.relationships[other_id] + relationship_change)
     
     def _consume_food(self):
         """Consume food from inventory to satisfy hunger"""
-        if "food" in self.inventory and self.inventory["food"] > 0:
-            amount_to_consume = min(10.0, self.inventory["food"])
-            self.inventory["food"] -= amount_to_consume
+        population, idx = self.population, self.idx
+        amount_to_consume = min(10.0, float(population.inventory[idx, ITEM_FOOD]))
+        if amount_to_consume > 0:
+            population.inventory[idx, ITEM_FOOD] -= amount_to_consume
             
-            # Food effectiveness based on quality (simplified)
-            food_effectiveness = 5.0  # Points of need satisfied per unit of food
-            
-            # Improve food need
-            self.needs[NeedType.FOOD] = min(100.0, self.needs[NeedType.FOOD] + amount_to_consume * food_effectiveness)
-            
-            # Remove from inventory if depleted
-            if self.inventory["food"] <= 0:
-                del self.inventory["food"]
+            # Improve food need (effectiveness is simplified, not based on quality)
+            population.needs[idx, NEED_FOOD] = min(
+                100.0, population.needs[idx, NEED_FOOD] + amount_to_consume * FOOD_EFFECTIVENESS)
     
     def _consume_water(self):
         """Consume water from inventory to satisfy thirst"""
-        if "water" in self.inventory and self.inventory["water"] > 0:
-            amount_to_consume = min(10.0, self.inventory["water"])
-            self.inventory["water"] -= amount_to_consume
-            
-            # Water effectiveness
-            water_effectiveness = 8.0  # Points of need satisfied per unit of water
+        population, idx = self.population, self.idx
+        amount_to_consume = min(10.0, float(population.inventory[idx, ITEM_WATER]))
+        if amount_to_consume > 0:
+            population.inventory[idx, ITEM_WATER] -= amount_to_consume
             
             # Improve water need
-            self.needs[NeedType.WATER] = min(100.0, self.needs[NeedType.WATER] + amount_to_consume * water_effectiveness)
-            
-            # Remove from inventory if depleted
-            if self.inventory["water"] <= 0:
-                del self.inventory["water"]
+            population.needs[idx, NEED_WATER] = min(
+                100.0, population.needs[idx, NEED_WATER] + amount_to_consume * WATER_EFFECTIVENESS)
     
     def get_state(self) -> Dict:
         """
@@ -562,4 +741,6 @@ class Agent:
             surface,
             (0, 255, 0),  # Green for health
             (x * cell_size, y * cell_size - 2, health_width, 2)
-        ) 
\ No newline at end of file
+        ) 
+
+Agent._PROGRESS_TABLE = _build_progress_table(Agent)
@@ -1,13 +1,26 @@
 from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
 import time
 import heapq
 
+@dataclass(slots=True)
+class MemoryItem:
+    """A single remembered event"""
+    type: str  # e.g. "resource_found", "met_agent"
+    content: Dict[str, Any]
+    importance: float
+    timestamp: float
+    recall_count: int = 0
+    last_recalled: float = 0.0
+
 class Memory:
     """
     Stores and manages agent memories/knowledge.
     Includes mechanisms for importance, recency, and recall.
     """
     
+    __slots__ = ("capacity", "memories", "memories_by_type", "locations", "knowledge")
+    
     def __init__(self, capacity: int = 100):
         """
         Initialize memory with a specific capacity.
@@ -16,13 +29,16 @@ class Memory:
             capacity: Maximum number of memories to store
         """
         self.capacity = capacity
-        self.memories = []  # List of memory items
+        self.memories: List[MemoryItem] = []
+        self.memories_by_type: Dict[str, List[MemoryItem]] = {}  # Type -> memories, in insertion order
         self.locations = {}  # Type -> list of locations
         self.knowledge = {}  # Key -> value, for general knowledge
     
     def add_memory(self, memory_type: str, content: Dict[str, Any], importance: float = 1.0):
         """
         Add a new memory.
+        The memory takes ownership of `content` (it is stored, not copied), so
+        pass a fresh dict and don't modify it afterwards.
         
         Args:
             memory_type: Type of memory (e.g., "resource_found", "met_agent", etc.)
@@ -30,16 +46,11 @@ class Memory:
             importance: Importance score (higher = more important)
         """
         timestamp = time.time()
-        memory = {
-            "type": memory_type,
-            "content": content.copy(),
-            "importance": importance,
-            "timestamp": timestamp,
-            "recall_count": 0,
-            "last_recalled": timestamp
-        }
+        memory = MemoryItem(memory_type, content, importance, timestamp,
+                            last_recalled=timestamp)
         
         self.memories.append(memory)
+        self.memories_by_type.setdefault(memory_type, []).append(memory)
         
         # Keep memories within capacity by removing least important ones
         if len(self.memories) > self.capacity:
@@ -54,21 +65,30 @@ class Memory:
     
     def _prune_memories(self):
         """Remove least important memories to stay within capacity"""
+        excess = len(self.memories) - self.capacity
+        if excess <= 0:
+            return
+        
         # Calculate memory value based on importance, recency, and recall frequency
+        now = time.time()
+        values = []
         for memory in self.memories:
-            age = time.time() - memory["timestamp"]
+            age = now - memory.timestamp
             recency = 1.0 / (1.0 + age / 3600.0)  # Recency decays over hours
-            recall_factor = 1.0 + (0.1 * memory["recall_count"])  # More recalls = more important
-            memory["_value"] = memory["importance"] * recency * recall_factor
-        
-        # Sort by value and keep the most valuable ones
-        self.memories.sort(key=lambda x: x["_value"], reverse=True)
-        self.memories = self.memories[:self.capacity]
-        
-        # Clean up the _value field
+            recall_factor = 1.0 + (0.1 * memory.recall_count)  # More recalls = more important
+            values.append(memory.importance * recency * recall_factor)
+        
+        # Drop only the few least valuable memories (usually just one) with a
+        # partial selection instead of sorting the whole list
+        evicted = set(heapq.nsmallest(excess, range(len(values)), key=values.__getitem__))
+        self.memories = [memory for i, memory in enumerate(self.memories) if i not in evicted]
+        self._rebuild_type_index()
+    
+    def _rebuild_type_index(self):
+        """Rebuild the per-type memory index from the memory list"""
+        self.memories_by_type = {}
         for memory in self.memories:
-            if "_value" in memory:
-                del memory["_value"]
+            self.memories_by_type.setdefault(memory.type, []).append(memory)
     
     def recall(self, memory_type: Optional[str] = None, filter_func=None, limit: int = 5):
         """
@@ -82,23 +102,27 @@ class Memory:
         Returns:
             List of matching memories, sorted by importance
         """
+        # Only scan memories of the requested type, if any
+        if memory_type is not None:
+            candidates = self.memories_by_type.get(memory_type, ())
+        else:
+            candidates = self.memories
+        
         # Filter memories
+        now = time.time()
         matches = []
-        for memory in self.memories:
-            if memory_type is not None and memory["type"] != memory_type:
-                continue
-                
-            if filter_func is not None and not filter_func(memory["content"]):
+        for memory in candidates:
+            if filter_func is not None and not filter_func(memory.content):
                 continue
                 
             # Update recall stats
-            memory["recall_count"] += 1
-            memory["last_recalled"] = time.time()
+            memory.recall_count += 1
+            memory.last_recalled = now
             
             matches.append(memory)
         
         # Sort by importance and return top matches
-        matches.sort(key=lambda x: x["importance"], reverse=True)
+        matches.sort(key=lambda x: x.importance, reverse=True)
         return matches[:limit]
     
     def get_locations(self, memory_type: str) -> List:
@@ -143,11 +167,12 @@ class Memory:
         Args:
             age_threshold: Age threshold in seconds (default: 24 hours)
         """
-        current_time = time.time()
+        cutoff = time.time() - age_threshold
         self.memories = [
             memory for memory in self.memories 
-            if current_time - memory["timestamp"] < age_threshold
+            if memory.timestamp > cutoff
         ]
+        self._rebuild_type_index()
     
     def forget_memory_type(self, memory_type: str):
         """
@@ -158,8 +183,9 @@ class Memory:
         """
         self.memories = [
             memory for memory in self.memories 
-            if memory["type"] != memory_type
+            if memory.type != memory_type
         ]
+        self.memories_by_type.pop(memory_type, None)
         
         if memory_type in self.locations:
             del self.locations[memory_type]
@@ -171,12 +197,10 @@ class Memory:
         Returns:
             Dictionary with memory summary
         """
-        memory_types = {}
-        for memory in self.memories:
-            memory_type = memory["type"]
-            if memory_type not in memory_types:
-                memory_types[memory_type] = 0
-            memory_types[memory_type] += 1
+        memory_types = {
+            memory_type: len(memories)
+            for memory_type, memories in self.memories_by_type.items()
+        }
         
         return {
             "total_memories": len(self.memories),
@@ -0,0 +1,275 @@
+import numpy as np
+from enum import IntEnum
+from typing import Dict, List, Optional, Union
+
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
+
+# Need columns, in NeedType.get_all_needs() order
+NUM_NEEDS = 5
+NEED_FOOD, NEED_WATER, NEED_REST, NEED_SHELTER, NEED_SOCIAL = range(NUM_NEEDS)
+
+# Inventory slots for the items every agent can carry
+NUM_ITEMS = 2
+ITEM_FOOD, ITEM_WATER = range(NUM_ITEMS)
+ITEM_NAMES = ("food", "water")
+
+# Rest recovered per hour while sleeping
+REST_RECOVERY_RATE = 10.0
+
+# Health change per update (one per tick): lost per critical need, regained when all needs are met
+HEALTH_LOSS_PER_CRITICAL_NEED = 0.5
+HEALTH_RECOVERY_RATE = 0.2
+
+# Default need decay rates in units per hour, one entry per need column
+DEFAULT_NEED_DECAY = (1.0, 2.0, 1.5, 0.5, 0.3)
+
+# Shared, read-only decay row broadcast against every population's needs matrix
+NEED_DECAY = np.array(DEFAULT_NEED_DECAY, dtype=np.float32)
+NEED_DECAY.flags.writeable = False
+
+class ActionType(IntEnum):
+    """Built-in agent actions; job actions are interned with codes after these"""
+    NONE = 0
+    WANDER = 1
+    GO_HOME = 2
+    FIND_FOOD = 3
+    FIND_WATER = 4
+    SLEEPING = 5
+    FIND_SHELTER = 6
+    SOCIALIZE = 7
+
+# Codes at or above this belong to job-specific actions
+BUILTIN_ACTION_COUNT = len(ActionType)
+
+# Interned action names, so current actions can be stored as small integer codes.
+# Built-in actions are registered first so their codes match ActionType.
+_ACTION_NAMES: List[Optional[str]] = [None] + [action.name.lower() for action in ActionType if action]
+_ACTION_CODES: Dict[Optional[str], int] = {name: code for code, name in enumerate(_ACTION_NAMES)}
+
+def intern_action(action: Union[str, int, None]) -> int:
+    """Get the integer code for an action name, registering it if new"""
+    if isinstance(action, int):
+        return int(action)  # Already a code (e.g. an ActionType)
+    
+    code = _ACTION_CODES.get(action)
+    if code is None:
+        code = len(_ACTION_NAMES)
+        _ACTION_NAMES.append(action)
+        _ACTION_CODES[action] = code
+    return code
+
+def action_name(code: int) -> Optional[str]:
+    """Get the action name for an integer action code"""
+    return _ACTION_NAMES[code]
+
+@njit(parallel=True, cache=True)
+def _update_health_kernel(needs, health):
+    """Apply need-driven health loss or recovery to every row"""
+    for i in prange(needs.shape[0]):
+        critical = 0
+        satisfied = True
+        for j in range(needs.shape[1]):
+            value = needs[i, j]
+            if value < 20.0:
+                critical += 1
+            if value <= 50.0:
+                satisfied = False
+
+        if critical > 0:
+            health[i] = max(0.0, health[i] - HEALTH_LOSS_PER_CRITICAL_NEED * critical)
+        elif health[i] < 100.0 and satisfied:
+            health[i] = min(100.0, health[i] + HEALTH_RECOVERY_RATE)
+
+class Population:
+    """
+    Structure-of-Arrays storage for per-agent state.
+    Each agent owns one row, addressed by its integer index, so village-wide
+    updates can run as array operations instead of per-agent dict lookups.
+    """
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty population.
+
+        Args:
+            capacity: Number of rows to preallocate (grows automatically)
+        """
+        capacity = max(1, capacity)
+        self.size = 0
+        self.agents: List = []  # Row index -> Agent
+
+        self.decay = NEED_DECAY
+        self.needs = np.full((capacity, NUM_NEEDS), 100.0, dtype=np.float32)
+        self.health = np.full(capacity, 100.0, dtype=np.float32)
+        self.inventory = np.zeros((capacity, NUM_ITEMS), dtype=np.float32)
+        self.positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.home_positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.has_home = np.zeros(capacity, dtype=bool)
+        self.actions = np.zeros(capacity, dtype=np.int16)
+        self.action_progress = np.zeros(capacity, dtype=np.float32)
+        self.wander_deltas = np.zeros((capacity, 2), dtype=np.int8)  # Drawn once per tick
+        self.home_deltas = np.zeros((capacity, 2), dtype=np.int8)  # Step toward home, per tick
+        self.deltas_tick = -1  # Tick the delta columns were filled for (-1: never)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self, capacity: int):
+        """Reallocate all arrays to hold at least `capacity` rows"""
+        def grown(array, fill):
+            new_array = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            new_array[:self.size] = array[:self.size]
+            return new_array
+
+        self.needs = grown(self.needs, 100.0)
+        self.health = grown(self.health, 100.0)
+        self.inventory = grown(self.inventory, 0.0)
+        self.positions = grown(self.positions, 0)
+        self.home_positions = grown(self.home_positions, 0)
+        self.has_home = grown(self.has_home, False)
+        self.actions = grown(self.actions, 0)
+        self.action_progress = grown(self.action_progress, 0.0)
+        self.wander_deltas = grown(self.wander_deltas, 0)
+        self.home_deltas = grown(self.home_deltas, 0)
+
+    def allocate(self, agent) -> int:
+        """
+        Reserve a row for an agent, initialized to default values.
+
+        Args:
+            agent: The agent that will own the row
+
+        Returns:
+            Index of the new row
+        """
+        if self.size == len(self.health):
+            self._grow(2 * len(self.health))
+
+        idx = self.size
+        self.size += 1
+        self.agents.append(agent)
+
+        self.needs[idx] = 100.0
+        self.health[idx] = 100.0
+        self.inventory[idx] = 0.0
+        self.positions[idx] = 0
+        self.home_positions[idx] = 0
+        self.has_home[idx] = False
+        self.actions[idx] = 0
+        self.action_progress[idx] = 0.0
+        self.wander_deltas[idx] = 0
+        self.home_deltas[idx] = 0
+        return idx
+
+    def release(self, idx: int):
+        """
+        Free a row by moving the last row into its place.
+
+        Args:
+            idx: Index of the row to free
+        """
+        last = self.size - 1
+        if idx != last:
+            self._copy_row(self, last, idx)
+            moved = self.agents[last]
+            self.agents[idx] = moved
+            moved.idx = idx
+
+        self.agents.pop()
+        self.size -= 1
+
+    def adopt(self, agent):
+        """
+        Move an agent's state from its current population into this one.
+
+        Args:
+            agent: The agent to adopt
+        """
+        old_population, old_idx = agent.population, agent.idx
+        if old_population is self:
+            return
+
+        idx = self.allocate(agent)
+        self._copy_row(old_population, old_idx, idx)
+        old_population.release(old_idx)
+
+        agent.population = self
+        agent.idx = idx
+
+    def _copy_row(self, source: "Population", src_idx: int, dst_idx: int):
+        """Copy one row of state from `source` into this population"""
+        self.needs[dst_idx] = source.needs[src_idx]
+        self.health[dst_idx] = source.health[src_idx]
+        self.inventory[dst_idx] = source.inventory[src_idx]
+        self.positions[dst_idx] = source.positions[src_idx]
+        self.home_positions[dst_idx] = source.home_positions[src_idx]
+        self.has_home[dst_idx] = source.has_home[src_idx]
+        self.actions[dst_idx] = source.actions[src_idx]
+        self.action_progress[dst_idx] = source.action_progress[src_idx]
+        self.wander_deltas[dst_idx] = source.wander_deltas[src_idx]
+        self.home_deltas[dst_idx] = source.home_deltas[src_idx]
+
+    def draw_wander_deltas(self, rng: np.random.Generator, tick: int):
+        """
+        Draw this tick's random (dx, dy) wander steps for every agent in one call.
+
+        Args:
+            rng: Random generator to draw from
+            tick: Current tick, recorded so agents can tell the batch is fresh
+        """
+        n = self.size
+        self.wander_deltas[:n] = rng.integers(-1, 2, size=(n, 2), dtype=np.int8)
+        self.deltas_tick = tick
+
+    def compute_home_deltas(self, tick: int):
+        """
+        Compute every agent's single-cell step toward home in one branchless pass.
+
+        Args:
+            tick: Current tick, recorded so agents can tell the batch is fresh
+        """
+        n = self.size
+        self.home_deltas[:n] = np.sign(self.home_positions[:n] - self.positions[:n])
+        self.deltas_tick = tick
+
+    def step(self, hours: float, resting: Optional[np.ndarray] = None,
+             sheltered: Optional[np.ndarray] = None):
+        """
+        Decay every agent's needs in one vectorized pass.
+
+        Args:
+            hours: In-game hours elapsed
+            resting: Optional boolean mask of agents recovering rest instead of losing it
+            sheltered: Optional boolean mask of agents whose shelter need does not decay
+        """
+        needs = self.needs[:self.size]
+        delta = np.broadcast_to(self.decay * -hours, needs.shape).copy()
+
+        if resting is not None:
+            delta[resting, NEED_REST] = REST_RECOVERY_RATE * hours
+        if sheltered is not None:
+            delta[sheltered, NEED_SHELTER] = 0.0
+
+        needs += delta
+        np.clip(needs, 0.0, 100.0, out=needs)
+
+    def update_health(self):
+        """
+        Update every agent's health from their current needs, once per tick.
+        Each critically low need (< 20) costs health; if all needs are
+        moderately satisfied (> 50), health slowly recovers.
+        """
+        n = self.size
+        if NUMBA_AVAILABLE:
+            _update_health_kernel(self.needs[:n], self.health[:n])
+            return
+        
+        # Without Numba the kernel is a plain Python loop; use branchless masks instead
+        needs = self.needs[:n]
+        health = self.health[:n]
+        critical = (needs < 20.0).sum(axis=1, dtype=np.int8)
+        recovering = (critical == 0) & (needs > 50.0).all(axis=1) & (health < 100.0)
+        
+        health -= HEALTH_LOSS_PER_CRITICAL_NEED * critical
+        health += HEALTH_RECOVERY_RATE * recovering
+        np.clip(health, 0.0, 100.0, out=health)
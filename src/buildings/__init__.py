@@ -1,4 +1,4 @@
 from src.buildings.building import Building
-from src.buildings.house import House
+from src.buildings.house import House, HouseManager
 
 # Import other building types as they are implemented 
\ No newline at end of file
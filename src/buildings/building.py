@@ -1,8 +1,75 @@
+import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 import pygame
 from abc import ABC, abstractmethod
 
 from src.utils.config import Config
+from src.utils.resource_types import ResourceType
+
+# Building colors by type
+BUILDING_COLORS = {
+    'house': (150, 75, 0),     # Brown
+    'farm': (210, 180, 140),   # Tan
+    'mine': (169, 169, 169),   # Gray
+    'workshop': (139, 69, 19), # Saddle brown
+    'market': (255, 215, 0),   # Gold
+    'storage': (160, 82, 45)   # Sienna
+}
+DEFAULT_BUILDING_COLOR = (100, 100, 100)
+
+# Buildings in poor condition (below this) are drawn darker
+POOR_CONDITION = 50
+
+# Per-building resource amounts are arrays indexed by ResourceType value (slot 0 unused)
+RESOURCE_SLOTS = max(t.value for t in ResourceType) + 1
+_SLOT_NAMES = [None] * RESOURCE_SLOTS
+for _resource_type in ResourceType:
+    _SLOT_NAMES[_resource_type.value] = _resource_type.name
+
+# Resource type name (e.g. "WOOD") or ResourceType -> array slot
+_RESOURCE_SLOT = {t.name: t.value for t in ResourceType}
+_RESOURCE_SLOT.update({t: t.value for t in ResourceType})
+
+def resource_slot(resource_type) -> int:
+    """Get the array slot for a resource type name or ResourceType, or -1 if unknown"""
+    return _RESOURCE_SLOT.get(resource_type, -1)
+
+def resource_array(amounts: Dict[str, float]) -> np.ndarray:
+    """Build a per-resource-type amount array from a name -> amount dict (KeyError on unknown names)"""
+    array = np.zeros(RESOURCE_SLOTS, dtype=np.float32)
+    for resource_type, amount in amounts.items():
+        slot = resource_slot(resource_type)
+        if slot < 0:
+            raise KeyError(f"Unknown resource type: {resource_type!r}")
+        array[slot] = amount
+    return array
+
+def resource_dict(array: np.ndarray) -> Dict[str, float]:
+    """Get the positive entries of a per-resource-type amount array as a name -> amount dict"""
+    return {_SLOT_NAMES[slot]: float(array[slot]) for slot in np.flatnonzero(array > 0).tolist()}
+
+# Building state flags, kept current so entry checks are a couple of bit tests
+BUILDING_COMPLETE = 1  # Construction finished
+BUILDING_FULL = 2  # At capacity: only the owner may enter
+
+# Occupant slots preallocated per building (grows for unlimited-capacity buildings)
+MIN_OCCUPANT_SLOTS = 8
+
+def _shade(color: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
+    """Scale a color, truncating to ints as pygame does"""
+    return tuple(int(c * factor) for c in color)
+
+# Per-color render variants, built once per color: (under construction, shades by whole condition point)
+_COLOR_VARIANTS: Dict[Tuple[int, int, int], Tuple[Tuple, List[Tuple]]] = {}
+
+def _get_color_variants(color: Tuple[int, int, int]) -> Tuple[Tuple, List[Tuple]]:
+    """Get the precomputed render colors for a base building color"""
+    variants = _COLOR_VARIANTS.get(color)
+    if variants is None:
+        under_construction = _shade(color, 0.7)  # Desaturated
+        by_condition = [_shade(color, 0.5 + 0.5 * condition / 100) for condition in range(POOR_CONDITION)]
+        variants = _COLOR_VARIANTS[color] = (under_construction, by_condition)
+    return variants
 
 class Building(ABC):
     """
@@ -10,6 +77,15 @@ class Building(ABC):
     Buildings provide functionality and shelter for agents.
     """
     
+    __slots__ = (
+        "config", "building_type", "position", "condition", "_capacity",
+        "_occupants", "_n_occupants", "owner", "_construction_progress", "_state_flags",
+        "resources_stored", "_other_resources", "properties", "_base_color", "_color_variants",
+    )
+    
+    # Pixel size of a cell when rendering
+    cell_size = 20  # Placeholder
+    
     def __init__(self, config: Config, building_type: str, position: Tuple[int, int]):
         """
         Initialize a building.
@@ -22,15 +98,23 @@ class Building(ABC):
         self.config = config
         self.building_type = building_type
         self.position = position
+        self._state_flags = 0  # BUILDING_* bits, maintained by the setters below
         self.condition = 100.0  # Building condition (0-100)
+        # Integer uids of agents currently in this building, in the first _n_occupants slots
+        self._occupants = np.full(MIN_OCCUPANT_SLOTS, -1, dtype=np.int64)
+        self._n_occupants = 0
         self.capacity = 0  # How many agents can use this building
-        self.occupants = []  # List of agent IDs currently in this building
         self.owner = None  # ID of the owner, if any
         self.construction_progress = 1.0  # 0.0-1.0, 1.0 means complete
-        self.resources_stored = {}  # Resources stored in this building
+        self.resources_stored = np.zeros(RESOURCE_SLOTS, dtype=np.float32)  # Amount stored, by resource slot
+        self._other_resources: Dict[Any, float] = {}  # Stored items that are not resource types
         
         # Building-specific properties
         self.properties = {}
+        
+        # Render colors, resolved once from the (fixed) building type
+        self._base_color = BUILDING_COLORS.get(building_type, DEFAULT_BUILDING_COLOR)
+        self._color_variants = _get_color_variants(self._base_color)
     
     @abstractmethod
     def update(self, world):
@@ -42,9 +126,36 @@ class Building(ABC):
         """
         pass
     
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+    
+    @capacity.setter
+    def capacity(self, value: int):
+        self._capacity = value
+        self._update_full_flag()
+    
+    @property
+    def construction_progress(self) -> float:
+        return self._construction_progress
+    
+    @construction_progress.setter
+    def construction_progress(self, value: float):
+        self._construction_progress = value
+        self._update_complete_flag(value)
+    
+    def _update_complete_flag(self, progress: float):
+        """Set the BUILDING_COMPLETE bit from construction progress"""
+        self._state_flags = (self._state_flags & ~BUILDING_COMPLETE) | int(progress >= 1.0)
+    
+    def _update_full_flag(self):
+        """Set the BUILDING_FULL bit from occupancy and capacity (0 = unlimited)"""
+        full = self._capacity > 0 and self._n_occupants >= self._capacity
+        self._state_flags = (self._state_flags & ~BUILDING_FULL) | (int(full) << 1)
+    
     def is_complete(self) -> bool:
         """Check if construction is complete"""
-        return self.construction_progress >= 1.0
+        return bool(self._state_flags & BUILDING_COMPLETE)
     
     def get_remaining_construction_materials(self) -> Dict[str, float]:
         """
@@ -73,6 +184,20 @@ class Building(ABC):
         # This would be implemented by specific building types
         return 0.0
     
+    @property
+    def occupants(self) -> List[int]:
+        """Integer uids of the agents currently in this building"""
+        return self._occupants[:self._n_occupants].tolist()
+    
+    def is_occupant(self, agent) -> bool:
+        """Check if an agent is currently in this building"""
+        return bool((self._occupants[:self._n_occupants] == agent.uid).any())
+    
+    def _find_occupant(self, uid: int) -> int:
+        """Get the slot holding an occupant uid, or -1 if absent"""
+        slots = np.flatnonzero(self._occupants[:self._n_occupants] == uid)
+        return int(slots[0]) if len(slots) else -1
+    
     def can_enter(self, agent) -> bool:
         """
         Check if an agent can enter this building.
@@ -83,16 +208,11 @@ class Building(ABC):
         Returns:
             True if agent can enter, False otherwise
         """
-        # Check if building is complete
-        if not self.is_complete():
-            return False
-            
-        # Check if at capacity
-        if self.capacity > 0 and len(self.occupants) >= self.capacity:
-            # At capacity, only owner can enter
-            return self.owner == agent.id
-            
-        return True
+        # Must be complete; at capacity, only the owner can enter
+        flags = self._state_flags
+        if flags == BUILDING_COMPLETE:
+            return True
+        return flags == BUILDING_COMPLETE | BUILDING_FULL and self.owner == agent.id
     
     def enter(self, agent) -> bool:
         """
@@ -107,8 +227,14 @@ class Building(ABC):
         if not self.can_enter(agent):
             return False
             
-        if agent.id not in self.occupants:
-            self.occupants.append(agent.id)
+        if self._find_occupant(agent.uid) < 0:
+            n = self._n_occupants
+            if n == len(self._occupants):
+                # Only buildings with unlimited capacity can outgrow their slots
+                self._occupants = np.concatenate((self._occupants, np.full(n, -1, dtype=np.int64)))
+            self._occupants[n] = agent.uid
+            self._n_occupants = n + 1
+            self._update_full_flag()
         
         return True
     
@@ -122,25 +248,37 @@ class Building(ABC):
         Returns:
             True if successful, False otherwise
         """
-        if agent.id in self.occupants:
-            self.occupants.remove(agent.id)
-            return True
+        slot = self._find_occupant(agent.uid)
+        if slot < 0:
+            return False
         
-        return False
+        # Swap the last occupant into the freed slot instead of shifting
+        last = self._n_occupants - 1
+        self._occupants[slot] = self._occupants[last]
+        self._occupants[last] = -1
+        self._n_occupants = last
+        self._update_full_flag()
+        return True
     
     def store_resource(self, resource_type: str, amount: float) -> float:
         """
         Store a resource in this building.
+        Resource types go in the slot array; any other key is kept in a plain dict.
         
         Args:
-            resource_type: Type of resource
+            resource_type: Type of resource (name or ResourceType), or any other item key
             amount: Amount to store
             
         Returns:
             Amount actually stored
         """
+        slot = resource_slot(resource_type)
+        if slot < 0:
+            self._other_resources[resource_type] = self._other_resources.get(resource_type, 0) + amount
+            return amount
+        
         # Implement storage capacity logic here
-        self.resources_stored[resource_type] = self.resources_stored.get(resource_type, 0) + amount
+        self.resources_stored[slot] += amount
         return amount
     
     def retrieve_resource(self, resource_type: str, amount: float) -> float:
@@ -148,29 +286,43 @@ class Building(ABC):
         Retrieve a resource from this building.
         
         Args:
-            resource_type: Type of resource
+            resource_type: Type of resource (name or ResourceType), or any other item key
             amount: Amount to retrieve
             
         Returns:
             Amount actually retrieved
         """
-        if resource_type not in self.resources_stored:
+        slot = resource_slot(resource_type)
+        if slot < 0:
+            return self._retrieve_other(resource_type, amount)
+        
+        available = float(self.resources_stored[slot])
+        if available <= 0:
             return 0.0
-            
-        available = self.resources_stored[resource_type]
+        
         retrievable = min(amount, available)
+        self.resources_stored[slot] = max(0.0, available - retrievable)
+        return retrievable
+    
+    def _retrieve_other(self, key, amount: float) -> float:
+        """Retrieve an item that is not a resource type from the overflow dict"""
+        if key not in self._other_resources:
+            return 0.0
         
-        self.resources_stored[resource_type] -= retrievable
+        available = self._other_resources[key]
+        retrievable = min(amount, available)
+        self._other_resources[key] -= retrievable
         
         # Remove from storage if depleted
-        if self.resources_stored[resource_type] <= 0:
-            del self.resources_stored[resource_type]
-            
+        if self._other_resources[key] <= 0:
+            del self._other_resources[key]
         return retrievable
     
     def get_stored_resources(self) -> Dict[str, float]:
         """Get all stored resources"""
-        return self.resources_stored.copy()
+        stored = resource_dict(self.resources_stored)
+        stored.update(self._other_resources)
+        return stored
     
     def deteriorate(self, amount: float):
         """
@@ -200,28 +352,17 @@ class Building(ABC):
         # Get building position
         x, y = self.position
         
-        # Get cell size (assuming it's calculated elsewhere)
-        cell_size = 20  # Placeholder
-        
-        # Determine building color based on type
-        color_map = {
-            'house': (150, 75, 0),     # Brown
-            'farm': (210, 180, 140),   # Tan
-            'mine': (169, 169, 169),   # Gray
-            'workshop': (139, 69, 19), # Saddle brown
-            'market': (255, 215, 0),   # Gold
-            'storage': (160, 82, 45)   # Sienna
-        }
-        
-        color = color_map.get(self.building_type, (100, 100, 100))
+        cell_size = self.cell_size
         
         # Adjust color based on condition and construction progress
         if not self.is_complete():
             # Under construction - desaturate
-            color = tuple(c * 0.7 for c in color)
-        elif self.condition < 50:
-            # Poor condition - darken
-            color = tuple(c * (0.5 + 0.5 * self.condition / 100) for c in color)
+            color = self._color_variants[0]
+        elif self.condition < POOR_CONDITION:
+            # Poor condition - darken (shade precomputed per whole condition point)
+            color = self._color_variants[1][int(self.condition)]
+        else:
+            color = self._base_color
         
         # Draw building
         pygame.draw.rect(
@@ -1,15 +1,143 @@
+import numpy as np
 from typing import Dict, List, Tuple, Optional
-import random
 
-from src.buildings.building import Building
+from src.buildings.building import Building, RESOURCE_SLOTS, resource_slot, resource_array, resource_dict
 from src.utils.config import Config
+from src.utils.rng import shared_rng
+
+# Condition lost per tick by weather, indexed by weather id (see time_system.WEATHER_TYPES)
+DETERIORATION_BY_WEATHER = (
+    0.01,  # clear
+    0.03,  # rain
+    0.01,  # fog
+    0.05,  # storm
+    0.02,  # snow
+)
+
+# Deterioration multiplier by season, indexed by season id (see time_system.SEASONS)
+DETERIORATION_SEASON_MODIFIERS = (
+    1.0,  # spring
+    0.8,  # summer
+    1.2,  # autumn
+    1.5,  # winter
+)
+
+def get_deterioration_rate(time_system) -> float:
+    """Get this tick's base deterioration from the weather and season"""
+    return (DETERIORATION_BY_WEATHER[time_system.get_weather_id()]
+            * DETERIORATION_SEASON_MODIFIERS[time_system.get_season_id()])
+
+class HouseManager:
+    """
+    Structure-of-Arrays storage for house state.
+    Each house owns one row, so per-house state for the whole village sits in
+    a few contiguous arrays.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty house manager.
+        
+        Args:
+            capacity: Number of rows to preallocate (grows automatically)
+        """
+        capacity = max(1, capacity)
+        self.size = 0
+        self.houses: List["House"] = []  # Row index -> House
+        
+        self.condition = np.zeros(capacity, dtype=np.float64)
+        self.insulation = np.zeros(capacity, dtype=np.float64)
+        self.construction_progress = np.zeros(capacity, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _grow(self, capacity: int):
+        """Reallocate all arrays to hold at least `capacity` rows"""
+        def grown(array):
+            new_array = np.zeros(capacity, dtype=array.dtype)
+            new_array[:self.size] = array[:self.size]
+            return new_array
+        
+        self.condition = grown(self.condition)
+        self.insulation = grown(self.insulation)
+        self.construction_progress = grown(self.construction_progress)
+    
+    def allocate(self, house: "House") -> int:
+        """
+        Reserve a zeroed row for a house.
+        
+        Args:
+            house: The house that will own the row
+            
+        Returns:
+            Index of the new row
+        """
+        if self.size == len(self.condition):
+            self._grow(2 * len(self.condition))
+        
+        idx = self.size
+        self.size += 1
+        self.houses.append(house)
+        
+        self.condition[idx] = 0.0
+        self.insulation[idx] = 0.0
+        self.construction_progress[idx] = 0.0
+        return idx
+    
+    def release(self, idx: int):
+        """
+        Free a row by moving the last row into its place.
+        
+        Args:
+            idx: Index of the row to free
+        """
+        last = self.size - 1
+        if idx != last:
+            self._copy_row(self, last, idx)
+            moved = self.houses[last]
+            self.houses[idx] = moved
+            moved._idx = idx
+        
+        self.houses.pop()
+        self.size -= 1
+    
+    def adopt(self, house: "House"):
+        """
+        Move a house's state from its current manager into this one.
+        
+        Args:
+            house: The house to adopt
+        """
+        old_manager, old_idx = house._manager, house._idx
+        if old_manager is self:
+            return
+        
+        idx = self.allocate(house)
+        self._copy_row(old_manager, old_idx, idx)
+        old_manager.release(old_idx)
+        
+        house._manager = self
+        house._idx = idx
+    
+    def _copy_row(self, source: "HouseManager", src_idx: int, dst_idx: int):
+        """Copy one row of state from `source` into this manager"""
+        self.condition[dst_idx] = source.condition[src_idx]
+        self.insulation[dst_idx] = source.insulation[src_idx]
+        self.construction_progress[dst_idx] = source.construction_progress[src_idx]
 
 class House(Building):
     """
     A house provides shelter for agents, allowing them to rest and store their belongings.
+    Condition, insulation and construction progress live in a HouseManager row.
     """
     
-    def __init__(self, config: Config, position: Tuple[int, int], owner_id: Optional[str] = None):
+    # condition, insulation and construction_progress are HouseManager-backed properties here
+    __slots__ = ("_manager", "_idx", "construction_materials", "materials_provided",
+                 "_total_required", "_total_provided")
+    
+    def __init__(self, config: Config, position: Tuple[int, int], owner_id: Optional[str] = None,
+                 manager: Optional[HouseManager] = None, rng: Optional[np.random.Generator] = None):
         """
         Initialize a house.
         
@@ -17,29 +145,40 @@ class House(Building):
             config: Configuration object
             position: (x, y) position in the world
             owner_id: ID of the owner, if any
+            manager: House manager to store the house's state in; a private one is
+                created if not provided (the world adopts the house when it is added)
+            rng: Random generator for the house's properties (e.g. world.rng);
+                the shared generator is used if not provided
         """
+        # The row must exist before Building.__init__ sets condition and progress
+        self._manager = manager if manager is not None else HouseManager(capacity=1)
+        self._idx = self._manager.allocate(self)
+        
         super().__init__(config, "house", position)
         
         self.owner = owner_id
         self.capacity = 4  # A house can accommodate up to 4 agents
         
-        # House-specific properties
+        # House-specific properties, drawn in one call
+        comfort, security, insulation = (rng or shared_rng()).uniform(0.5, 1.0, 3).tolist()
         self.properties = {
-            "comfort": random.uniform(0.5, 1.0),  # Affects rest quality
-            "security": random.uniform(0.5, 1.0),  # Affects storage security
-            "insulation": random.uniform(0.5, 1.0),  # Affects temperature regulation
+            "comfort": comfort,  # Affects rest quality
+            "security": security,  # Affects storage security
         }
+        self.insulation = insulation  # Affects temperature regulation (HouseManager-backed)
         
         # Construction requirements if not complete
         self.construction_progress = 0.0  # Start as incomplete
-        self.construction_materials = {
+        # (amount arrays indexed by resource slot)
+        self.construction_materials = resource_array({
             "WOOD": 50.0,
             "STONE": 20.0
-        }
-        self.materials_provided = {
-            "WOOD": 0.0,
-            "STONE": 0.0
-        }
+        })
+        self.materials_provided = np.zeros(RESOURCE_SLOTS, dtype=np.float32)
+        
+        # Running totals, so progress doesn't re-sum both arrays on every delivery
+        self._total_required = float(self.construction_materials.sum())
+        self._total_provided = 0.0
     
     def update(self, world):
         """
@@ -48,34 +187,11 @@ class House(Building):
         Args:
             world: Reference to the world
         """
-        # Weather affects condition
-        weather = world.time_system.get_weather()
-        season = world.time_system.get_season()
-        
-        # Deterioration based on weather conditions
-        deterioration_rates = {
-            "clear": 0.01,
-            "rain": 0.03,
-            "fog": 0.01,
-            "storm": 0.05,
-            "snow": 0.02
-        }
-        
-        # Season modifiers
-        season_modifiers = {
-            "spring": 1.0,
-            "summer": 0.8,
-            "autumn": 1.2,
-            "winter": 1.5
-        }
-        
-        # Apply deterioration
-        base_rate = deterioration_rates.get(weather, 0.01)
-        season_mod = season_modifiers.get(season, 1.0)
-        deterioration = base_rate * season_mod
+        # Weather and season affect condition
+        deterioration = get_deterioration_rate(world.time_system)
         
         # Better insulation reduces deterioration
-        insulation_effect = 1.0 - (self.properties["insulation"] * 0.5)
+        insulation_effect = 1.0 - (self.insulation * 0.5)
         deterioration *= insulation_effect
         
         self.deteriorate(deterioration)
@@ -84,6 +200,35 @@ class House(Building):
         # (In a real implementation, we would update agent rest here,
         # but for simplicity we have this logic in the agent class)
     
+    def detach(self):
+        """Move the house's state into a private one-row manager, as before it was added to a world"""
+        HouseManager(capacity=1).adopt(self)
+    
+    @property
+    def condition(self) -> float:
+        return float(self._manager.condition[self._idx])
+    
+    @condition.setter
+    def condition(self, value: float):
+        self._manager.condition[self._idx] = value
+    
+    @property
+    def insulation(self) -> float:
+        return float(self._manager.insulation[self._idx])
+    
+    @insulation.setter
+    def insulation(self, value: float):
+        self._manager.insulation[self._idx] = value
+    
+    @property
+    def construction_progress(self) -> float:
+        return float(self._manager.construction_progress[self._idx])
+    
+    @construction_progress.setter
+    def construction_progress(self, value: float):
+        self._manager.construction_progress[self._idx] = value
+        self._update_complete_flag(value)
+    
     def get_rest_quality(self) -> float:
         """
         Get the quality of rest provided by this house.
@@ -105,7 +250,7 @@ class House(Building):
             Shelter quality factor (0-1)
         """
         # Insulation and condition affect shelter quality
-        base_quality = self.properties["insulation"]
+        base_quality = self.insulation
         condition_factor = self.condition / 100.0
         
         return base_quality * condition_factor
@@ -130,13 +275,7 @@ class House(Building):
         if self.is_complete():
             return {}
         
-        remaining = {}
-        for material, required in self.construction_materials.items():
-            provided = self.materials_provided.get(material, 0.0)
-            if provided < required:
-                remaining[material] = required - provided
-                
-        return remaining
+        return resource_dict(self.construction_materials - self.materials_provided)
     
     def add_construction_materials(self, resource_type: str, amount: float) -> float:
         """
@@ -152,21 +291,21 @@ class House(Building):
         if self.is_complete():
             return 0.0
         
-        if resource_type not in self.construction_materials:
+        slot = resource_slot(resource_type)
+        if slot < 0:
             return 0.0
             
-        required = self.construction_materials[resource_type]
-        provided = self.materials_provided.get(resource_type, 0.0)
+        required = float(self.construction_materials[slot])
+        provided = float(self.materials_provided[slot])
         
         if provided >= required:
-            return 0.0  # Already have enough of this material
+            return 0.0  # Already have enough of this material (or it isn't needed)
             
         usable = min(amount, required - provided)
-        self.materials_provided[resource_type] = provided + usable
+        self.materials_provided[slot] = provided + usable
         
         # Update construction progress
-        total_required = sum(self.construction_materials.values())
-        total_provided = sum(self.materials_provided.values())
-        self.construction_progress = min(1.0, total_provided / total_required)
+        self._total_provided += usable
+        self.construction_progress = min(1.0, self._total_provided / self._total_required)
         
         return usable 
\ No newline at end of file
@@ -1,87 +1,469 @@
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence
 import pygame
 import random
-from enum import Enum, auto
 
 from src.utils.config import Config
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
 from src.environment.time_system import TimeSystem
+from src.utils.resource_types import (
+    ResourceType, RAW_RESOURCES, PROCESSED_RESOURCES, CRAFTED_ITEMS, RESOURCE_COLORS,
+    UNKNOWN_RESOURCE_COLOR, NUM_TYPE_IDS, TYPES_BY_ID, TYPE_IS_FOOD, TYPE_IS_WATER,
+    TYPE_IS_TREE, _COLOR_TUPLES, _COLOR_LUT
+)
 
-class ResourceType(Enum):
-    """Enumeration of different resource types in the world"""
-    WOOD = auto()       # Processed wood
-    STONE = auto()      # Stone resource
-    IRON = auto()       # Iron ore (deprecated, use IRON_ORE)
-    FOOD_BERRY = auto() # Berry bush
-    FOOD_FISH = auto()  # Fish in water
-    FOOD_WHEAT = auto() # Wheat crops
-    WATER = auto()      # Water source
-    CLAY = auto()       # Clay for pottery/building
-    TREE = auto()       # Trees for wood harvesting
-    STONE_BLOCK = auto() # Processed stone for building
-    IRON_ORE = auto()   # Raw iron ore
-    IRON_INGOT = auto() # Processed iron
-    HERB = auto()       # Medicinal herb
-    BASIC_TOOLS = auto() # Basic tools for various jobs
-    WEAPONS = auto()    # Weapons for defense
-    ADVANCED_TOOLS = auto() # Advanced tools for specialized jobs
-    POTION = auto()     # Healing potion
+DEPLETED_COLOR = (100, 100, 100)  # Gray for depleted resources
+TRUNK_COLOR = (139, 69, 19)  # Brown
+
+# Cell-relative drawing offsets, by cell size: (trunk rect, foliage center, circle center)
+_CELL_GEOMETRY: Dict[int, Tuple[Tuple[int, int, int, int], Tuple[int, int], int]] = {}
+
+def _get_cell_geometry(cell_size: int) -> Tuple[Tuple[int, int, int, int], Tuple[int, int], int]:
+    """Get the (memoized) drawing offsets within a cell for a cell size"""
+    geometry = _CELL_GEOMETRY.get(cell_size)
+    if geometry is None:
+        trunk = (cell_size // 3, cell_size // 2, cell_size // 3, cell_size // 2)
+        foliage_center = (cell_size // 2, cell_size // 3)
+        geometry = _CELL_GEOMETRY[cell_size] = (trunk, foliage_center, cell_size // 2)
+    return geometry
+
+# Returned for cells without resources (shared, so lookups don't allocate)
+_NO_RESOURCES: Tuple = ()
+
+# Regrowth multiplier by season, indexed by season id (see time_system.SEASONS)
+REGROWTH_SEASON_MODIFIERS = (
+    1.5,  # spring: fastest regrowth
+    1.2,  # summer: also good for growth
+    0.8,  # autumn: slower growth
+    0.3,  # winter: very slow growth
+)
+
+# Chance per tick that a depleted resource starts regrowing, and the fraction it restarts at
+UNDEPLETE_CHANCE = 0.05
+UNDEPLETE_FILL = 0.1
+
+@njit(cache=True)
+def _cluster_kernel(center_x, center_y, cluster_size, density, base_max_quantity,
+                    width, height, rolls, fills):
+    """
+    Pick the cells of one resource cluster and their quantities.
     
-    @classmethod
-    def get_color(cls, resource_type):
-        """Get color for visualization purposes"""
-        colors = {
-            cls.WOOD: (139, 69, 19),      # Brown
-            cls.STONE: (169, 169, 169),   # Grey
-            cls.IRON: (105, 105, 105),    # Dark Grey
-            cls.FOOD_BERRY: (255, 0, 0),  # Red
-            cls.FOOD_FISH: (70, 130, 180), # Steel Blue
-            cls.FOOD_WHEAT: (218, 165, 32), # Golden
-            cls.WATER: (0, 0, 255),       # Blue
-            cls.CLAY: (205, 133, 63),     # Peru
-            cls.TREE: (34, 139, 34),      # Forest Green
-            cls.STONE_BLOCK: (192, 192, 192), # Silver
-            cls.IRON_ORE: (94, 94, 94),   # Dark Grey
-            cls.IRON_INGOT: (211, 211, 211), # Light Grey
-            cls.HERB: (124, 252, 0),      # Lawn Green
-            cls.BASIC_TOOLS: (160, 82, 45),  # Sienna
-            cls.WEAPONS: (178, 34, 34),     # Firebrick
-            cls.ADVANCED_TOOLS: (85, 107, 47), # Dark Olive Green
-            cls.POTION: (148, 0, 211),     # Dark Violet
-        }
-        return colors.get(resource_type, (0, 0, 0))
+    Args:
+        center_x, center_y: Cluster center
+        cluster_size: Cluster radius in cells
+        density: Placement chance at the center (falls off with distance)
+        base_max_quantity: Maximum quantity of a node at the center
+        width, height: World dimensions
+        rolls: Uniform [0, 1) placement rolls, one per cell of the (2r+1)^2 square
+        fills: Initial fill fractions, one per cell of the square
+        
+    Returns:
+        Tuple of (xs, ys, quantities, max_quantities) arrays for the placed nodes
+    """
+    side = 2 * cluster_size + 1
+    xs = np.empty(side * side, dtype=np.int32)
+    ys = np.empty(side * side, dtype=np.int32)
+    quantities = np.empty(side * side, dtype=np.float64)
+    max_quantities = np.empty(side * side, dtype=np.float64)
     
-    @classmethod
-    def is_raw_resource(cls, resource_type):
-        """Determine if a resource is a raw (natural) resource type"""
-        raw_resources = [
-            cls.TREE, cls.STONE, cls.IRON_ORE, cls.FOOD_BERRY,
-            cls.FOOD_FISH, cls.FOOD_WHEAT, cls.WATER, cls.CLAY,
-            cls.HERB
-        ]
-        return resource_type in raw_resources
+    count = 0
+    cell = 0
+    for dx in range(-cluster_size, cluster_size + 1):
+        for dy in range(-cluster_size, cluster_size + 1):
+            x, y = center_x + dx, center_y + dy
+            distance_factor = 1 - (abs(dx) + abs(dy)) / (2 * cluster_size)
+            
+            if 0 <= x < width and 0 <= y < height and rolls[cell] < density * distance_factor:
+                # Vary the quantity based on distance from center
+                max_quantity = base_max_quantity * (0.5 + 0.5 * distance_factor)
+                xs[count] = x
+                ys[count] = y
+                max_quantities[count] = max_quantity
+                quantities[count] = max_quantity * fills[cell]
+                count += 1
+            cell += 1
     
-    @classmethod
-    def is_processed_resource(cls, resource_type):
-        """Determine if a resource is a processed resource type"""
-        processed_resources = [
-            cls.WOOD, cls.STONE_BLOCK, cls.IRON_INGOT
-        ]
-        return resource_type in processed_resources
+    return xs[:count], ys[:count], quantities[:count], max_quantities[:count]
+
+def _cluster_cells_vectorized(center_x, center_y, cluster_size, density, base_max_quantity,
+                              width, height, rolls, fills):
+    """
+    NumPy version of _cluster_kernel, for when Numba isn't available.
+    Same arguments, results and cell order (dx-major), using whole-square masks.
+    """
+    offsets = np.arange(-cluster_size, cluster_size + 1)
+    dx, dy = np.meshgrid(offsets, offsets, indexing='ij')
+    dx, dy = dx.ravel(), dy.ravel()
+    x, y = center_x + dx, center_y + dy
+    distance_factor = 1 - (np.abs(dx) + np.abs(dy)) / (2 * cluster_size)
     
-    @classmethod
-    def is_crafted_item(cls, resource_type):
-        """Determine if a resource is a crafted item"""
-        crafted_items = [
-            cls.BASIC_TOOLS, cls.WEAPONS, cls.ADVANCED_TOOLS, cls.POTION
-        ]
-        return resource_type in crafted_items
+    keep = (x >= 0) & (x < width) & (y >= 0) & (y < height) & (rolls < density * distance_factor)
+    
+    # Vary the quantity based on distance from center
+    max_quantities = base_max_quantity * (0.5 + 0.5 * distance_factor[keep])
+    return (x[keep].astype(np.int32), y[keep].astype(np.int32),
+            max_quantities * fills[keep], max_quantities)
+
+# Explicit signature: compiled (or loaded from the disk cache) at import instead of on the first tick
+@njit("void(int32[::1], float32[::1], float32[::1], float32[::1], boolean[::1], float32[::1], "
+      "boolean[::1], float32, boolean[::1])", parallel=True, fastmath=True, cache=True)
+def _regrow_kernel(rows, quantity, max_quantity, regrowth_rate, depleted, fill, revive, growth, keep):
+    """
+    Regrow the work-list rows in place, refresh their fill fractions and flag
+    which still need work.
+    
+    Args:
+        rows: Work-list row indexes (unique)
+        quantity, max_quantity, regrowth_rate, depleted, fill: Table columns
+        revive: Whether each work-list row un-depletes this tick
+        growth: Hours passed times the season modifier (float32)
+        keep: Receives whether each row stays on the work list
+    """
+    undeplete_fill = np.float32(UNDEPLETE_FILL)
+    for k in prange(rows.shape[0]):
+        i = rows[k]
+        if depleted[i]:
+            if not revive[k]:
+                keep[k] = True
+                continue
+            depleted[i] = False
+            quantity[i] = max_quantity[i] * undeplete_fill
+        
+        q = quantity[i]
+        m = max_quantity[i]
+        if q < m:
+            q = min(q + regrowth_rate[i] * growth, m)
+            quantity[i] = q
+        fill[i] = q / m if m > 0 else np.float32(0.0)
+        keep[k] = q < m
+
+@njit(cache=True)
+def _extract_kernel(quantity, depleted, rows, amounts, out):
+    """
+    Extract amounts from table rows, depleting rows that run out.
+    
+    Args:
+        quantity, depleted: Table columns (updated in place)
+        rows: Row index of each request (a row may appear more than once)
+        amounts: Amount requested by each request
+        out: Receives the amount actually extracted by each request
+    """
+    for i in range(rows.shape[0]):
+        j = rows[i]
+        if depleted[j]:
+            out[i] = 0.0
+            continue
+        
+        take = min(amounts[i], quantity[j])
+        quantity[j] -= take
+        if quantity[j] <= 0.0:
+            depleted[j] = True
+            quantity[j] = 0.0
+        out[i] = take
+
+class ResourceTable:
+    """
+    Structure-of-Arrays storage for resource node state.
+    Each resource owns one row, addressed by its integer index, so regrowth
+    for the whole world runs as a few array operations. Only rows on the
+    work list (depleted or below maximum) are touched by regrowth.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize an empty table.
+        
+        Args:
+            capacity: Number of rows to preallocate (grows automatically)
+        """
+        capacity = max(1, capacity)
+        self.size = 0
+        self.resources: List["Resource"] = []  # Row index -> Resource
+        
+        self.quantity = np.zeros(capacity, dtype=np.float32)
+        self.max_quantity = np.zeros(capacity, dtype=np.float32)
+        self.regrowth_rate = np.zeros(capacity, dtype=np.float32)
+        self.depleted = np.zeros(capacity, dtype=bool)
+        self.positions = np.zeros((capacity, 2), dtype=np.int32)  # Fixed once placed
+        self.type_ids = np.zeros(capacity, dtype=np.uint8)  # ResourceType values (all < 256)
+        # quantity / max_quantity (0 when max is 0), refreshed wherever quantities change
+        # so rendering doesn't need its own pass over both columns
+        self.fill = np.zeros(capacity, dtype=np.float32)
+        
+        # Work list of rows that may need regrowth, plus rows marked since the last pass.
+        # Releases reorder rows, so they just flag the list for a rebuild.
+        self.in_worklist = np.zeros(capacity, dtype=bool)
+        self._worklist = np.zeros(0, dtype=np.int32)
+        self._pending: List[int] = []
+        self._worklist_stale = False
+        
+        # Bumped on every change to row state, so renders can tell when they're stale
+        self.version = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _grow(self, capacity: int):
+        """Reallocate all arrays to hold at least `capacity` rows"""
+        def grown(array):
+            new_array = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new_array[:self.size] = array[:self.size]
+            return new_array
+        
+        self.quantity = grown(self.quantity)
+        self.max_quantity = grown(self.max_quantity)
+        self.regrowth_rate = grown(self.regrowth_rate)
+        self.depleted = grown(self.depleted)
+        self.positions = grown(self.positions)
+        self.type_ids = grown(self.type_ids)
+        self.fill = grown(self.fill)
+        self.in_worklist = grown(self.in_worklist)
+    
+    def allocate(self, resource: "Resource") -> int:
+        """
+        Reserve a zeroed row for a resource.
+        
+        Args:
+            resource: The resource that will own the row
+            
+        Returns:
+            Index of the new row
+        """
+        if self.size == len(self.quantity):
+            self._grow(2 * len(self.quantity))
+        
+        idx = self.size
+        self.size += 1
+        self.resources.append(resource)
+        
+        self.quantity[idx] = 0.0
+        self.max_quantity[idx] = 0.0
+        self.regrowth_rate[idx] = 0.0
+        self.depleted[idx] = False
+        self.positions[idx] = 0
+        self.type_ids[idx] = 0
+        self.fill[idx] = 0.0
+        self.in_worklist[idx] = False
+        self.version += 1
+        return idx
+    
+    def reserve(self, capacity: int):
+        """
+        Make sure the table can hold `capacity` rows without further reallocation.
+        
+        Args:
+            capacity: Number of rows needed
+        """
+        if capacity > len(self.quantity):
+            self._grow(capacity)
+    
+    def add_rows(self, resource_type: "ResourceType", xs: np.ndarray, ys: np.ndarray,
+                 quantities: np.ndarray, max_quantities: np.ndarray,
+                 regrowth_rate: float) -> List["Resource"]:
+        """
+        Fill a block of new rows in one slice assignment per column and
+        create their Resource handles without going through Resource.__init__.
+        
+        Args:
+            resource_type: Type shared by every new resource
+            xs, ys: Positions of the new resources
+            quantities: Starting quantities
+            max_quantities: Maximum quantities
+            regrowth_rate: Regrowth rate shared by every new resource
+            
+        Returns:
+            The new resources, in row order
+        """
+        count = len(xs)
+        self.reserve(self.size + count)
+        start, end = self.size, self.size + count
+        
+        self.quantity[start:end] = quantities
+        self.max_quantity[start:end] = max_quantities
+        self.regrowth_rate[start:end] = regrowth_rate
+        self.depleted[start:end] = False
+        self.positions[start:end, 0] = xs
+        self.positions[start:end, 1] = ys
+        self.type_ids[start:end] = resource_type.value
+        self._update_fill(slice(start, end))
+        
+        # Rows below their maximum go on the regrowth work list
+        growing = self.quantity[start:end] < self.max_quantity[start:end]
+        self.in_worklist[start:end] = growing
+        self._pending.extend((np.flatnonzero(growing) + start).tolist())
+        
+        type_id = resource_type.value
+        is_food, is_water = bool(TYPE_IS_FOOD[type_id]), bool(TYPE_IS_WATER[type_id])
+        resources = [Resource._from_row(resource_type, (x, y), self, idx, is_food, is_water)
+                     for idx, x, y in zip(range(start, end), xs.tolist(), ys.tolist())]
+        self.resources.extend(resources)
+        self.size = end
+        self.version += 1
+        return resources
+    
+    def release(self, idx: int):
+        """
+        Free a row by moving the last row into its place.
+        
+        Args:
+            idx: Index of the row to free
+        """
+        last = self.size - 1
+        if idx != last:
+            self._copy_row(self, last, idx)
+            moved = self.resources[last]
+            self.resources[idx] = moved
+            moved._idx = idx
+        
+        self.resources.pop()
+        self.size -= 1
+        self._worklist_stale = True
+        self.version += 1
+    
+    def adopt(self, resource: "Resource"):
+        """
+        Move a resource's state from its current table into this one.
+        
+        Args:
+            resource: The resource to adopt
+        """
+        old_table, old_idx = resource._table, resource._idx
+        if old_table is self:
+            return
+        
+        idx = self.allocate(resource)
+        self._copy_row(old_table, old_idx, idx)
+        old_table.release(old_idx)
+        
+        resource._table = self
+        resource._idx = idx
+        self.mark_growing(idx)
+    
+    def _copy_row(self, source: "ResourceTable", src_idx: int, dst_idx: int):
+        """Copy one row of state from `source` into this table"""
+        self.quantity[dst_idx] = source.quantity[src_idx]
+        self.max_quantity[dst_idx] = source.max_quantity[src_idx]
+        self.regrowth_rate[dst_idx] = source.regrowth_rate[src_idx]
+        self.depleted[dst_idx] = source.depleted[src_idx]
+        self.positions[dst_idx] = source.positions[src_idx]
+        self.type_ids[dst_idx] = source.type_ids[src_idx]
+        self.fill[dst_idx] = source.fill[src_idx]
+    
+    def _update_fill(self, rows):
+        """Recompute the fill fraction for some rows (an index, slice or index array)"""
+        max_quantity = self.max_quantity[rows]
+        self.fill[rows] = np.divide(self.quantity[rows], max_quantity,
+                                    out=np.zeros_like(max_quantity), where=max_quantity > 0)
+    
+    def mark_growing(self, idx: int):
+        """
+        Put a row on the regrowth work list after its quantity or depletion changed.
+        
+        Args:
+            idx: Index of the changed row
+        """
+        self.version += 1
+        max_quantity = self.max_quantity[idx]
+        self.fill[idx] = self.quantity[idx] / max_quantity if max_quantity > 0 else 0.0
+        if not self.in_worklist[idx]:
+            self.in_worklist[idx] = True
+            self._pending.append(idx)
+    
+    def extract_bulk(self, rows: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+        """
+        Extract from many rows in one compiled pass, in request order.
+        
+        Args:
+            rows: Row index of each request
+            amounts: Amount requested by each request
+            
+        Returns:
+            Amount actually extracted by each request
+        """
+        rows = np.asarray(rows, dtype=np.int32)
+        out = np.zeros(rows.shape[0], dtype=np.float32)
+        _extract_kernel(self.quantity, self.depleted, rows,
+                        np.asarray(amounts, dtype=np.float32), out)
+        
+        for idx in np.unique(rows).tolist():
+            self.mark_growing(idx)
+        return out
+    
+    def _refresh_worklist(self) -> np.ndarray:
+        """Fold newly marked rows into the work list, rebuilding it after releases"""
+        if self._worklist_stale:
+            n = self.size
+            needs_work = self.depleted[:n] | (self.quantity[:n] < self.max_quantity[:n])
+            self.in_worklist[:n] = needs_work
+            self._worklist = np.flatnonzero(needs_work).astype(np.int32)
+            self._worklist_stale = False
+        elif self._pending:
+            self._worklist = np.concatenate((self._worklist, np.array(self._pending, dtype=np.int32)))
+        
+        self._pending.clear()
+        return self._worklist
+    
+    def regrow(self, delta_time: float, season_modifier: float, rng: np.random.Generator):
+        """
+        Regrow every resource on the work list in one vectorized pass.
+        Depleted resources have a small chance to start regrowing (at 10% fill),
+        then every non-depleted resource grows toward its maximum. Rows that
+        reach their maximum drop off the work list.
+        
+        Args:
+            delta_time: Time passed
+            season_modifier: Modifier based on current season
+            rng: Random generator for the un-deplete rolls
+        """
+        rows = self._refresh_worklist()
+        if not rows.size:
+            return
+        self.version += 1
+        
+        if NUMBA_AVAILABLE:
+            # Draw the un-deplete rolls for the depleted rows, then do the rest in one compiled pass
+            depleted_idx = np.flatnonzero(self.depleted[rows])
+            revive = np.zeros(rows.size, dtype=bool)
+            revive[depleted_idx] = rng.random(depleted_idx.size) < UNDEPLETE_CHANCE
+            
+            keep = np.empty(rows.size, dtype=bool)
+            _regrow_kernel(rows, self.quantity, self.max_quantity, self.regrowth_rate, self.depleted,
+                           self.fill, revive, np.float32(delta_time * season_modifier), keep)
+            self.in_worklist[rows[~keep]] = False
+            self._worklist = rows[keep]
+            return
+        
+        # Without Numba the kernel is a plain Python loop; use gathered array operations instead
+        quantity = self.quantity[rows]
+        max_quantity = self.max_quantity[rows]
+        depleted = self.depleted[rows]
+        
+        # Small chance for each depleted resource to un-deplete
+        depleted_idx = np.flatnonzero(depleted)
+        if depleted_idx.size:
+            revived = depleted_idx[rng.random(depleted_idx.size) < UNDEPLETE_CHANCE]
+            depleted[revived] = False
+            quantity[revived] = max_quantity[revived] * UNDEPLETE_FILL
+            self.depleted[rows[revived]] = False
+        
+        growing = ~depleted & (quantity < max_quantity)
+        grown = np.minimum(quantity + self.regrowth_rate[rows] * (delta_time * season_modifier), max_quantity)
+        np.copyto(quantity, grown, where=growing)
+        self.quantity[rows] = quantity
+        self._update_fill(rows)
+        
+        # Compact the work list down to rows that still need work
+        keep = depleted | (quantity < max_quantity)
+        self.in_worklist[rows[~keep]] = False
+        self._worklist = rows[keep]
 
 class Resource:
-    """Represents a resource node in the world"""
+    """Represents a resource node in the world (a handle on one ResourceTable row)"""
+    
+    __slots__ = ("resource_type", "position", "_table", "_idx", "is_food", "is_water")
     
     def __init__(self, resource_type: ResourceType, position: Tuple[int, int], quantity: float, 
-                 max_quantity: float, regrowth_rate: float):
+                 max_quantity: float, regrowth_rate: float, table: Optional[ResourceTable] = None):
         """
         Initialize a resource.
         
@@ -91,13 +473,72 @@ class Resource:
             quantity: Current available quantity
             max_quantity: Maximum capacity of this resource node
             regrowth_rate: Rate at which the resource regenerates
+            table: Table to store the resource's state in; a private one is created
+                if not provided (the resource manager adopts it when it is added)
         """
         self.resource_type = resource_type
         self.position = position
+        
+        # Quantities and depletion live in a table row
+        self._table = table if table is not None else ResourceTable(capacity=1)
+        self._idx = self._table.allocate(self)
+        self._table.positions[self._idx] = position
+        self._table.type_ids[self._idx] = resource_type.value
         self.quantity = quantity
         self.max_quantity = max_quantity
         self.regrowth_rate = regrowth_rate
-        self.depleted = False
+        
+        # Classification flags, resolved once so agents don't match type names per tick
+        self.is_food = bool(TYPE_IS_FOOD[resource_type.value])
+        self.is_water = bool(TYPE_IS_WATER[resource_type.value])
+    
+    @classmethod
+    def _from_row(cls, resource_type: ResourceType, position: Tuple[int, int],
+                  table: ResourceTable, idx: int, is_food: bool, is_water: bool) -> "Resource":
+        """Create a handle on a table row that has already been filled in"""
+        resource = cls.__new__(cls)
+        resource.resource_type = resource_type
+        resource.position = position
+        resource._table = table
+        resource._idx = idx
+        resource.is_food = is_food
+        resource.is_water = is_water
+        return resource
+    
+    @property
+    def quantity(self) -> float:
+        return float(self._table.quantity[self._idx])
+    
+    @quantity.setter
+    def quantity(self, value: float):
+        self._table.quantity[self._idx] = value
+        self._table.mark_growing(self._idx)
+    
+    @property
+    def max_quantity(self) -> float:
+        return float(self._table.max_quantity[self._idx])
+    
+    @max_quantity.setter
+    def max_quantity(self, value: float):
+        self._table.max_quantity[self._idx] = value
+        self._table.mark_growing(self._idx)
+    
+    @property
+    def regrowth_rate(self) -> float:
+        return float(self._table.regrowth_rate[self._idx])
+    
+    @regrowth_rate.setter
+    def regrowth_rate(self, value: float):
+        self._table.regrowth_rate[self._idx] = value
+    
+    @property
+    def depleted(self) -> bool:
+        return bool(self._table.depleted[self._idx])
+    
+    @depleted.setter
+    def depleted(self, value: bool):
+        self._table.depleted[self._idx] = value
+        self._table.mark_growing(self._idx)
     
     def extract(self, amount: float) -> float:
         """
@@ -109,16 +550,21 @@ class Resource:
         Returns:
             Amount actually extracted
         """
-        if self.depleted:
+        # Work on the row directly: one lookup per column instead of a property per access
+        table, idx = self._table, self._idx
+        if table.depleted[idx]:
             return 0.0
-            
-        extractable = min(amount, self.quantity)
-        self.quantity -= extractable
         
-        if self.quantity <= 0:
-            self.depleted = True
-            self.quantity = 0
-            
+        quantity = float(table.quantity[idx])
+        extractable = min(amount, quantity)
+        quantity -= extractable
+        
+        if quantity <= 0:
+            table.depleted[idx] = True
+            quantity = 0.0
+        
+        table.quantity[idx] = quantity
+        table.mark_growing(idx)
         return extractable
     
     def regrow(self, delta_time: float, season_modifier: float = 1.0):
@@ -129,53 +575,41 @@ class Resource:
             delta_time: Time passed
             season_modifier: Modifier based on current season (e.g., spring might have higher regrowth)
         """
-        if self.depleted and random.random() < 0.05:  # Small chance to un-deplete
-            self.depleted = False
-            self.quantity = self.max_quantity * 0.1  # Start with 10% filled
+        table, idx = self._table, self._idx
+        max_quantity = float(table.max_quantity[idx])
+        if table.depleted[idx] and random.random() < UNDEPLETE_CHANCE:  # Small chance to un-deplete
+            table.depleted[idx] = False
+            table.quantity[idx] = max_quantity * UNDEPLETE_FILL
             
-        if not self.depleted and self.quantity < self.max_quantity:
-            growth = self.regrowth_rate * delta_time * season_modifier
-            self.quantity = min(self.quantity + growth, self.max_quantity)
+        quantity = float(table.quantity[idx])
+        if not table.depleted[idx] and quantity < max_quantity:
+            growth = float(table.regrowth_rate[idx]) * delta_time * season_modifier
+            table.quantity[idx] = min(quantity + growth, max_quantity)
+        table.mark_growing(idx)
     
     def render(self, surface: pygame.Surface, cell_size: int):
         """Render the resource on a surface"""
-        x, y = self.position
-        if self.depleted:
-            color = (100, 100, 100)  # Gray for depleted resources
-        else:
-            color = ResourceType.get_color(self.resource_type)
-            
+        table, idx = self._table, self._idx
+        depleted = table.depleted[idx]
+        color = DEPLETED_COLOR if depleted else ResourceType.get_color(self.resource_type)
+        
         # Scale size based on quantity
-        size_factor = self.quantity / self.max_quantity if self.max_quantity > 0 else 0
-        radius = int(cell_size * 0.3 * (0.5 + 0.5 * size_factor))
+        size_factor = float(table.fill[idx])
+        trunk, foliage_center, center = _get_cell_geometry(cell_size)
+        px, py = self.position[0] * cell_size, self.position[1] * cell_size
         
         # Special rendering for trees
-        if self.resource_type == ResourceType.TREE and not self.depleted:
+        if self.resource_type == ResourceType.TREE and not depleted:
             # Draw trunk
-            pygame.draw.rect(
-                surface, 
-                (139, 69, 19),  # Brown
-                (x * cell_size + cell_size // 3, 
-                 y * cell_size + cell_size // 2, 
-                 cell_size // 3, 
-                 cell_size // 2)
-            )
+            trunk_dx, trunk_dy, trunk_w, trunk_h = trunk
+            pygame.draw.rect(surface, TRUNK_COLOR, (px + trunk_dx, py + trunk_dy, trunk_w, trunk_h))
             # Draw foliage
             tree_size = int(cell_size * 0.4 * (0.5 + 0.5 * size_factor))
-            pygame.draw.circle(
-                surface, 
-                color, 
-                (x * cell_size + cell_size // 2, y * cell_size + cell_size // 3),
-                tree_size
-            )
+            pygame.draw.circle(surface, color, (px + foliage_center[0], py + foliage_center[1]), tree_size)
         else:
             # Default circular rendering for other resources
-            pygame.draw.circle(
-                surface, 
-                color, 
-                (x * cell_size + cell_size // 2, y * cell_size + cell_size // 2),
-                radius
-            )
+            radius = int(cell_size * 0.3 * (0.5 + 0.5 * size_factor))
+            pygame.draw.circle(surface, color, (px + center, py + center), radius)
 
 class ResourceManager:
     """Manages all resources in the world"""
@@ -190,8 +624,22 @@ class ResourceManager:
         """
         self.world = world
         self.config = config
-        self.resources: List[Resource] = []
-        self.resource_grid = {}  # (x,y) -> List[Resource]
+        self.table = ResourceTable()  # SoA storage for resource quantities
+        self.resources: List[Resource] = self.table.resources  # Row order, kept by the table
+        
+        # Dense per-cell index: cells[x][y] -> List[Resource], or None if the cell is empty
+        self.width = world.width
+        self.height = world.height
+        self.cells: List[List[Optional[List[Resource]]]] = [[None] * self.height for _ in range(self.width)]
+        # Resources per cell, kept alongside the lists so area queries can skip empty cells in bulk
+        self.cell_counts = np.zeros((self.width, self.height), dtype=np.int32)
+        
+        # Rendered resource sprites, keyed by (kind, color, size, cell size)
+        self._sprites: Dict[Tuple, pygame.Surface] = {}
+        
+        # Last blit batch, reused while the table and view are unchanged
+        self._render_key: Optional[Tuple] = None
+        self._render_batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         self.village_resources = {}  # ResourceType -> quantity (storage)
     
     def generate_initial_resources(self):
@@ -288,63 +736,107 @@ class ResourceManager:
             'regrowth_rate': 0.3
         })
         
+        # Draw every cluster's center, size and per-cell rolls in one batch
+        rng = self.world.rng
+        num_clusters = resource_config['clusters']
+        centers_x = rng.integers(0, self.world.width, num_clusters).tolist()
+        centers_y = rng.integers(0, self.world.height, num_clusters).tolist()
+        cluster_sizes = rng.integers(3, 8, num_clusters).tolist()
+        
+        cell_counts = [(2 * size + 1) ** 2 for size in cluster_sizes]
+        total_cells = sum(cell_counts)
+        rolls = rng.random(total_cells)
+        fills = rng.uniform(0.6, 1.0, total_cells)
+        
+        # Every cell of every cluster is an upper bound on the nodes placed, so the
+        # table grows at most once for this resource type
+        self.table.reserve(self.table.size + total_cells)
+        
         # Create clusters
-        for _ in range(resource_config['clusters']):
-            # Choose a random center for the cluster
-            center_x = random.randint(0, self.world.width - 1)
-            center_y = random.randint(0, self.world.height - 1)
-            
-            # Determine cluster size
-            cluster_size = random.randint(3, 7)
+        offset = 0
+        for center_x, center_y, cluster_size, cells in zip(centers_x, centers_y, cluster_sizes, cell_counts):
+            # Pick the cluster's cells in a compiled loop (or whole-square masks without
+            # Numba), from this cluster's slice of the rolls
+            cell_slice = slice(offset, offset + cells)
+            offset += cells
+            pick_cells = _cluster_kernel if NUMBA_AVAILABLE else _cluster_cells_vectorized
+            xs, ys, quantities, max_quantities = pick_cells(
+                center_x, center_y, cluster_size,
+                float(resource_config['density']), float(resource_config['max_quantity']),
+                self.world.width, self.world.height,
+                rolls[cell_slice], fills[cell_slice]
+            )
             
-            # Add resources around the center based on density
-            for dx in range(-cluster_size, cluster_size + 1):
-                for dy in range(-cluster_size, cluster_size + 1):
-                    x, y = center_x + dx, center_y + dy
-                    
-                    # Check if within bounds and random chance based on density
-                    if (0 <= x < self.world.width and 
-                        0 <= y < self.world.height and 
-                        random.random() < resource_config['density'] * (1 - (abs(dx) + abs(dy)) / (2 * cluster_size))):
-                        
-                        # Vary the quantity based on distance from center
-                        distance_factor = 1 - (abs(dx) + abs(dy)) / (2 * cluster_size)
-                        max_quantity = resource_config['max_quantity'] * (0.5 + 0.5 * distance_factor)
-                        initial_quantity = max_quantity * random.uniform(0.6, 1.0)
-                        
-                        # Create and add the resource
-                        resource = Resource(
-                            resource_type=resource_type,
-                            position=(x, y),
-                            quantity=initial_quantity,
-                            max_quantity=max_quantity,
-                            regrowth_rate=resource_config['regrowth_rate']
-                        )
-                        
-                        self.add_resource(resource)
+            # Fill the cluster's table rows in bulk, then index the new resources by cell
+            resources = self.table.add_rows(resource_type, xs, ys, quantities, max_quantities,
+                                            resource_config['regrowth_rate'])
+            for resource in resources:
+                self._index_cell(resource)
     
     def add_resource(self, resource: Resource):
         """Add a resource to the world"""
-        self.resources.append(resource)
-        
+        self.table.adopt(resource)
+        self._index_cell(resource)
+    
+    def _index_cell(self, resource: Resource):
+        """Add a resource to its cell's list in the grid index"""
         x, y = resource.position
-        if (x, y) not in self.resource_grid:
-            self.resource_grid[(x, y)] = []
+        column = self.cells[x]
+        if column[y] is None:
+            column[y] = []
             
-        self.resource_grid[(x, y)].append(resource)
+        column[y].append(resource)
+        self.cell_counts[x, y] += 1
     
-    def get_resources_at(self, x: int, y: int) -> List[Resource]:
+    def get_resources_at(self, x: int, y: int) -> Sequence[Resource]:
         """Get all resources at a specific position"""
-        return self.resource_grid.get((x, y), [])
+        if 0 <= x < self.width and 0 <= y < self.height:
+            cell = self.cells[x][y]
+            if cell is not None:
+                return cell
+        return _NO_RESOURCES
     
     def remove_resource(self, resource: Resource):
         """Remove a resource from the world"""
-        if resource in self.resources:
-            self.resources.remove(resource)
+        if resource._table is self.table:
+            # Give the resource its own row again so references to it stay usable
+            ResourceTable(capacity=1).adopt(resource)
             
         x, y = resource.position
-        if (x, y) in self.resource_grid and resource in self.resource_grid[(x, y)]:
-            self.resource_grid[(x, y)].remove(resource)
+        cell = self.cells[x][y]
+        if cell is None:
+            return
+        try:
+            cell.remove(resource)
+        except ValueError:
+            return  # Already removed
+        self.cell_counts[x, y] -= 1
+        if not cell:
+            self.cells[x][y] = None
+    
+    def get_occupied_cells(self, x: int, y: int, distance: int = 1) -> List[Tuple[int, int]]:
+        """
+        Get the neighboring cells within a distance that hold resources.
+        Cells come in the same order as World.get_neighboring_cells.
+        
+        Args:
+            x, y: Center cell (excluded)
+            distance: Search distance in cells (square neighborhood)
+            
+        Returns:
+            List of (x, y) cells with at least one resource
+        """
+        x0, y0 = max(0, x - distance), max(0, y - distance)
+        x1, y1 = min(self.width, x + distance + 1), min(self.height, y + distance + 1)
+        if x0 >= x1 or y0 >= y1:
+            return []
+        
+        occupied = self.cell_counts[x0:x1, y0:y1] > 0
+        if 0 <= x < self.width and 0 <= y < self.height:
+            occupied[x - x0, y - y0] = False  # Slice is a copy (comparison result)
+        
+        xs, ys = np.nonzero(occupied)  # Row-major, i.e. x-major like the neighbor scan
+        return list(zip((xs + x0).tolist(), (ys + y0).tolist()))
     
     def add_to_village_storage(self, resource_type: ResourceType, amount: float):
         """
@@ -363,6 +855,25 @@ class ResourceManager:
         self.village_resources[resource_type] += amount
         return amount
     
+    def bulk_deposit(self, type_ids: np.ndarray, amounts: np.ndarray) -> np.ndarray:
+        """
+        Add many deposits to the village storage at once (e.g. a tick's harvests).
+        Deposits are summed per type in one array pass, so storage is touched
+        once per distinct type rather than once per deposit.
+        
+        Args:
+            type_ids: ResourceType value of each deposit
+            amounts: Amount of each deposit
+            
+        Returns:
+            Total deposited per type id (length NUM_TYPE_IDS)
+        """
+        totals = np.bincount(np.asarray(type_ids, dtype=np.intp),
+                             weights=np.asarray(amounts, dtype=np.float64), minlength=NUM_TYPE_IDS)
+        for type_id in np.flatnonzero(totals).tolist():
+            self.add_to_village_storage(TYPES_BY_ID[type_id], float(totals[type_id]))
+        return totals
+    
     def take_from_village_storage(self, resource_type: ResourceType, amount: float) -> float:
         """
         Take resources from the village storage.
@@ -393,30 +904,116 @@ class ResourceManager:
         Args:
             time_system: Reference to the time system for season information
         """
-        # Get season modifiers for resource growth
-        season = time_system.get_season()
-        season_modifiers = {
-            "spring": 1.5,  # Spring has fastest regrowth
-            "summer": 1.2,  # Summer also good for growth
-            "autumn": 0.8,  # Autumn slower growth
-            "winter": 0.3   # Winter very slow growth
-        }
-        season_modifier = season_modifiers.get(season, 1.0)
+        # Get season modifier for resource growth
+        season_modifier = REGROWTH_SEASON_MODIFIERS[time_system.get_season_id()]
         
-        # Update all resources
-        hours_passed = 1.0 / time_system.ticks_per_hour  # Convert ticks to hours
-        for resource in self.resources:
-            resource.regrow(hours_passed, season_modifier)
+        # Update all resources in one vectorized pass
+        hours_passed = time_system.inv_ticks_per_hour  # Convert ticks to hours
+        self.table.regrow(hours_passed, season_modifier, self.world.rng)
     
-    def render(self, surface: pygame.Surface):
+    def render(self, surface: pygame.Surface, view: Optional[Tuple[int, int, int, int]] = None):
         """
         Render all resources on the surface.
         
         Args:
             surface: Surface to render on
+            view: Optional (x0, y0, x1, y1) cell bounds to draw (end-exclusive);
+                defaults to the cells covered by the surface
         """
         cell_size = self.config.cell_size
+        table = self.table
+        n = table.size
+        if n == 0:
+            return
+        
+        if view is None:
+            # Tree foliage spills slightly into the cell above, so keep one extra row
+            width, height = surface.get_size()
+            view = (0, 0, -(-width // cell_size), -(-height // cell_size) + 1)
+        
+        # Nothing has changed since the last render: reuse its batch
+        render_key = (table.version, view, cell_size)
+        if render_key == self._render_key:
+            surface.blits(self._render_batch, doreturn=False)
+            return
+        
+        # Work out every resource's sprite from the table in a few array operations
+        x0, y0, x1, y1 = view
+        xs = table.positions[:n, 0]
+        ys = table.positions[:n, 1]
+        in_view = (xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)
+        
+        depleted = table.depleted[:n]
+        is_tree_type = TYPE_IS_TREE[table.type_ids[:n]]
+        trees = is_tree_type & ~depleted  # Drawn with trunk and foliage
+        visible = np.flatnonzero(in_view & (~depleted | is_tree_type))  # Depleted trees still show as a gray dot
+        
+        growth = 0.5 + 0.5 * table.fill[visible]  # Fill fractions are kept current by the table
+        is_tree = trees[visible]
+        sizes = np.where(is_tree, cell_size * 0.4 * growth, cell_size * 0.3 * growth).astype(np.int32)
+        
+        # Circles with a zero radius draw nothing (trees always draw their trunk)
+        shown = is_tree | (sizes > 0)
+        visible, is_tree, sizes = visible[shown], is_tree[shown], sizes[shown]
+        
+        # Depleted resources use color key -1 (gray)
+        colors = np.where(depleted[visible], -1, table.type_ids[visible].astype(np.int32))
+        corners = table.positions[visible] * cell_size
+        
+        # Look up each distinct sprite once, then place every resource's sprite in array math.
+        # Sprite keys are packed into one int: tree flag << 40 | (color + 1) << 20 | size
+        sprite_keys = (is_tree.astype(np.int64) << 40) | ((colors.astype(np.int64) + 1) << 20) | sizes
+        unique_keys, sprite_idx = np.unique(sprite_keys, return_inverse=True)
+        sprites = []
+        offsets = np.empty((len(unique_keys), 2), dtype=np.int64)
+        for k, key in enumerate(unique_keys.tolist()):
+            sprite, offsets[k] = self._get_sprite(bool(key >> 40), ((key >> 20) & 0xFFFFF) - 1,
+                                                  key & 0xFFFFF, cell_size)
+            sprites.append(sprite)
+        blit_positions = corners - offsets[sprite_idx]
+        
+        # Stamp cached sprites in one blits call instead of a draw call per resource
+        batch = list(zip([sprites[k] for k in sprite_idx.tolist()],
+                         map(tuple, blit_positions.tolist())))
+        surface.blits(batch, doreturn=False)
+        self._render_key = render_key
+        self._render_batch = batch
+    
+    def _get_sprite(self, is_tree: bool, color: int, size: int, cell_size: int):
+        """
+        Get a cached resource sprite and the offset of the cell's corner within it.
+        
+        Args:
+            is_tree: Whether to draw a (non-depleted) tree
+            color: ResourceType value for the color, or -1 for depleted
+            size: Circle or foliage radius in pixels
+            cell_size: Pixel size of a cell
+            
+        Returns:
+            Tuple of (sprite or None if nothing is drawn, (offset_x, offset_y))
+        """
+        key = (is_tree, color, size, cell_size)
+        cached = self._sprites.get(key)
+        if cached is not None:
+            return cached
+        
+        rgb = DEPLETED_COLOR if color < 0 else _COLOR_TUPLES[color]
+        trunk, foliage_center, center = _get_cell_geometry(cell_size)
+        if is_tree:
+            # Trunk plus foliage, padded so the foliage can spill out of the cell
+            pad = size
+            trunk_dx, trunk_dy, trunk_w, trunk_h = trunk
+            sprite = pygame.Surface((cell_size + 2 * pad, cell_size + 2 * pad), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, TRUNK_COLOR, (pad + trunk_dx, pad + trunk_dy, trunk_w, trunk_h))
+            pygame.draw.circle(sprite, rgb, (pad + foliage_center[0], pad + foliage_center[1]), size)
+            cached = (sprite, (pad, pad))
+        elif size < 1:
+            cached = (None, (0, 0))  # pygame draws nothing for a zero radius
+        else:
+            # Circle centered in the cell
+            sprite = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, rgb, (size, size), size)
+            cached = (sprite, (size - center, size - center))
         
-        for resource in self.resources:
-            if not resource.depleted or resource.resource_type == ResourceType.TREE:
-                resource.render(surface, cell_size) 
\ No newline at end of file
+        self._sprites[key] = cached
+        return cached 
\ No newline at end of file
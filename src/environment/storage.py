@@ -1,12 +1,242 @@
+import heapq
+import itertools
 import random
+from collections import defaultdict
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 import pygame
 
-from src.environment.resources import ResourceType
+from src.environment.resources import ResourceType, RAW_RESOURCES, NUM_TYPE_IDS
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
+
+# Facility ids are handed out in order, so they never collide
+_FACILITY_IDS = itertools.count(1)
+
+# Pixel size of a grid cell for facilities not yet added to a StorageManager
+# (the manager switches them to the configured cell size)
+STORAGE_CELL_SIZE = 32
+
+OUTLINE_COLOR = (0, 0, 0)
+
+# Below this condition, damage may destroy some of the stored resources
+SEVERE_DAMAGE_CONDITION = 30.0
+
+# Chance that damage to a severely damaged facility destroys resources
+DAMAGE_LOSS_CHANCE = 0.3
+
+# Indicator bars are drawn in this many steps (5% each), so their surfaces can be cached
+BAR_BUCKETS = 20
+
+# Side length, in cells, of the spatial buckets used for nearby-facility queries
+FACILITY_BUCKET_SIZE = 8
+
+# Pre-drawn building sprites (body and outline), keyed by (color, size, cell_size)
+_SPRITE_CACHE: Dict[Tuple, pygame.Surface] = {}
+
+def _get_facility_sprite(color: Tuple[int, int, int], size: Tuple[int, int], cell_size: int) -> pygame.Surface:
+    """
+    Get the cached sprite for a facility building, drawing it on first use.
+    Facilities never move or change shape, so only their indicators are redrawn each frame.
+    
+    Args:
+        color: Body color
+        size: Size in grid cells (width, height)
+        cell_size: Pixel size of a cell
+        
+    Returns:
+        Surface with the building body and outline
+    """
+    key = (color, size, cell_size)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((cell_size * size[0], cell_size * size[1]))
+        sprite.fill(color)
+        pygame.draw.rect(sprite, OUTLINE_COLOR, sprite.get_rect(), 2)
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+# Pre-filled indicator bars, keyed by (color, bucket, cell_size)
+_BAR_CACHE: Dict[Tuple, pygame.Surface] = {}
+
+def _get_bar(color: Tuple[int, int, int], percentage: float, cell_size: int) -> pygame.Surface:
+    """
+    Get the cached indicator bar for a percentage, rounded down to a 5% step.
+    
+    Args:
+        color: Bar color
+        percentage: Value shown by the bar (0-100)
+        cell_size: Pixel size of a cell
+        
+    Returns:
+        Surface filled with the bar color
+    """
+    bucket = min(BAR_BUCKETS, max(0, int(percentage * BAR_BUCKETS / 100.0)))
+    key = (color, bucket, cell_size)
+    bar = _BAR_CACHE.get(key)
+    if bar is None:
+        bar = pygame.Surface((int(bucket / BAR_BUCKETS * cell_size * 0.8), int(cell_size * 0.1)))
+        bar.fill(color)
+        _BAR_CACHE[key] = bar
+    return bar
+
+@njit(parallel=True, cache=True)
+def _damage_kernel(condition, stock, damage, loss_chance_rolls, loss_rolls, taken, lost):
+    """Apply damage to every row, destroying stock in severely damaged facilities"""
+    for i in prange(condition.shape[0]):
+        applied = min(damage[i], condition[i])
+        condition[i] -= applied
+        taken[i] = applied
+        
+        lost[i] = condition[i] < SEVERE_DAMAGE_CONDITION and loss_chance_rolls[i] < DAMAGE_LOSS_CHANCE
+        if lost[i]:
+            percentage = applied / 100.0
+            for j in range(stock.shape[1]):
+                stock[i, j] -= stock[i, j] * percentage * loss_rolls[i, j]
+
+class StorageTable:
+    """
+    Structure-of-Arrays storage for storage facility state.
+    Each facility owns one row, and stock is a (row, resource type id) matrix,
+    so village-wide totals are column sums instead of loops over facilities.
+    """
+    
+    def __init__(self, capacity: int = 8):
+        """
+        Initialize an empty table.
+        
+        Args:
+            capacity: Number of rows to preallocate (grows automatically)
+        """
+        capacity = max(1, capacity)
+        self.size = 0
+        self.facilities: List["StorageFacility"] = []  # Row index -> StorageFacility
+        
+        self.capacity = np.zeros(capacity, dtype=np.float64)
+        self.condition = np.zeros(capacity, dtype=np.float64)
+        self.stock = np.zeros((capacity, NUM_TYPE_IDS), dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _grow(self, capacity: int):
+        """Reallocate all arrays to hold at least `capacity` rows"""
+        def grown(array):
+            new_array = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new_array[:self.size] = array[:self.size]
+            return new_array
+        
+        self.capacity = grown(self.capacity)
+        self.condition = grown(self.condition)
+        self.stock = grown(self.stock)
+    
+    def allocate(self, facility: "StorageFacility") -> int:
+        """
+        Reserve a zeroed row for a facility.
+        
+        Args:
+            facility: The facility that will own the row
+            
+        Returns:
+            Index of the new row
+        """
+        if self.size == len(self.capacity):
+            self._grow(2 * len(self.capacity))
+        
+        idx = self.size
+        self.size += 1
+        self.facilities.append(facility)
+        
+        self.capacity[idx] = 0.0
+        self.condition[idx] = 0.0
+        self.stock[idx] = 0.0
+        return idx
+    
+    def release(self, idx: int):
+        """
+        Free a row by moving the last row into its place.
+        
+        Args:
+            idx: Index of the row to free
+        """
+        last = self.size - 1
+        if idx != last:
+            self._copy_row(self, last, idx)
+            moved = self.facilities[last]
+            self.facilities[idx] = moved
+            moved._row = idx
+        
+        self.facilities.pop()
+        self.size -= 1
+    
+    def adopt(self, facility: "StorageFacility"):
+        """
+        Move a facility's state from its current table into this one.
+        
+        Args:
+            facility: The facility to adopt
+        """
+        old_table, old_idx = facility._table, facility._row
+        if old_table is self:
+            return
+        
+        idx = self.allocate(facility)
+        self._copy_row(old_table, old_idx, idx)
+        old_table.release(old_idx)
+        
+        facility._table = self
+        facility._row = idx
+    
+    def _copy_row(self, source: "StorageTable", src_idx: int, dst_idx: int):
+        """Copy one row of state from `source` into this table"""
+        self.capacity[dst_idx] = source.capacity[src_idx]
+        self.condition[dst_idx] = source.condition[src_idx]
+        self.stock[dst_idx] = source.stock[src_idx]
+    
+    def apply_damage(self, damage: np.ndarray, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Damage every facility at once.
+        Facilities left below SEVERE_DAMAGE_CONDITION may lose part of their
+        stock, as in StorageFacility.damage.
+        
+        Args:
+            damage: Damage per row (or one value for every row)
+            rng: Random generator for the loss rolls
+            
+        Returns:
+            (damage actually taken, mask of rows that lost stock)
+        """
+        n = self.size
+        damage = np.broadcast_to(np.asarray(damage, dtype=np.float64), (n,))
+        loss_chance_rolls = rng.random(n)
+        loss_rolls = rng.uniform(0.5, 1.0, (n, self.stock.shape[1]))
+        
+        if NUMBA_AVAILABLE:
+            taken = np.empty(n, dtype=np.float64)
+            lost = np.empty(n, dtype=np.bool_)
+            _damage_kernel(self.condition[:n], self.stock[:n], np.ascontiguousarray(damage),
+                           loss_chance_rolls, loss_rolls, taken, lost)
+            return taken, lost
+        
+        condition = self.condition[:n]
+        taken = np.minimum(damage, condition)
+        condition -= taken
+        lost = (condition < SEVERE_DAMAGE_CONDITION) & (loss_chance_rolls < DAMAGE_LOSS_CHANCE)
+        stock = self.stock[:n]
+        stock[lost] -= stock[lost] * (taken[lost, None] / 100.0) * loss_rolls[lost]
+        return taken, lost
 
 class StorageFacility:
     """Base class for all storage facilities"""
     
+    __slots__ = (
+        "_table", "_row", "_position", "_size", "_cell_size", "name", "_current_total",
+        "last_repair", "id", "color", "_pixel_rect", "_bar_positions",
+        "_composite", "_composite_parts", "_rendered_state",
+    )
+    
+    # Resource types this kind of facility will store (default: any ResourceType)
+    ACCEPTED: frozenset = frozenset(ResourceType)
+    
     def __init__(self, position: Tuple[int, int], capacity: float = 1000.0, name: str = "Storage"):
         """
         Initialize a storage facility.
@@ -16,14 +246,25 @@ class StorageFacility:
             capacity: Maximum storage capacity
             name: Name of the facility
         """
+        # Numeric state lives in a table row; a private one-row table until a manager adopts it
+        self._table = StorageTable(capacity=1)
+        self._row = self._table.allocate(self)
+        
+        # Pre-drawn building with its bars, and the state it was drawn for
+        self._composite: Optional[pygame.Surface] = None
+        self._composite_parts = None
+        self._rendered_state = None
+        
+        # Geometry setters refresh the cached pixel rects, so set the cell size first
+        self._cell_size = STORAGE_CELL_SIZE
+        self._size = (1, 1)
         self.position = position
         self.capacity = capacity
         self.name = name
-        self.resources = {}  # ResourceType -> quantity
+        self._current_total = 0.0  # Running sum of the stock row
         self.condition = 100.0  # Building condition (0-100)
         self.last_repair = 0  # Game day of last repair
-        self.size = (1, 1)  # Size in grid cells (width, height)
-        self.id = random.randint(1000, 9999)
+        self.id = next(_FACILITY_IDS)
         self.color = (139, 69, 19)  # Brown by default
     
     def add_resource(self, resource_type: ResourceType, amount: float) -> float:
@@ -37,18 +278,23 @@ class StorageFacility:
         Returns:
             Amount actually added (limited by available capacity)
         """
-        # Calculate total current storage use
-        current_total = sum(self.resources.values())
-        available_space = max(0.0, self.capacity - current_total)
+        if not self.accepts(resource_type):
+            return 0.0
+            
+        table = self._table
+        available_space = table.capacity[self._row] - self._current_total
         
-        # Determine how much can be added
-        can_add = min(amount, available_space)
+        # Common case: plenty of room for the whole amount
+        if amount <= available_space:
+            can_add = amount
+        elif available_space <= 0.0:
+            return 0.0
+        else:
+            can_add = float(available_space)
         
         # Update storage
-        if resource_type not in self.resources:
-            self.resources[resource_type] = 0.0
-            
-        self.resources[resource_type] += can_add
+        table.stock[self._row, resource_type.value] += can_add
+        self._current_total += can_add
         
         return can_add
     
@@ -63,29 +309,73 @@ class StorageFacility:
         Returns:
             Amount actually removed (limited by available amount)
         """
-        available = self.resources.get(resource_type, 0.0)
-        can_remove = min(amount, available)
+        if amount <= 0 or not isinstance(resource_type, ResourceType):
+            return 0.0
         
-        if can_remove > 0:
-            self.resources[resource_type] = available - can_remove
-            
-            # Clean up zero entries
-            if self.resources[resource_type] <= 0:
-                del self.resources[resource_type]
-                
+        # One read and one write of the stock slot
+        stock, row, type_id = self._table.stock, self._row, resource_type.value
+        available = float(stock[row, type_id])
+        if available <= 0:
+            return 0.0
+        
+        can_remove = amount if amount < available else available
+        stock[row, type_id] = available - can_remove
+        self._current_total -= can_remove
         return can_remove
     
+    def get_amount(self, resource_type: ResourceType) -> float:
+        """Get the amount of a resource type stored here (0 if none)"""
+        if not isinstance(resource_type, ResourceType):
+            return 0.0
+        return float(self._table.stock[self._row, resource_type.value])
+    
+    @property
+    def resources(self) -> Dict[ResourceType, float]:
+        """Stored resources as a dict of the types with a nonzero amount"""
+        row = self._table.stock[self._row]
+        return {resource_type: float(row[resource_type.value])
+                for resource_type in ResourceType if row[resource_type.value] > 0}
+    
+    @property
+    def capacity(self) -> float:
+        """Maximum storage capacity"""
+        return float(self._table.capacity[self._row])
+    
+    @capacity.setter
+    def capacity(self, value: float):
+        self._table.capacity[self._row] = value
+    
+    @property
+    def condition(self) -> float:
+        """Building condition (0-100)"""
+        return float(self._table.condition[self._row])
+    
+    @condition.setter
+    def condition(self, value: float):
+        self._table.condition[self._row] = value
+    
+    def _sync_from_row(self):
+        """Recompute the running total after bulk changes to the stock row"""
+        self._current_total = float(self._table.stock[self._row].sum())
+    
+    def accepts(self, resource_type: ResourceType) -> bool:
+        """Check whether this facility can store a resource type"""
+        return resource_type in self.ACCEPTED
+    
+    @property
+    def available_capacity(self) -> float:
+        """Remaining storage capacity"""
+        return max(0.0, self.capacity - self._current_total)
+    
     def get_available_capacity(self) -> float:
         """Get remaining storage capacity"""
-        current_total = sum(self.resources.values())
-        return max(0.0, self.capacity - current_total)
+        return self.available_capacity
     
     def get_fullness_percentage(self) -> float:
         """Get percentage of capacity used (0-100)"""
-        current_total = sum(self.resources.values())
         if self.capacity <= 0:
             return 100.0
-        return (current_total / self.capacity) * 100.0
+        return (self._current_total / self.capacity) * 100.0
     
     def get_contents(self) -> Dict:
         """
@@ -94,7 +384,7 @@ class StorageFacility:
         Returns:
             Dictionary of resource types and amounts
         """
-        return self.resources.copy()
+        return self.resources
     
     def damage(self, amount: float) -> float:
         """
@@ -110,7 +400,7 @@ class StorageFacility:
         self.condition -= damage_taken
         
         # If severely damaged, resources might be lost
-        if self.condition < 30.0 and random.random() < 0.3:
+        if self.condition < SEVERE_DAMAGE_CONDITION and random.random() < DAMAGE_LOSS_CHANCE:
             self._lose_resources_from_damage(damage_taken / 100.0)
             
         return damage_taken
@@ -142,56 +432,116 @@ class StorageFacility:
         Args:
             percentage: Percentage of resources to lose (0-1)
         """
-        for resource_type in list(self.resources.keys()):
-            amount = self.resources[resource_type]
-            loss = amount * percentage * random.uniform(0.5, 1.0)  # Random loss amount
-            self.resources[resource_type] -= loss
-            
-            # Clean up zero entries
-            if self.resources[resource_type] <= 0:
-                del self.resources[resource_type]
+        row = self._table.stock[self._row]
+        type_ids = np.flatnonzero(row > 0)
+        rolls = [random.uniform(0.5, 1.0) for _ in range(len(type_ids))]  # Random loss amounts
+        
+        # Read the held amounts once and apply every loss in one write
+        held = row[type_ids]
+        losses = held * percentage * np.array(rolls)
+        row[type_ids] = held - losses
+        self._current_total -= float(losses.sum())
     
-    def render(self, surface: pygame.Surface):
-        """Render the storage facility on the given surface"""
-        # Get cell size from config (assuming 32 as default)
-        cell_size = 32
-        
-        x, y = self.position
-        
-        # Draw a rectangle for the storage building
-        rect = pygame.Rect(
-            x * cell_size, 
-            y * cell_size,
-            cell_size * self.size[0],
-            cell_size * self.size[1]
-        )
-        pygame.draw.rect(surface, self.color, rect)
-        
-        # Draw outline
-        pygame.draw.rect(surface, (0, 0, 0), rect, 2)
-        
-        # Draw condition indicator
-        condition_color = (0, 255, 0) if self.condition > 70 else (255, 255, 0) if self.condition > 30 else (255, 0, 0)
-        condition_width = int((self.condition / 100.0) * cell_size * 0.8)
-        pygame.draw.rect(
-            surface,
-            condition_color,
-            (x * cell_size + cell_size * 0.1, y * cell_size + cell_size * 0.9, condition_width, cell_size * 0.1)
-        )
-        
-        # Draw fullness indicator
+    @property
+    def position(self) -> Tuple[int, int]:
+        """(x, y) position in the world grid"""
+        return self._position
+    
+    @position.setter
+    def position(self, value: Tuple[int, int]):
+        self._position = tuple(value)
+        self._update_geometry()
+    
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Size in grid cells (width, height)"""
+        return self._size
+    
+    @size.setter
+    def size(self, value: Tuple[int, int]):
+        self._size = tuple(value)
+        self._update_geometry()
+    
+    @property
+    def cell_size(self) -> int:
+        """Pixel size of a grid cell when drawing this facility"""
+        return self._cell_size
+    
+    @cell_size.setter
+    def cell_size(self, value: int):
+        self._cell_size = value
+        self._update_geometry()
+    
+    @property
+    def pixel_rect(self) -> pygame.Rect:
+        """Pixel rectangle covered by the building (shared; do not modify)"""
+        return self._pixel_rect
+    
+    def _update_geometry(self):
+        """Recompute the building rect and indicator positions; they only change with the geometry"""
+        cell_size = self._cell_size
+        x, y = self._position
+        self._pixel_rect = pygame.Rect(x * cell_size, y * cell_size,
+                                       cell_size * self._size[0], cell_size * self._size[1])
+        bar_x = int(x * cell_size + cell_size * 0.1)
+        self._bar_positions = ((bar_x, int(y * cell_size + cell_size * 0.9)),  # Condition
+                               (bar_x, int(y * cell_size + cell_size * 0.8)))  # Fullness
+        self._rendered_state = None  # Redraw the composite at the new geometry
+    
+    def get_condition_bar(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the surface and pixel position of the condition indicator"""
+        condition = self.condition
+        condition_color = (0, 255, 0) if condition > 70 else (255, 255, 0) if condition > 30 else (255, 0, 0)
+        return _get_bar(condition_color, condition, self._cell_size), self._bar_positions[0]
+    
+    def get_fullness_bar(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the surface and pixel position of the fullness indicator"""
         fullness = self.get_fullness_percentage()
         fullness_color = (0, 0, 255) if fullness < 70 else (0, 0, 128) if fullness < 90 else (75, 0, 130)
-        fullness_width = int((fullness / 100.0) * cell_size * 0.8)
-        pygame.draw.rect(
-            surface,
-            fullness_color,
-            (x * cell_size + cell_size * 0.1, y * cell_size + cell_size * 0.8, fullness_width, cell_size * 0.1)
-        )
+        return _get_bar(fullness_color, fullness, self._cell_size), self._bar_positions[1]
+    
+    def get_sprite(self) -> pygame.Surface:
+        """Get the cached building sprite (body and outline)"""
+        return _get_facility_sprite(self.color, self._size, self._cell_size)
+    
+    def get_composite(self) -> pygame.Surface:
+        """
+        Get the building drawn together with its indicator bars.
+        The composite is only redrawn when the stored total, condition or color
+        has changed since the last call and the change is visible in the bars.
+        
+        Returns:
+            Surface covering the facility's pixel rect
+        """
+        state = (self._current_total, self._table.condition[self._row], self.color)
+        if state == self._rendered_state:
+            return self._composite
+        
+        sprite = self.get_sprite()
+        condition_bar, condition_pos = self.get_condition_bar()
+        fullness_bar, fullness_pos = self.get_fullness_bar()
+        parts = (sprite, condition_bar, fullness_bar)
+        if parts != self._composite_parts or self._composite is None:
+            # Bars sit at fixed offsets inside the building
+            left, top = self._pixel_rect.topleft
+            composite = sprite.copy()
+            composite.blit(condition_bar, (condition_pos[0] - left, condition_pos[1] - top))
+            composite.blit(fullness_bar, (fullness_pos[0] - left, fullness_pos[1] - top))
+            self._composite = composite
+            self._composite_parts = parts
+        
+        self._rendered_state = state
+        return self._composite
+    
+    def render(self, surface: pygame.Surface):
+        """Render the storage facility on the given surface"""
+        surface.blit(self.get_composite(), self._pixel_rect)
 
 class Warehouse(StorageFacility):
     """General purpose storage for all resource types"""
     
+    __slots__ = ()
+    
     def __init__(self, position: Tuple[int, int], capacity: float = 2000.0):
         """Initialize a general warehouse"""
         super().__init__(position, capacity, "Warehouse")
@@ -201,47 +551,44 @@ class Warehouse(StorageFacility):
 class Granary(StorageFacility):
     """Specialized storage for food resources"""
     
+    __slots__ = ()
+    
+    ACCEPTED = frozenset({ResourceType.FOOD_WHEAT, ResourceType.FOOD_BERRY, ResourceType.FOOD_FISH})
+    
     def __init__(self, position: Tuple[int, int], capacity: float = 1500.0):
         """Initialize a granary"""
         super().__init__(position, capacity, "Granary")
         self.size = (2, 1)  # Medium building
         self.color = (218, 165, 32)  # Golden brown
-    
-    def add_resource(self, resource_type: ResourceType, amount: float) -> float:
-        """Only allow food resources in granary"""
-        if resource_type not in [ResourceType.FOOD_WHEAT, ResourceType.FOOD_BERRY, ResourceType.FOOD_FISH]:
-            return 0.0
-        return super().add_resource(resource_type, amount)
 
 class Stockpile(StorageFacility):
     """Basic outdoor storage for raw materials"""
     
+    __slots__ = ()
+    
+    ACCEPTED = RAW_RESOURCES
+    
     def __init__(self, position: Tuple[int, int], capacity: float = 800.0):
         """Initialize a stockpile"""
         super().__init__(position, capacity, "Stockpile")
         self.size = (1, 1)  # Small area
         self.color = (169, 169, 169)  # Gray
-    
-    def add_resource(self, resource_type: ResourceType, amount: float) -> float:
-        """Only allow raw materials in stockpile"""
-        if not ResourceType.is_raw_resource(resource_type):
-            return 0.0
-        return super().add_resource(resource_type, amount)
 
 class Armory(StorageFacility):
     """Specialized storage for weapons and tools"""
     
+    __slots__ = ()
+    
+    ACCEPTED = frozenset({ResourceType.WEAPONS, ResourceType.BASIC_TOOLS, ResourceType.ADVANCED_TOOLS})
+    
     def __init__(self, position: Tuple[int, int], capacity: float = 500.0):
         """Initialize an armory"""
         super().__init__(position, capacity, "Armory")
         self.size = (1, 1)  # Small building
         self.color = (178, 34, 34)  # Firebrick red
-    
-    def add_resource(self, resource_type: ResourceType, amount: float) -> float:
-        """Only allow weapons and tools in armory"""
-        if resource_type not in [ResourceType.WEAPONS, ResourceType.BASIC_TOOLS, ResourceType.ADVANCED_TOOLS]:
-            return 0.0
-        return super().add_resource(resource_type, amount)
+
+# Returned for resource types no facility accepts
+_NO_FACILITIES: Tuple["StorageFacility", ...] = ()
 
 class StorageManager:
     """Manages all storage facilities in the village"""
@@ -254,8 +601,13 @@ class StorageManager:
             world: Reference to the world
         """
         self.world = world
+        self.table = StorageTable()  # SoA storage for facility state
         self.storage_facilities = []
-        self.resource_map = {}  # ResourceType -> List[StorageFacility]
+        self._facilities_by_id: Dict[int, StorageFacility] = {}
+        self._map_memberships: Dict[int, List[ResourceType]] = {}  # Facility id -> its resource_map keys
+        self._spatial: Dict[Tuple[int, int], List[StorageFacility]] = defaultdict(list)  # Bucket -> facilities
+        # ResourceType -> List[StorageFacility], kept up to date as facilities come and go
+        self.resource_map = {resource_type: [] for resource_type in ResourceType}
     
     def add_facility(self, facility: StorageFacility) -> bool:
         """
@@ -270,6 +622,15 @@ class StorageManager:
         # Check if the position is valid in the world
         if self.world.add_building(facility, *facility.position):
             self.storage_facilities.append(facility)
+            self._facilities_by_id[facility.id] = facility
+            self.table.adopt(facility)
+            facility.cell_size = self.world.config.cell_size
+            self._spatial[self._bucket_of(facility.position)].append(facility)
+            memberships = [resource_type for resource_type in self.resource_map
+                           if facility.accepts(resource_type)]
+            for resource_type in memberships:
+                self.resource_map[resource_type].append(facility)
+            self._map_memberships[facility.id] = memberships
             return True
         return False
     
@@ -283,38 +644,38 @@ class StorageManager:
         Returns:
             True if removed successfully, False otherwise
         """
-        facility = self.get_facility_by_id(facility_id)
+        facility = self._facilities_by_id.pop(facility_id, None)
         if not facility:
             return False
             
-        # Remove from world's buildings list if it exists there
-        if facility in self.world.buildings:
-            self.world.buildings.remove(facility)
+        # Remove from the world if it was placed there
+        self.world.remove_building(facility)
             
-        # Remove from our list
+        # Remove from our list (kept in insertion order for tie-breaking)
         self.storage_facilities.remove(facility)
         
-        # Remove from resource_map
-        for facilities in self.resource_map.values():
-            if facility in facilities:
-                facilities.remove(facility)
+        bucket_key = self._bucket_of(facility.position)
+        bucket = self._spatial[bucket_key]
+        bucket.remove(facility)
+        if not bucket:
+            del self._spatial[bucket_key]
+        
+        # Give the facility its own row again so references to it stay usable
+        StorageTable(capacity=1).adopt(facility)
+        
+        # Remove from the resource_map lists it was added to
+        for resource_type in self._map_memberships.pop(facility_id):
+            self.resource_map[resource_type].remove(facility)
                 
         return True
     
     def get_facility_by_id(self, facility_id: int) -> Optional[StorageFacility]:
         """Find a facility by its ID"""
-        for facility in self.storage_facilities:
-            if facility.id == facility_id:
-                return facility
-        return None
+        return self._facilities_by_id.get(facility_id)
     
     def get_facilities_for_resource(self, resource_type: ResourceType) -> List[StorageFacility]:
         """Get all facilities that can store a specific resource type"""
-        # Update resource map if needed
-        if resource_type not in self.resource_map:
-            self._update_resource_map(resource_type)
-            
-        return self.resource_map.get(resource_type, [])
+        return self.resource_map.get(resource_type, _NO_FACILITIES)
     
     def add_resource(self, resource_type: ResourceType, amount: float) -> float:
         """
@@ -330,19 +691,30 @@ class StorageManager:
         facilities = self.get_facilities_for_resource(resource_type)
         
         # If no facilities can store this resource, nothing can be added
-        if not facilities:
+        if not facilities or amount <= 0:
             return 0.0
-            
-        # Sort facilities by available capacity (most to least)
-        facilities.sort(key=lambda f: f.get_available_capacity(), reverse=True)
         
-        # Distribute the resources
-        remaining = amount
-        total_added = 0.0
+        # Read every facility's free space once; keys then index this list in C
+        space = [facility.available_capacity for facility in facilities]
         
-        for facility in facilities:
-            if remaining <= 0:
-                break
+        # Fast path: the roomiest facility usually takes the whole deposit
+        best = max(range(len(space)), key=space.__getitem__)
+        total_added = facilities[best].add_resource(resource_type, amount)
+        remaining = amount - total_added
+        if remaining <= 0 or total_added <= 0:
+            return total_added  # All stored, or every facility is full
+        space[best] -= total_added
+            
+        # Max-heap on available capacity; the index breaks ties in facility order.
+        # Built per call because facilities also change outside the manager.
+        heap = [(-free, i, facility) for i, (free, facility) in enumerate(zip(space, facilities))]
+        heapq.heapify(heap)
+        
+        # Distribute the rest, most available capacity first
+        while remaining > 0 and heap:
+            neg_space, _, facility = heapq.heappop(heap)
+            if neg_space >= 0:
+                break  # Every remaining facility is full
                 
             added = facility.add_resource(resource_type, remaining)
             total_added += added
@@ -362,17 +734,29 @@ class StorageManager:
             Amount actually removed
         """
         facilities = self.get_facilities_for_resource(resource_type)
+        if not facilities or amount <= 0:
+            return 0.0
         
-        # Sort facilities by available amount of this resource (most to least)
-        facilities.sort(key=lambda f: f.resources.get(resource_type, 0.0), reverse=True)
-        
-        # Take resources from facilities
-        remaining = amount
-        total_removed = 0.0
-        
-        for facility in facilities:
-            if remaining <= 0:
-                break
+        # Read every facility's holding once; keys then index this list in C
+        held = self.table.stock[[facility._row for facility in facilities], resource_type.value].tolist()
+        
+        # Fast path: the largest holding usually covers the whole request
+        best = max(range(len(held)), key=held.__getitem__)
+        total_removed = facilities[best].remove_resource(resource_type, amount)
+        remaining = amount - total_removed
+        if remaining <= 0 or total_removed <= 0:
+            return total_removed  # All taken, or no facility holds any
+        held[best] -= total_removed
+        
+        # Max-heap on the amount of this resource held; the index breaks ties
+        heap = [(-amount_held, i, facility) for i, (amount_held, facility) in enumerate(zip(held, facilities))]
+        heapq.heapify(heap)
+        
+        # Take the rest, largest holdings first
+        while remaining > 0 and heap:
+            neg_held, _, facility = heapq.heappop(heap)
+            if neg_held >= 0:
+                break  # No remaining facility holds any
                 
             removed = facility.remove_resource(resource_type, remaining)
             total_removed += removed
@@ -382,52 +766,76 @@ class StorageManager:
     
     def get_total_resource_amount(self, resource_type: ResourceType) -> float:
         """Get the total amount of a resource type across all storage facilities"""
-        total = 0.0
-        for facility in self.storage_facilities:
-            total += facility.resources.get(resource_type, 0.0)
-        return total
+        if not isinstance(resource_type, ResourceType):
+            return 0.0  # Facilities only store ResourceType members
+        return float(self.table.stock[:self.table.size, resource_type.value].sum())
     
     def get_total_storage_capacity(self) -> float:
         """Get the total storage capacity across all facilities"""
-        return sum(facility.capacity for facility in self.storage_facilities)
+        return float(self.table.capacity[:self.table.size].sum())
     
     def get_available_capacity(self) -> float:
         """Get the total available capacity across all facilities"""
-        return sum(facility.get_available_capacity() for facility in self.storage_facilities)
+        n = self.table.size
+        free = self.table.capacity[:n] - self.table.stock[:n].sum(axis=1)
+        return float(np.maximum(free, 0.0).sum())
     
-    def _update_resource_map(self, resource_type: ResourceType):
-        """Update the map of which facilities can store which resources"""
-        eligible_facilities = []
+    def damage_all(self, damage, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Damage every facility in one pass (e.g. a storm hitting the village).
         
-        for facility in self.storage_facilities:
-            # Check if this facility can store this resource type
-            if isinstance(facility, Warehouse):
-                # Warehouse can store anything
-                eligible_facilities.append(facility)
-            elif isinstance(facility, Granary) and resource_type in [ResourceType.FOOD_WHEAT, ResourceType.FOOD_BERRY, ResourceType.FOOD_FISH]:
-                # Granary for food
-                eligible_facilities.append(facility)
-            elif isinstance(facility, Stockpile) and ResourceType.is_raw_resource(resource_type):
-                # Stockpile for raw resources
-                eligible_facilities.append(facility)
-            elif isinstance(facility, Armory) and resource_type in [ResourceType.WEAPONS, ResourceType.BASIC_TOOLS, ResourceType.ADVANCED_TOOLS]:
-                # Armory for weapons and tools
-                eligible_facilities.append(facility)
-                
-        self.resource_map[resource_type] = eligible_facilities
+        Args:
+            damage: Damage for every facility, or one value per facility in table row order
+            rng: Random generator for the loss rolls (defaults to the world's)
+            
+        Returns:
+            Damage actually taken, per table row
+        """
+        taken, lost = self.table.apply_damage(damage, self.world.rng if rng is None else rng)
+        for row in np.flatnonzero(lost).tolist():
+            self.table.facilities[row]._sync_from_row()
+        return taken
     
     def get_facilities_near(self, position: Tuple[int, int], distance: int) -> List[StorageFacility]:
-        """Get storage facilities within a certain distance of a position"""
+        """
+        Get storage facilities within a certain distance of a position.
+        Only the spatial buckets overlapping the square neighborhood are checked.
+        
+        Args:
+            position: (x, y) center cell
+            distance: Search distance in cells (square neighborhood)
+            
+        Returns:
+            Facilities within range, in the order they were added
+        """
         x, y = position
+        bx0, by0 = self._bucket_of((x - distance, y - distance))
+        bx1, by1 = self._bucket_of((x + distance, y + distance))
+        
+        if (bx1 - bx0 + 1) * (by1 - by0 + 1) <= len(self._spatial):
+            buckets = [self._spatial[key] for key in
+                       ((bx, by) for bx in range(bx0, bx1 + 1) for by in range(by0, by1 + 1))
+                       if key in self._spatial]
+        else:
+            # Large radius: walk the occupied buckets instead of the empty ones
+            buckets = [bucket for (bx, by), bucket in self._spatial.items()
+                       if bx0 <= bx <= bx1 and by0 <= by <= by1]
+        
         nearby = []
+        for bucket in buckets:
+            for facility in bucket:
+                fx, fy = facility.position
+                if abs(fx - x) <= distance and abs(fy - y) <= distance:
+                    nearby.append(facility)
         
-        for facility in self.storage_facilities:
-            fx, fy = facility.position
-            if abs(fx - x) <= distance and abs(fy - y) <= distance:
-                nearby.append(facility)
-                
+        nearby.sort(key=lambda f: f.id)  # Ids are handed out in creation order
         return nearby
     
+    @staticmethod
+    def _bucket_of(position: Tuple[int, int]) -> Tuple[int, int]:
+        """Get the spatial bucket containing a cell"""
+        return position[0] // FACILITY_BUCKET_SIZE, position[1] // FACILITY_BUCKET_SIZE
+    
     def get_facilities_by_type(self, facility_type: str) -> List[StorageFacility]:
         """
         Get all storage facilities of a specific type.
@@ -441,7 +849,31 @@ class StorageManager:
         return [facility for facility in self.storage_facilities 
                 if facility.__class__.__name__ == facility_type]
     
-    def render(self, surface: pygame.Surface):
-        """Render all storage facilities"""
+    def render(self, surface: pygame.Surface, view: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Render all visible storage facilities.
+        Each facility is one cached composite (building plus indicator bars),
+        and all of them are drawn with a single blits() call.
+        
+        Args:
+            surface: The surface to render on
+            view: Optional (x0, y0, x1, y1) cell bounds to draw (end-exclusive);
+                facilities outside the surface's clip rect are always skipped
+        """
+        cell_size = self.world.config.cell_size
+        view_rect = surface.get_clip()
+        if view is not None:
+            x0, y0, x1, y1 = view
+            view_rect = view_rect.clip(pygame.Rect(x0 * cell_size, y0 * cell_size,
+                                                   (x1 - x0) * cell_size, (y1 - y0) * cell_size))
+        
+        sprites = []  # (composite, rect) pairs
+        
         for facility in self.storage_facilities:
-            facility.render(surface) 
\ No newline at end of file
+            rect = facility.pixel_rect
+            if not view_rect.colliderect(rect):
+                continue  # Off-screen; the indicators lie inside the building
+                
+            sprites.append((facility.get_composite(), rect))
+            
+        surface.blits(sprites, doreturn=False) 
\ No newline at end of file
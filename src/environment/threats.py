@@ -1,6 +1,12 @@
-import random
+from collections import deque
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
+import numpy as np
+import pygame
+
+from src.environment.resources import ResourceType
+from src.utils.rng import UniformBuffer, shared_rng
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
 
 class ThreatType(Enum):
     """Types of threats that can endanger the village"""
@@ -15,30 +21,41 @@ class ThreatType(Enum):
     @classmethod
     def get_difficulty(cls, threat_type):
         """Get difficulty rating for a threat type (1-10 scale)"""
-        difficulty_map = {
-            cls.RAIDERS: 3,
-            cls.WOLVES: 2,
-            cls.BEAR: 4,
-            cls.ORC_PARTY: 5,
-            cls.ORC_RAIDING_PARTY: 7,
-            cls.TROLL: 6,
-            cls.DRAGON: 10
-        }
-        return difficulty_map.get(threat_type, 1)
+        return _DIFFICULTY.get(threat_type, 1)
     
     @classmethod
-    def get_resource_targets(cls, threat_type):
+    def get_resource_targets(cls, threat_type) -> List[ResourceType]:
         """Get the resources this threat type tends to target"""
-        target_map = {
-            cls.RAIDERS: ["FOOD_WHEAT", "IRON_INGOT", "BASIC_TOOLS", "WEAPONS"],
-            cls.WOLVES: ["FOOD_WHEAT"],
-            cls.BEAR: ["FOOD_WHEAT", "FOOD_BERRY"],
-            cls.ORC_PARTY: ["FOOD_WHEAT", "WEAPONS"],
-            cls.ORC_RAIDING_PARTY: ["FOOD_WHEAT", "IRON_INGOT", "WEAPONS", "ADVANCED_TOOLS"],
-            cls.TROLL: ["FOOD_WHEAT", "STONE"],
-            cls.DRAGON: ["FOOD_WHEAT", "IRON_INGOT", "WEAPONS", "ADVANCED_TOOLS"]
-        }
-        return target_map.get(threat_type, ["FOOD_WHEAT"])
+        return _RESOURCE_TARGETS.get(threat_type, _DEFAULT_RESOURCE_TARGETS)
+
+# Difficulty rating of each threat type (1-10 scale)
+_DIFFICULTY = {
+    ThreatType.RAIDERS: 3,
+    ThreatType.WOLVES: 2,
+    ThreatType.BEAR: 4,
+    ThreatType.ORC_PARTY: 5,
+    ThreatType.ORC_RAIDING_PARTY: 7,
+    ThreatType.TROLL: 6,
+    ThreatType.DRAGON: 10
+}
+
+# Resources each threat type tends to target, by ResourceType name
+_RESOURCE_TARGET_NAMES = {
+    ThreatType.RAIDERS: ["FOOD_WHEAT", "IRON_INGOT", "BASIC_TOOLS", "WEAPONS"],
+    ThreatType.WOLVES: ["FOOD_WHEAT"],
+    ThreatType.BEAR: ["FOOD_WHEAT", "FOOD_BERRY"],
+    ThreatType.ORC_PARTY: ["FOOD_WHEAT", "WEAPONS"],
+    ThreatType.ORC_RAIDING_PARTY: ["FOOD_WHEAT", "IRON_INGOT", "WEAPONS", "ADVANCED_TOOLS"],
+    ThreatType.TROLL: ["FOOD_WHEAT", "STONE"],
+    ThreatType.DRAGON: ["FOOD_WHEAT", "IRON_INGOT", "WEAPONS", "ADVANCED_TOOLS"]
+}
+
+# The same targets resolved to ResourceType members once, so looting needs no lookups
+_RESOURCE_TARGETS = {
+    threat_type: [ResourceType[name] for name in names]
+    for threat_type, names in _RESOURCE_TARGET_NAMES.items()
+}
+_DEFAULT_RESOURCE_TARGETS = [ResourceType.FOOD_WHEAT]
 
 class ThreatStatus(Enum):
     """Status of a threat"""
@@ -48,10 +65,380 @@ class ThreatStatus(Enum):
     FLED = 4           # Has been driven away
     VICTORIOUS = 5     # Has successfully raided and left
 
+# ThreatStatus members indexed by value, for decoding the table's status column
+_STATUS_BY_VALUE = (None,) + tuple(ThreatStatus)
+
+# Status values as plain ints, for the update kernel
+_APPROACHING = ThreatStatus.APPROACHING.value
+_ATTACKING = ThreatStatus.ATTACKING.value
+
+# Icon colors for each threat type
+THREAT_COLORS = {
+    ThreatType.RAIDERS: (139, 0, 0),      # Dark red
+    ThreatType.WOLVES: (105, 105, 105),   # Gray
+    ThreatType.BEAR: (101, 67, 33),       # Brown
+    ThreatType.ORC_PARTY: (0, 100, 0),    # Dark green
+    ThreatType.ORC_RAIDING_PARTY: (0, 128, 0),  # Green
+    ThreatType.TROLL: (72, 61, 139),      # Dark slate blue
+    ThreatType.DRAGON: (255, 0, 0)        # Red
+}
+DEFAULT_THREAT_COLOR = (255, 0, 0)
+HEALTH_BAR_COLOR = (255, 0, 0)
+
+# Pre-drawn threat icons with their offset from the cell corner, keyed by (threat type, cell_size)
+_ICON_CACHE: Dict[Tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+
+def _get_threat_icon(threat_type: ThreatType, cell_size: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """
+    Get the cached icon for a threat type, drawing it on first use.
+    The icon is a triangle sized by the threat's difficulty.
+    
+    Args:
+        threat_type: Type of the threat
+        cell_size: Pixel size of a cell
+        
+    Returns:
+        Tuple of (icon surface, pixel offset of the icon within its cell)
+    """
+    key = (threat_type, cell_size)
+    cached = _ICON_CACHE.get(key)
+    if cached is None:
+        color = THREAT_COLORS.get(threat_type, DEFAULT_THREAT_COLOR)
+        difficulty = ThreatType.get_difficulty(threat_type)
+        size = int(cell_size * (0.3 + (difficulty / 20)))
+        
+        # Triangle's bounding box, with the apex at the top center
+        icon = pygame.Surface((2 * size + 1, size + size // 2 + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(icon, color, [(size, 0), (0, size + size // 2), (2 * size, size + size // 2)])
+        
+        offset = cell_size // 2 - size
+        cached = (icon, (offset, offset))
+        _ICON_CACHE[key] = cached
+    return cached
+
+# Pre-filled health bars, keyed by (width, height)
+_HEALTH_BAR_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+def _get_health_bar(width: int, height: int) -> pygame.Surface:
+    """
+    Get the cached health bar surface of a given size.
+    
+    Args:
+        width: Bar width in pixels
+        height: Bar height in pixels
+        
+    Returns:
+        Surface filled with the health bar color
+    """
+    key = (width, height)
+    bar = _HEALTH_BAR_CACHE.get(key)
+    if bar is None:
+        bar = pygame.Surface(key)
+        bar.fill(HEALTH_BAR_COLOR)
+        _HEALTH_BAR_CACHE[key] = bar
+    return bar
+
+def _draw_int(draws: UniformBuffer, low: int, high: int) -> int:
+    """Get a uniform integer in [low, high] (inclusive, like random.randint) from [0, 1) draws"""
+    return low + int(draws.next() * (high - low + 1))
+
+# Side length, in cells, of the spatial buckets used for nearby-threat queries
+THREAT_BUCKET_SIZE = 16
+
+# Below this many threats a full scan of the position column beats the bucket index
+SPATIAL_INDEX_MIN_THREATS = 64
+
+# Multiplier combining bucket coordinates into one sortable key (bx * stride + by)
+_BUCKET_STRIDE = 1 << 20
+
+@njit(parallel=True, cache=True)
+def _update_threats_kernel(positions, targets, has_target, approach_times, statuses,
+                           time_delta, max_x, max_y, arrived, moved):
+    """Count down approaching rows and step attacking rows one cell toward their targets"""
+    for i in prange(positions.shape[0]):
+        arrived[i] = False
+        moved[i] = False
+        status = statuses[i]
+        
+        if status == _APPROACHING:
+            approach_times[i] -= time_delta
+            if approach_times[i] <= 0:
+                statuses[i] = _ATTACKING
+                arrived[i] = True
+        
+        elif status == _ATTACKING and has_target[i]:
+            for axis in range(2):
+                value = positions[i, axis]
+                target = targets[i, axis]
+                if target > value:
+                    value += 1
+                elif target < value:
+                    value -= 1
+                
+                limit = max_x if axis == 0 else max_y
+                positions[i, axis] = min(max(value, 0), limit)
+            moved[i] = True
+
+class ThreatTable:
+    """
+    Structure-of-Arrays storage for threat state.
+    Each threat owns one row, so queries over every threat (e.g. which are
+    near a position) run as array operations.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Initialize an empty threat table.
+        
+        Args:
+            capacity: Number of rows to preallocate (grows automatically)
+        """
+        capacity = max(1, capacity)
+        self.size = 0
+        self.threats: List["Threat"] = []  # Row index -> Threat
+        
+        self.positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.statuses = np.zeros(capacity, dtype=np.int8)  # ThreatStatus values
+        self.approach_times = np.zeros(capacity, dtype=np.float32)  # Hours until arrival
+        self.health = np.zeros(capacity, dtype=np.float32)
+        self.damage_done = np.zeros(capacity, dtype=np.float32)
+        self.strength = np.zeros(capacity, dtype=np.float32)  # Strength multiplier
+        self.base_strength = np.zeros(capacity, dtype=np.float32)
+        self.aggression = np.zeros(capacity, dtype=np.float32)  # 0.5-1.0, higher = more aggressive
+        self.targets = np.zeros((capacity, 2), dtype=np.int32)  # Target within the village
+        self.has_target = np.zeros(capacity, dtype=bool)
+        
+        # Rows sorted by spatial bucket, with their bucket keys; rebuilt lazily after positions change
+        self._bucket_keys: Optional[np.ndarray] = None
+        self._bucket_rows: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _grow(self, capacity: int):
+        """Reallocate all arrays to hold at least `capacity` rows"""
+        def grown(array):
+            new_array = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new_array[:self.size] = array[:self.size]
+            return new_array
+        
+        self.positions = grown(self.positions)
+        self.statuses = grown(self.statuses)
+        self.approach_times = grown(self.approach_times)
+        self.health = grown(self.health)
+        self.damage_done = grown(self.damage_done)
+        self.strength = grown(self.strength)
+        self.base_strength = grown(self.base_strength)
+        self.aggression = grown(self.aggression)
+        self.targets = grown(self.targets)
+        self.has_target = grown(self.has_target)
+    
+    def allocate(self, threat: "Threat") -> int:
+        """
+        Reserve a zeroed row for a threat.
+        
+        Args:
+            threat: The threat that will own the row
+            
+        Returns:
+            Index of the new row
+        """
+        if self.size == len(self.positions):
+            self._grow(2 * len(self.positions))
+        
+        idx = self.size
+        self.size += 1
+        self.threats.append(threat)
+        self._bucket_keys = None
+        
+        self.positions[idx] = 0
+        self.statuses[idx] = ThreatStatus.APPROACHING.value
+        self.approach_times[idx] = 0.0
+        self.health[idx] = 0.0
+        self.damage_done[idx] = 0.0
+        self.strength[idx] = 0.0
+        self.base_strength[idx] = 0.0
+        self.aggression[idx] = 0.0
+        self.targets[idx] = 0
+        self.has_target[idx] = False
+        return idx
+    
+    def release(self, idx: int):
+        """
+        Free a row by moving the last row into its place.
+        
+        Args:
+            idx: Index of the row to free
+        """
+        last = self.size - 1
+        if idx != last:
+            self._copy_row(self, last, idx)
+            moved = self.threats[last]
+            self.threats[idx] = moved
+            moved._row = idx
+        
+        self.threats.pop()
+        self.size -= 1
+        self._bucket_keys = None
+    
+    def adopt(self, threat: "Threat"):
+        """
+        Move a threat's state from its current table into this one.
+        
+        Args:
+            threat: The threat to adopt
+        """
+        old_table, old_idx = threat._table, threat._row
+        if old_table is self:
+            return
+        
+        idx = self.allocate(threat)
+        self._copy_row(old_table, old_idx, idx)
+        old_table.release(old_idx)
+        
+        threat._table = self
+        threat._row = idx
+    
+    def _copy_row(self, source: "ThreatTable", src_idx: int, dst_idx: int):
+        """Copy one row of state from `source` into this table"""
+        self.positions[dst_idx] = source.positions[src_idx]
+        self.statuses[dst_idx] = source.statuses[src_idx]
+        self.approach_times[dst_idx] = source.approach_times[src_idx]
+        self.health[dst_idx] = source.health[src_idx]
+        self.damage_done[dst_idx] = source.damage_done[src_idx]
+        self.strength[dst_idx] = source.strength[src_idx]
+        self.base_strength[dst_idx] = source.base_strength[src_idx]
+        self.aggression[dst_idx] = source.aggression[src_idx]
+        self.targets[dst_idx] = source.targets[src_idx]
+        self.has_target[dst_idx] = source.has_target[src_idx]
+    
+    def update(self, time_delta: float, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Advance every threat's movement in one pass.
+        Approaching threats count down their arrival time and switch to
+        attacking when it runs out; attacking threats that already have a
+        target step one cell toward it, staying within the world.
+        
+        Args:
+            time_delta: Time elapsed in hours
+            width: World width in cells
+            height: World height in cells
+            
+        Returns:
+            Tuple of (row indices of the threats that arrived,
+            boolean mask of the rows that moved)
+        """
+        n = self.size
+        if n == 0:
+            return np.empty(0, dtype=np.intp), np.zeros(0, dtype=bool)
+        
+        time_delta = np.float32(time_delta)  # Keep the countdown in float32 on both paths
+        if NUMBA_AVAILABLE:
+            arrived = np.empty(n, dtype=bool)
+            moved = np.empty(n, dtype=bool)
+            _update_threats_kernel(
+                self.positions[:n], self.targets[:n], self.has_target[:n],
+                self.approach_times[:n], self.statuses[:n],
+                time_delta, width - 1, height - 1, arrived, moved
+            )
+            if moved.any():
+                self._bucket_keys = None
+            return np.flatnonzero(arrived), moved
+        
+        # Without Numba the kernel is a plain Python loop; use masks instead
+        statuses = self.statuses[:n]
+        moved = (statuses == _ATTACKING) & self.has_target[:n]
+        
+        approaching = np.flatnonzero(statuses == _APPROACHING)
+        self.approach_times[approaching] -= time_delta
+        arrived = approaching[self.approach_times[approaching] <= 0]
+        statuses[arrived] = _ATTACKING
+        
+        positions = self.positions[:n]
+        steps = np.sign(self.targets[:n][moved] - positions[moved])
+        positions[moved] = np.clip(positions[moved] + steps, 0, (width - 1, height - 1))
+        if moved.any():
+            self._bucket_keys = None
+        return arrived, moved
+    
+    def rows_near(self, position: Tuple[int, int], radius: int) -> np.ndarray:
+        """
+        Find the rows within a square radius of a position.
+        
+        Args:
+            position: (x, y) center cell
+            radius: Search distance in cells (Chebyshev)
+            
+        Returns:
+            Array of row indices, in ascending order
+        """
+        if self.size < SPATIAL_INDEX_MIN_THREATS:
+            offsets = np.abs(self.positions[:self.size] - np.asarray(position, dtype=np.int32))
+            return np.flatnonzero(offsets.max(axis=1) <= radius)
+        
+        if self._bucket_keys is None:
+            self._build_bucket_index()
+        
+        # Each column of buckets covering the square is one contiguous run of the sorted keys
+        x, y = position
+        bx = np.arange((x - radius) // THREAT_BUCKET_SIZE, (x + radius) // THREAT_BUCKET_SIZE + 1, dtype=np.int64)
+        by0, by1 = (y - radius) // THREAT_BUCKET_SIZE, (y + radius) // THREAT_BUCKET_SIZE
+        starts = np.searchsorted(self._bucket_keys, bx * _BUCKET_STRIDE + by0, side="left")
+        ends = np.searchsorted(self._bucket_keys, bx * _BUCKET_STRIDE + by1, side="right")
+        
+        runs = [self._bucket_rows[start:end] for start, end in zip(starts.tolist(), ends.tolist()) if end > start]
+        if not runs:
+            return np.empty(0, dtype=np.intp)
+        candidates = np.concatenate(runs)
+        
+        # Buckets overhang the square, so check the candidates exactly
+        offsets = np.abs(self.positions[candidates] - np.asarray(position, dtype=np.int32))
+        return np.sort(candidates[offsets.max(axis=1) <= radius])
+    
+    def _build_bucket_index(self):
+        """Sort the rows by spatial bucket so range queries only visit nearby buckets"""
+        positions = self.positions[:self.size].astype(np.int64)
+        keys = (positions[:, 0] // THREAT_BUCKET_SIZE) * _BUCKET_STRIDE + positions[:, 1] // THREAT_BUCKET_SIZE
+        order = np.argsort(keys, kind="stable")
+        self._bucket_keys = keys[order]
+        self._bucket_rows = order
+
+def _float_column(column: str, doc: str) -> property:
+    """
+    Make a property that reads and writes one float column of a threat's table row.
+    
+    Args:
+        column: Name of the ThreatTable array
+        doc: Docstring for the property
+        
+    Returns:
+        The property
+    """
+    def get(self) -> float:
+        return float(getattr(self._table, column)[self._row])
+    
+    def set(self, value: float):
+        getattr(self._table, column)[self._row] = value
+    
+    return property(get, set, doc=doc)
+
 class Threat:
-    """Represents a threat to the village"""
+    """
+    Represents a threat to the village.
+    Numeric state lives in a ThreatTable row; the threat is a handle onto it.
+    """
     
-    def __init__(self, threat_type: ThreatType, position: Tuple[int, int], strength: float = 1.0):
+    __slots__ = ("_table", "_row", "_draws", "threat_type", "loot", "id", "difficulty", "size")
+    
+    health = _float_column("health", "Remaining health")
+    damage_done = _float_column("damage_done", "Total building damage dealt")
+    strength = _float_column("strength", "Strength multiplier (1.0 is baseline)")
+    base_strength = _float_column("base_strength", "Strength from the threat type's difficulty")
+    aggression = _float_column("aggression", "0.5-1.0, higher = more aggressive")
+    approach_time = _float_column("approach_times", "Hours until the threat arrives")
+    
+    def __init__(self, threat_type: ThreatType, position: Tuple[int, int], strength: float = 1.0,
+                 draws: Optional[UniformBuffer] = None):
         """
         Initialize a threat.
         
@@ -59,45 +446,89 @@ class Threat:
             threat_type: Type of the threat
             position: (x, y) position in the world grid
             strength: Strength multiplier (1.0 is baseline)
+            draws: Uniform [0, 1) draws for the threat's random rolls (e.g.
+                world.threat_draws); drawn from the shared generator if not provided
         """
+        # Numeric state lives in a table row; a private one-row table until a manager adopts it
+        self._table = ThreatTable(capacity=1)
+        self._row = self._table.allocate(self)
+        self._draws = draws if draws is not None else UniformBuffer(shared_rng(), 0.0, 1.0, size=64)
+        
         self.threat_type = threat_type
         self.position = position
         self.strength = strength
         self.status = ThreatStatus.APPROACHING
         self.target_position = None  # Target within village
-        self.approach_time = random.randint(3, 12)  # Hours until arrival
-        self.aggression = 0.5 + (random.random() * 0.5)  # 0.5-1.0, higher = more aggressive
+        self.approach_time = _draw_int(self._draws, 3, 12)
+        self.aggression = 0.5 + (self._draws.next() * 0.5)
         self.loot = {}  # Resources stolen
         self.health = 100.0 * strength
         self.damage_done = 0.0
-        self.id = random.randint(1000, 9999)
+        self.id = _draw_int(self._draws, 1000, 9999)
         
         # Calculated properties
+        self.difficulty = ThreatType.get_difficulty(threat_type)
         self.base_strength = self._calculate_base_strength()
         self.size = self._calculate_size()
         
+    @property
+    def position(self) -> Tuple[int, int]:
+        """(x, y) position in the world grid"""
+        x, y = self._table.positions[self._row].tolist()
+        return (x, y)
+    
+    @position.setter
+    def position(self, value: Tuple[int, int]):
+        self._table.positions[self._row] = value
+        self._table._bucket_keys = None
+    
+    @property
+    def status(self) -> ThreatStatus:
+        return _STATUS_BY_VALUE[self._table.statuses[self._row]]
+    
+    @status.setter
+    def status(self, value: ThreatStatus):
+        self._table.statuses[self._row] = value.value
+    
+    @property
+    def target_position(self) -> Optional[Tuple[int, int]]:
+        """(x, y) target within the village, or None"""
+        if not self._table.has_target[self._row]:
+            return None
+        x, y = self._table.targets[self._row].tolist()
+        return (x, y)
+    
+    @target_position.setter
+    def target_position(self, value: Optional[Tuple[int, int]]):
+        if value is None:
+            self._table.has_target[self._row] = False
+        else:
+            self._table.targets[self._row] = value
+            self._table.has_target[self._row] = True
+    
     def _calculate_base_strength(self) -> float:
         """Calculate the base strength value based on threat type"""
-        difficulty = ThreatType.get_difficulty(self.threat_type)
-        return difficulty * 10.0  # 10-100 base strength
+        return self.difficulty * 10.0  # 10-100 base strength
     
     def _calculate_size(self) -> int:
         """Calculate the size of the threat (number of individual units)"""
         if self.threat_type in [ThreatType.BEAR, ThreatType.TROLL, ThreatType.DRAGON]:
             return 1  # Single large creature
         elif self.threat_type == ThreatType.WOLVES:
-            return random.randint(3, 8)  # Pack of wolves
+            return _draw_int(self._draws, 3, 8)  # Pack of wolves
         elif self.threat_type == ThreatType.RAIDERS:
-            return random.randint(4, 10)  # Group of raiders
+            return _draw_int(self._draws, 4, 10)  # Group of raiders
         elif self.threat_type == ThreatType.ORC_PARTY:
-            return random.randint(3, 6)  # Small orc group
+            return _draw_int(self._draws, 3, 6)  # Small orc group
         elif self.threat_type == ThreatType.ORC_RAIDING_PARTY:
-            return random.randint(8, 15)  # Large orc group
+            return _draw_int(self._draws, 8, 15)  # Large orc group
         return 1
     
     def approach(self, time_delta: float) -> bool:
         """
         Progress the approach of the threat toward the village.
+        ThreatManager advances all threats at once through its table; this
+        is for threats updated on their own.
         
         Args:
             time_delta: Time elapsed in hours
@@ -124,30 +555,33 @@ class Threat:
             damage: Amount of damage to apply
             
         Returns:
-            True if the threat is defeated, False otherwise
+            True if the threat is defeated or flees, False otherwise
         """
         self.health -= damage
+        health = self.health
         
-        # Check if we should flee
-        if self.health <= self.base_strength * 0.3 and random.random() > self.aggression:
-            self.status = ThreatStatus.FLED
-            return True
-            
         # Check if defeated
-        if self.health <= 0:
+        if health <= 0:
             self.status = ThreatStatus.DEFEATED
             self.health = 0
             return True
+        
+        # Check if we should flee; only wounded threats roll for it
+        if health <= self.base_strength * 0.3 and self._draws.next() > self.aggression:
+            self.status = ThreatStatus.FLED
+            return True
             
         return False
     
-    def attack_village(self, world, time_delta: float) -> Dict[str, Any]:
+    def attack_village(self, world, time_delta: float, moved: bool = False) -> Dict[str, Any]:
         """
         Process an attack on the village.
         
         Args:
             world: Reference to the world
             time_delta: Time elapsed in hours
+            moved: Whether this tick's step toward the target was already taken
+                (ThreatManager moves all targeted threats at once)
             
         Returns:
             Dictionary with attack results
@@ -163,7 +597,7 @@ class Threat:
             self._select_target(world)
             
         # If we have a target, move toward it
-        if self.target_position:
+        if self.target_position and not moved:
             self._move_toward_target(world)
             
         # Check if at target position
@@ -193,8 +627,9 @@ class Threat:
         # First, check if there are buildings
         if world.buildings:
             # 70% chance to target a building
-            if random.random() < 0.7:
-                target_building = random.choice(world.buildings)
+            if self._draws.next() < 0.7:
+                buildings = world.buildings
+                target_building = buildings[int(self._draws.next() * len(buildings))]
                 self.target_position = target_building.position
                 return
         
@@ -210,9 +645,9 @@ class Threat:
         current_x, current_y = self.position
         target_x, target_y = self.target_position
         
-        # Move toward target
-        dx = 1 if target_x > current_x else (-1 if target_x < current_x else 0)
-        dy = 1 if target_y > current_y else (-1 if target_y < current_y else 0)
+        # Move one cell toward target (booleans as ints give the sign without branching)
+        dx = (target_x > current_x) - (target_x < current_x)
+        dy = (target_y > current_y) - (target_y < current_y)
         
         new_x, new_y = current_x + dx, current_y + dy
         
@@ -236,11 +671,10 @@ class Threat:
         loot_results = {}
         
         # Check if there's a building at this location
-        buildings_at_location = [b for b in world.buildings if b.position == self.position]
+        building = world.buildings_by_position.get(self.position)
         
-        if buildings_at_location:
+        if building is not None:
             # Damage building
-            building = buildings_at_location[0]
             damage = min(damage_potential, building.condition)
             building.condition -= damage
             self.damage_done += damage
@@ -249,42 +683,13 @@ class Threat:
             if building.condition <= 0:
                 # Building destroyed - loot some resources
                 resources_to_loot = ThreatType.get_resource_targets(self.threat_type)
+                loot_rolls = world.rng.integers(5, 21, size=len(resources_to_loot)).tolist()
                 
-                for resource_name in resources_to_loot:
-                    # Try to convert string to ResourceType enum
-                    try:
-                        from src.environment.resources import ResourceType
-                        resource_type = getattr(ResourceType, resource_name)
-                        
-                        # Take some resources
-                        amount = min(
-                            world.resource_manager.village_resources.get(resource_type, 0),
-                            random.randint(5, 20) * self.strength
-                        )
-                        
-                        if amount > 0:
-                            taken = world.resource_manager.take_from_village_storage(resource_type, amount)
-                            if taken > 0:
-                                if resource_type not in self.loot:
-                                    self.loot[resource_type] = 0
-                                self.loot[resource_type] += taken
-                                loot_results[resource_name] = taken
-                    except (AttributeError, ImportError):
-                        continue
-        else:
-            # No building, just try to loot resources
-            resources_to_loot = ThreatType.get_resource_targets(self.threat_type)
-            
-            for resource_name in resources_to_loot:
-                # Try to convert string to ResourceType enum
-                try:
-                    from src.environment.resources import ResourceType
-                    resource_type = getattr(ResourceType, resource_name)
-                    
+                for resource_type, roll in zip(resources_to_loot, loot_rolls):
                     # Take some resources
                     amount = min(
                         world.resource_manager.village_resources.get(resource_type, 0),
-                        random.randint(3, 10) * self.strength
+                        roll * self.strength
                     )
                     
                     if amount > 0:
@@ -293,9 +698,26 @@ class Threat:
                             if resource_type not in self.loot:
                                 self.loot[resource_type] = 0
                             self.loot[resource_type] += taken
-                            loot_results[resource_name] = taken
-                except (AttributeError, ImportError):
-                    continue
+                            loot_results[resource_type.name] = taken
+        else:
+            # No building, just try to loot resources
+            resources_to_loot = ThreatType.get_resource_targets(self.threat_type)
+            loot_rolls = world.rng.integers(3, 11, size=len(resources_to_loot)).tolist()
+            
+            for resource_type, roll in zip(resources_to_loot, loot_rolls):
+                # Take some resources
+                amount = min(
+                    world.resource_manager.village_resources.get(resource_type, 0),
+                    roll * self.strength
+                )
+                
+                if amount > 0:
+                    taken = world.resource_manager.take_from_village_storage(resource_type, amount)
+                    if taken > 0:
+                        if resource_type not in self.loot:
+                            self.loot[resource_type] = 0
+                        self.loot[resource_type] += taken
+                        loot_results[resource_type.name] = taken
         
         # Check if we've looted enough and should leave
         total_loot = sum(self.loot.values())
@@ -306,46 +728,43 @@ class Threat:
     
     def render(self, surface, cell_size: int):
         """Render the threat on the given surface"""
-        import pygame
+        surface.blits(self.get_blits(cell_size), doreturn=False)
+    
+    def get_blits(self, cell_size: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Get the (surface, position) pairs that draw this threat, for batching into Surface.blits.
         
+        Args:
+            cell_size: Pixel size of a cell
+            
+        Returns:
+            The icon and, if the threat is hurt, its health bar
+        """
         x, y = self.position
+        px, py = x * cell_size, y * cell_size
         
-        # Different colors for different threat types
-        color_map = {
-            ThreatType.RAIDERS: (139, 0, 0),      # Dark red
-            ThreatType.WOLVES: (105, 105, 105),   # Gray
-            ThreatType.BEAR: (101, 67, 33),       # Brown
-            ThreatType.ORC_PARTY: (0, 100, 0),    # Dark green
-            ThreatType.ORC_RAIDING_PARTY: (0, 128, 0),  # Green
-            ThreatType.TROLL: (72, 61, 139),      # Dark slate blue
-            ThreatType.DRAGON: (255, 0, 0)        # Red
-        }
-        
-        color = color_map.get(self.threat_type, (255, 0, 0))
-        
-        # Draw threat icon - size based on difficulty
-        difficulty = ThreatType.get_difficulty(self.threat_type)
-        size = int(cell_size * (0.3 + (difficulty / 20)))
+        # Threat icon - size based on difficulty
+        icon, (dx, dy) = _get_threat_icon(self.threat_type, cell_size)
+        blits = [(icon, (px + dx, py + dy))]
         
-        pygame.draw.polygon(
-            surface, 
-            color,
-            [
-                (x * cell_size + cell_size // 2, y * cell_size + cell_size // 2 - size),
-                (x * cell_size + cell_size // 2 - size, y * cell_size + cell_size // 2 + size // 2),
-                (x * cell_size + cell_size // 2 + size, y * cell_size + cell_size // 2 + size // 2)
-            ]
-        )
-        
-        # Draw health bar
+        # Health bar
         health_percent = self.health / (self.base_strength * self.strength)
         if health_percent < 1.0:
-            bar_width = int(cell_size * 0.8 * health_percent)
-            pygame.draw.rect(
-                surface,
-                (255, 0, 0),
-                (x * cell_size + cell_size // 10, y * cell_size, bar_width, cell_size // 10)
-            )
+            bar_width = max(0, int(cell_size * 0.8 * health_percent))
+            tenth = cell_size // 10
+            blits.append((_get_health_bar(bar_width, tenth), (px + tenth, py)))
+        return blits
+
+# Direction names by (sign of dx, sign of dy, |dx| > |dy|) relative to the village center.
+# The predominant axis decides; ties and the center itself read as north-south.
+_DIRECTION_NAMES = {
+    (sx, sy, horizontal): ("east" if sx > 0 else "west") if horizontal else ("north" if sy < 0 else "south")
+    for sx in (-1, 0, 1) for sy in (-1, 0, 1) for horizontal in (False, True)
+}
+
+# Most notifications kept between drain_events calls; the oldest are dropped
+# first, so runs that never drain (headless, RL) use bounded memory
+MAX_PENDING_EVENTS = 256
 
 class ThreatManager:
     """Manages threats to the village"""
@@ -360,14 +779,22 @@ class ThreatManager:
         """
         self.world = world
         self.config = config
+        self.draws = world.threat_draws  # Uniform [0, 1) draws for generation rolls, shared with new threats
+        self.table = ThreatTable()  # SoA storage for current threats
         self.threats = []
         self.defeated_threats = []
         self.active_threats = []
+        self._threats_by_id: Dict[int, Threat] = {}  # Current threats by ID
+        self._defeated_by_id: Dict[int, Threat] = {}  # Defeated threats by ID
+        
+        # Pending (kind, threat ID, message) notifications, collected instead of printed
+        self.events: deque = deque(maxlen=MAX_PENDING_EVENTS)
         
         # Threat generation parameters
         self.base_threat_chance = config.get('base_threat_chance', 0.01)  # Chance per day
         self.threat_scaling_factor = config.get('threat_scaling_factor', 0.02)  # Increases with village size
         self.last_threat_day = 0
+        self._next_threat_check_tick = 0  # First tick of the next day to check for threats
         
         # Min days between threats (to avoid overwhelming the village)
         self.min_days_between_threats = config.get('min_days_between_threats', 10)
@@ -388,43 +815,73 @@ class ThreatManager:
             time_delta: Time elapsed in hours
         """
         # Check for new threats - once per day at midnight
-        if (self.world.time_system.get_hour() == 0 and 
-            self.world.time_system.get_minute() == 0):
+        time_system = self.world.time_system
+        if time_system.current_tick >= self._next_threat_check_tick:
             self._check_for_new_threats()
+            
+            ticks_per_day = time_system.ticks_per_hour * time_system.hours_per_day
+            self._next_threat_check_tick = (time_system.current_tick // ticks_per_day + 1) * ticks_per_day
+        
+        # Count down approaching threats and move targeted attackers all at once
+        table_threats = self.table.threats
+        arrived_rows, moved = self.table.update(time_delta, self.world.width, self.world.height)
+        arrived = {table_threats[row] for row in arrived_rows.tolist()}
+        moved = moved.tolist()
         
-        # Update existing threats
-        for threat in list(self.threats):
-            if threat.status == ThreatStatus.APPROACHING:
-                # Check if threat has arrived
-                if threat.approach(time_delta):
-                    # Alert village
-                    self.active_threats.append(threat)
-                    print(f"Alert! {threat.threat_type.name} approaching from the {self._get_direction_name(threat.position)}!")
+        # Update existing threats; finished ones are swept out after the loop, so the list
+        # is never mutated while iterating and needs no snapshot
+        finished = set()
+        for threat in self.threats:
+            if threat in arrived:
+                # Alert village
+                self.active_threats.append(threat)
+                self.events.append((
+                    "alert", threat.id,
+                    f"Alert! {threat.threat_type.name} approaching from the {self._get_direction_name(threat.position)}!"
+                ))
             
             elif threat.status == ThreatStatus.ATTACKING:
                 # Process attack
-                attack_results = threat.attack_village(self.world, time_delta)
+                attack_results = threat.attack_village(self.world, time_delta, moved=moved[threat._row])
                 
                 # Check for status changes
                 if threat.status in [ThreatStatus.DEFEATED, ThreatStatus.FLED, ThreatStatus.VICTORIOUS]:
-                    self.active_threats.remove(threat)
-                    self.defeated_threats.append(threat)
-                    self.threats.remove(threat)
+                    finished.add(threat)
+                    self._add_defeated(threat)
                     
                     status_message = "was defeated!" if threat.status == ThreatStatus.DEFEATED else \
                                     "has fled!" if threat.status == ThreatStatus.FLED else \
                                     "has successfully raided the village!"
                     
-                    print(f"The {threat.threat_type.name} {status_message}")
+                    self.events.append((threat.status.name.lower(), threat.id, f"The {threat.threat_type.name} {status_message}"))
             
             elif threat.status in [ThreatStatus.DEFEATED, ThreatStatus.FLED, ThreatStatus.VICTORIOUS]:
-                # Remove from active threats
-                if threat in self.active_threats:
-                    self.active_threats.remove(threat)
-                if threat not in self.defeated_threats:
-                    self.defeated_threats.append(threat)
-                if threat in self.threats:
-                    self.threats.remove(threat)
+                # Finished outside the attack loop (e.g. damaged by a guard)
+                finished.add(threat)
+                self._add_defeated(threat)
+        
+        if finished:
+            self._remove_threats(finished)
+    
+    def _add_defeated(self, threat: Threat):
+        """Record a threat that is no longer a danger"""
+        self.defeated_threats.append(threat)
+        self._defeated_by_id[threat.id] = threat
+    
+    def _remove_threats(self, finished: set):
+        """
+        Drop threats from the current and active lists in a single pass each,
+        giving each its own table row again.
+        
+        Args:
+            finished: The threats to remove
+        """
+        self.threats[:] = [threat for threat in self.threats if threat not in finished]
+        self.active_threats[:] = [threat for threat in self.active_threats if threat not in finished]
+        
+        for threat in finished:
+            del self._threats_by_id[threat.id]
+            ThreatTable(capacity=1).adopt(threat)
     
     def _check_for_new_threats(self):
         """Check for and potentially generate new threats"""
@@ -445,7 +902,7 @@ class ThreatManager:
         threat_chance = self.base_threat_chance * season_modifier * village_size_factor
         
         # Check if a threat occurs
-        if random.random() < threat_chance:
+        if self.draws.next() < threat_chance:
             self._generate_threat()
             self.last_threat_day = current_day
     
@@ -455,19 +912,29 @@ class ThreatManager:
         village_strength = self._estimate_village_strength()
         possible_threats = self._get_possible_threats(village_strength)
         
-        threat_type = random.choice(possible_threats)
+        threat_type = possible_threats[int(self.draws.next() * len(possible_threats))]
         
         # Determine threat position - on the edge of the map
         position = self._generate_edge_position()
         
         # Create the threat with appropriate strength scaling
-        strength_factor = 0.7 + (random.random() * 0.6)  # 0.7-1.3 random factor
+        strength_factor = 0.7 + (self.draws.next() * 0.6)  # 0.7-1.3 random factor
         adjusted_strength = max(0.5, min(2.0, strength_factor * (village_strength / 50.0)))
         
-        threat = Threat(threat_type, position, adjusted_strength)
+        threat = Threat(threat_type, position, adjusted_strength, draws=self.draws)
+        
+        # IDs are looked up through dicts, so redraw on the rare collision
+        while threat.id in self._threats_by_id or threat.id in self._defeated_by_id:
+            threat.id = _draw_int(self.draws, 1000, 9999)
+        
         self.threats.append(threat)
+        self._threats_by_id[threat.id] = threat
+        self.table.adopt(threat)
         
-        print(f"Warning! Scouts report a {threat.threat_type.name} approaching from the {self._get_direction_name(position)}!")
+        self.events.append((
+            "warning", threat.id,
+            f"Warning! Scouts report a {threat.threat_type.name} approaching from the {self._get_direction_name(position)}!"
+        ))
         
         return threat
     
@@ -478,7 +945,6 @@ class ThreatManager:
         
         # Check for weapons and tools
         village_resources = self.world.resource_manager.get_village_resources()
-        from src.environment.resources import ResourceType
         weapons = village_resources.get(ResourceType.WEAPONS, 0)
         tools = village_resources.get(ResourceType.BASIC_TOOLS, 0) + village_resources.get(ResourceType.ADVANCED_TOOLS, 0)
         
@@ -522,16 +988,17 @@ class ThreatManager:
     
     def _generate_edge_position(self) -> Tuple[int, int]:
         """Generate a position on the edge of the map"""
-        edge = random.choice(["north", "east", "south", "west"])
+        draws = self.draws
+        edge = ("north", "east", "south", "west")[int(draws.next() * 4)]
         
         if edge == "north":
-            return (random.randint(0, self.world.width - 1), 0)
+            return (_draw_int(draws, 0, self.world.width - 1), 0)
         elif edge == "east":
-            return (self.world.width - 1, random.randint(0, self.world.height - 1))
+            return (self.world.width - 1, _draw_int(draws, 0, self.world.height - 1))
         elif edge == "south":
-            return (random.randint(0, self.world.width - 1), self.world.height - 1)
+            return (_draw_int(draws, 0, self.world.width - 1), self.world.height - 1)
         else:  # west
-            return (0, random.randint(0, self.world.height - 1))
+            return (0, _draw_int(draws, 0, self.world.height - 1))
     
     def _get_direction_name(self, position: Tuple[int, int]) -> str:
         """Get a cardinal direction name based on position relative to village center"""
@@ -541,12 +1008,19 @@ class ThreatManager:
         dx, dy = x - center_x, y - center_y
         
         # Determine predominant direction
-        if abs(dx) > abs(dy):
-            # East-West predominant
-            return "east" if dx > 0 else "west"
-        else:
-            # North-South predominant
-            return "north" if dy < 0 else "south"
+        return _DIRECTION_NAMES[((dx > 0) - (dx < 0), (dy > 0) - (dy < 0), abs(dx) > abs(dy))]
+    
+    def drain_events(self) -> List[Tuple[str, int, str]]:
+        """
+        Take the notifications raised since the last call.
+        
+        Returns:
+            List of (kind, threat ID, message) tuples, oldest first. Kinds are
+            "warning", "alert", "defeated", "fled" and "victorious".
+        """
+        events = list(self.events)
+        self.events.clear()
+        return events
     
     def get_active_threats(self) -> List[Threat]:
         """Get all active threats"""
@@ -554,22 +1028,15 @@ class ThreatManager:
     
     def get_threat_by_id(self, threat_id: int) -> Optional[Threat]:
         """Find a threat by its ID"""
-        for threat in self.threats + self.defeated_threats:
-            if threat.id == threat_id:
-                return threat
-        return None
+        threat = self._threats_by_id.get(threat_id)
+        if threat is None:
+            threat = self._defeated_by_id.get(threat_id)
+        return threat
     
     def get_threats_near(self, position: Tuple[int, int], radius: int) -> List[Threat]:
         """Get threats within a certain radius of a position"""
-        x, y = position
-        nearby_threats = []
-        
-        for threat in self.threats:
-            tx, ty = threat.position
-            if abs(tx - x) <= radius and abs(ty - y) <= radius:
-                nearby_threats.append(threat)
-                
-        return nearby_threats
+        threats = self.table.threats
+        return [threats[row] for row in self.table.rows_near(position, radius).tolist()]
     
     def damage_threat(self, threat_id: int, damage: float) -> bool:
         """
@@ -592,6 +1059,11 @@ class ThreatManager:
         """Render all active threats"""
         cell_size = self.config.cell_size
         
+        # Gather every icon and health bar in draw order, then draw them in one call
+        blits = []
         for threat in self.threats:
             if threat.status in [ThreatStatus.APPROACHING, ThreatStatus.ATTACKING]:
-                threat.render(surface, cell_size) 
\ No newline at end of file
+                blits.extend(threat.get_blits(cell_size))
+        
+        if blits:
+            surface.blits(blits, doreturn=False) 
\ No newline at end of file
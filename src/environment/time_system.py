@@ -1,5 +1,10 @@
 from src.utils.config import Config
 
+# Seasons and weather conditions, in id order (ids index per-season/per-weather tables)
+SEASONS = ("spring", "summer", "autumn", "winter")
+WEATHER_TYPES = ("clear", "rain", "fog", "storm", "snow")
+WEATHER_IDS = {weather: i for i, weather in enumerate(WEATHER_TYPES)}
+
 class TimeSystem:
     """
     Manages the flow of time in the simulation, including day/night cycles and seasons.
@@ -15,16 +20,16 @@ class TimeSystem:
         self.config = config
         
         # Time tracking - all in ticks
-        self.current_tick = 0
-        self.ticks_per_hour = config.ticks_per_hour
+        self._current_tick = 0
         self.hours_per_day = 24
         self.days_per_season = 30
         self.seasons_per_year = 4
+        self.ticks_per_hour = config.ticks_per_hour  # Also sets the cached clock fields
         
         # Weather
         self.current_weather = "clear"
         self.weather_change_chance = 0.1  # Chance to change weather per day
-        self.possible_weather = ["clear", "rain", "fog", "storm", "snow"]
+        self.possible_weather = list(WEATHER_TYPES)
         self.season_weather = {
             "spring": ["clear", "rain", "fog"],
             "summer": ["clear", "storm"],
@@ -32,6 +37,38 @@ class TimeSystem:
             "winter": ["clear", "snow", "fog"]
         }
     
+    @property
+    def ticks_per_hour(self) -> int:
+        return self._ticks_per_hour
+    
+    @ticks_per_hour.setter
+    def ticks_per_hour(self, value: int):
+        self._ticks_per_hour = value
+        # In-game hours per tick, cached so per-tick code multiplies instead of divides
+        self.inv_ticks_per_hour = 1.0 / value
+        self._ticks_per_day = value * self.hours_per_day
+        self._update_clock()
+    
+    @property
+    def current_tick(self) -> int:
+        return self._current_tick
+    
+    @current_tick.setter
+    def current_tick(self, value: int):
+        self._current_tick = value
+        self._update_clock()
+    
+    def _update_clock(self):
+        """Recompute the cached calendar fields from the current tick"""
+        tick = self._current_tick
+        days_per_year = self.days_per_season * self.seasons_per_year
+        
+        self._total_day, self._day_tick = divmod(tick, self._ticks_per_day)
+        self._hour = self._day_tick // self._ticks_per_hour
+        self._day = self._total_day % self.days_per_season
+        self._year, self._year_day = divmod(self._total_day, days_per_year)
+        self._season_id = self._year_day // self.days_per_season
+    
     def step(self):
         """
         Advance time by one tick.
@@ -39,7 +76,7 @@ class TimeSystem:
         self.current_tick += 1
         
         # Check if day changed
-        if self.get_day_tick() == 0 and self.get_hour() == 0:
+        if self._day_tick == 0:
             self._update_weather()
     
     def get_tick(self) -> int:
@@ -48,49 +85,47 @@ class TimeSystem:
     
     def get_hour(self) -> int:
         """Get the current hour of the day (0-23)"""
-        return (self.current_tick // self.ticks_per_hour) % self.hours_per_day
+        return self._hour
     
     def get_day_tick(self) -> int:
         """Get the tick within the current day"""
-        return self.current_tick % (self.ticks_per_hour * self.hours_per_day)
+        return self._day_tick
     
     def get_day(self) -> int:
         """Get the current day number within the season"""
-        total_day = self.current_tick // (self.ticks_per_hour * self.hours_per_day)
-        return total_day % self.days_per_season
+        return self._day
     
     def get_season_day(self) -> int:
         """Get the day within the current season (0-29)"""
-        return self.get_day()
+        return self._day
     
     def get_year_day(self) -> int:
         """Get the day within the current year (0-119)"""
-        return (self.get_total_day() % (self.days_per_season * self.seasons_per_year))
+        return self._year_day
     
     def get_total_day(self) -> int:
         """Get the total number of days elapsed in the simulation"""
-        return self.current_tick // (self.ticks_per_hour * self.hours_per_day)
+        return self._total_day
+    
+    def get_season_id(self) -> int:
+        """Get the current season as an index into SEASONS"""
+        return self._season_id
     
     def get_season(self) -> str:
         """Get the current season name"""
-        season_index = (self.get_total_day() // self.days_per_season) % self.seasons_per_year
-        seasons = ["spring", "summer", "autumn", "winter"]
-        return seasons[season_index]
+        return SEASONS[self._season_id]
     
     def get_year(self) -> int:
         """Get the current year"""
-        return self.get_total_day() // (self.days_per_season * self.seasons_per_year)
+        return self._year
     
     def is_daytime(self) -> bool:
         """Check if it's currently daytime"""
-        hour = self.get_hour()
-        return 6 <= hour < 18  # Between 6am and 6pm
+        return 6 <= self._hour < 18  # Between 6am and 6pm
     
     def get_daytime_percentage(self) -> float:
         """Get a normalized value representing the time of day (0.0=midnight, 0.5=noon, 1.0=midnight)"""
-        hour = self.get_hour()
-        minute_percentage = (self.get_day_tick() % self.ticks_per_hour) / self.ticks_per_hour
-        return (hour + minute_percentage) / self.hours_per_day
+        return self._day_tick / self._ticks_per_day
     
     def get_season_percentage(self) -> float:
         """Get a normalized value representing progress through the current season (0.0-1.0)"""
@@ -100,6 +135,10 @@ class TimeSystem:
         """Get the current weather condition"""
         return self.current_weather
     
+    def get_weather_id(self) -> int:
+        """Get the current weather condition as an index into WEATHER_TYPES"""
+        return WEATHER_IDS[self.current_weather]
+    
     def _update_weather(self):
         """Update the weather based on season and random chance"""
         import random
@@ -1,14 +1,20 @@
 import numpy as np
+import random
 from typing import Dict, List, Tuple, Optional
 from gymnasium import spaces
 import pygame
 
 from src.utils.config import Config
+from src.utils.jit import set_num_threads
+from src.utils.rng import UniformBuffer
+from src.agents.population import ActionType, Population
+from src.agents.agent import select_need_actions
 from src.environment.resources import ResourceManager
 from src.environment.time_system import TimeSystem
 from src.environment.threats import ThreatManager
 from src.environment.storage import StorageManager, Warehouse, Granary, Stockpile, Armory
 from src.jobs.job_manager import JobManager
+from src.buildings.house import House, HouseManager
 
 class World:
     """
@@ -27,9 +33,25 @@ class World:
         self.width = config.world_width
         self.height = config.world_height
         
+        # Batched random draws; seeded from `random` so a seeded run stays reproducible
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        
+        # Pre-drawn values for socializing: first-meeting opinions and relationship gains
+        self.first_opinion_draws = UniformBuffer(self.rng, -10.0, 10.0)
+        self.relationship_gain_draws = UniformBuffer(self.rng, 0.5, 2.0)
+        
+        # Pre-drawn [0, 1) values for threat generation and per-threat rolls
+        self.threat_draws = UniformBuffer(self.rng, 0.0, 1.0)
+        
+        # Threads available to the parallel per-agent kernels
+        self.num_threads = set_num_threads(config.get('simulation_threads'))
+        
         # Initialize grid - each cell can contain multiple entities
         self.grid = [[[] for _ in range(self.height)] for _ in range(self.width)]
         
+        # Agent-only spatial index: (x, y) -> agents in that cell (occupied cells only)
+        self.agent_grid: Dict[Tuple[int, int], List] = {}
+        
         # Initialize systems
         self.time_system = TimeSystem(config)
         self.resource_manager = ResourceManager(self, config)
@@ -39,7 +61,10 @@ class World:
         
         # Entity tracking
         self.agents = []
+        self.population = Population()  # SoA storage for agent state
         self.buildings = []
+        self.buildings_by_position = {}  # (x, y) -> first building placed there
+        self.house_manager = HouseManager()  # SoA storage for house state
         
         # Village center location
         self.village_center = (self.width // 2, self.height // 2)
@@ -99,6 +124,17 @@ class World:
         # Update time
         self.time_system.step()
         
+        # Update agent needs and health for the whole village
+        self.update_all_needs(self.time_system.inv_ticks_per_hour)
+        
+        # Send idle agents with a critical need to address it
+        self._assign_need_actions()
+        
+        # Precompute this tick's movement steps for all agents at once
+        tick = self.time_system.get_tick()
+        self.population.draw_wander_deltas(self.rng, tick)
+        self.population.compute_home_deltas(tick)
+        
         # Update resources (growth, depletion)
         self.resource_manager.step(self.time_system)
         
@@ -116,6 +152,53 @@ class World:
             if self.time_system.get_hour() == 6:
                 self._evaluate_job_changes()
     
+    def update_all_needs(self, hours: float):
+        """
+        Update needs and health of every agent in one vectorized pass.
+        
+        Args:
+            hours: In-game hours elapsed
+        """
+        population = self.population
+        n = population.size
+        if n == 0:
+            return
+        
+        # Sleeping agents recover rest; agents at home don't lose shelter
+        sleeping = population.actions[:n] == ActionType.SLEEPING
+        in_shelter = population.has_home[:n] & (
+            population.positions[:n] == population.home_positions[:n]).all(axis=1)
+        
+        population.step(hours, resting=sleeping, sheltered=in_shelter)
+        population.update_health()
+    
+    def _assign_need_actions(self):
+        """
+        Assign need-driven actions to all idle agents at once.
+        Idle agents whose lowest need is below the attention threshold get the
+        matching action; the rest decide for themselves in Agent.step.
+        """
+        population = self.population
+        idle = np.flatnonzero(population.actions[:population.size] == 0)
+        if idle.size == 0:
+            return
+        
+        # Shared need -> action rule, applied to every idle agent at once
+        codes = select_need_actions(population.needs[idle], population.has_home[idle])
+        needy = codes != ActionType.NONE
+        if not needy.any():
+            return
+        idx = idle[needy]
+        codes = codes[needy]
+        
+        population.actions[idx] = codes
+        population.action_progress[idx] = 0.0
+        
+        go_home_code = ActionType.GO_HOME
+        for i in idx[codes == go_home_code]:
+            agent = population.agents[i]
+            agent.action_target = agent.home_position
+    
     def _evaluate_job_changes(self):
         """Evaluate whether agents should change jobs based on village needs"""
         for agent in self.agents:
@@ -130,7 +213,7 @@ class World:
     def _process_threats(self):
         """Process threats to the village"""
         # Calculate time delta in hours
-        hours_passed = 1.0 / self.time_system.ticks_per_hour
+        hours_passed = self.time_system.inv_ticks_per_hour
         
         # Update threats
         self.threat_manager.step(hours_passed)
@@ -186,7 +269,9 @@ class World:
         """Add an agent to the world at the specified position"""
         if 0 <= x < self.width and 0 <= y < self.height:
             self.grid[x][y].append(agent)
+            self.agent_grid.setdefault((x, y), []).append(agent)
             self.agents.append(agent)
+            self.population.adopt(agent)
             agent.position = (x, y)
             
             # Register agent with job manager if they have a job
@@ -202,10 +287,45 @@ class World:
         if 0 <= x < self.width and 0 <= y < self.height:
             self.grid[x][y].append(building)
             self.buildings.append(building)
+            self.buildings_by_position.setdefault((x, y), building)
             building.position = (x, y)
+            if isinstance(building, House):
+                self.house_manager.adopt(building)
             return True
         return False
     
+    def remove_building(self, building) -> bool:
+        """
+        Remove a building from the world.
+        
+        Args:
+            building: The building to remove
+            
+        Returns:
+            True if removed, False if it was not in the world
+        """
+        try:
+            self.buildings.remove(building)
+        except ValueError:
+            return False
+        
+        x, y = building.position
+        if building in self.grid[x][y]:
+            self.grid[x][y].remove(building)
+        
+        # Hand the position over to the next building placed there, if any
+        if self.buildings_by_position.get((x, y)) is building:
+            del self.buildings_by_position[(x, y)]
+            for other in self.buildings:
+                if other.position == (x, y):
+                    self.buildings_by_position[(x, y)] = other
+                    break
+        
+        # Give a removed house its own manager row again, out of the world's manager
+        if isinstance(building, House):
+            building.detach()
+        return True
+    
     def move_agent(self, agent, new_x: int, new_y: int):
         """Move an agent from current position to a new position"""
         old_x, old_y = agent.position
@@ -218,8 +338,15 @@ class World:
         if agent in self.grid[old_x][old_y]:
             self.grid[old_x][old_y].remove(agent)
         
+        cell_agents = self.agent_grid.get((old_x, old_y))
+        if cell_agents and agent in cell_agents:
+            cell_agents.remove(agent)
+            if not cell_agents:
+                del self.agent_grid[(old_x, old_y)]
+        
         # Add to new position
         self.grid[new_x][new_y].append(agent)
+        self.agent_grid.setdefault((new_x, new_y), []).append(agent)
         agent.position = (new_x, new_y)
         return True
     
@@ -1,6 +1,8 @@
 from typing import Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 
+from src.agents.population import BUILTIN_ACTION_COUNT
+
 class Job(ABC):
     """
     Base class for all jobs in the simulation.
@@ -86,8 +88,7 @@ class Job(ABC):
         agent.job = None
         
         # Reset job-specific actions
-        if agent.current_action and not agent.current_action in ["wander", "go_home", "find_food", 
-                                                               "find_water", "sleeping", "find_shelter", "socialize"]:
+        if agent.action_code >= BUILTIN_ACTION_COUNT:
             agent.current_action = None
             agent.action_target = None
             agent.action_progress = 0.0
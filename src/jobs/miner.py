@@ -122,9 +122,9 @@ class MinerJob(Job):
             agent._set_action("go_to_deposit", deposit_pos)
             return {"agent": agent.name, "action": "assigned_ore_deposit", "location": deposit_pos}
         
-        # Look for potential deposits nearby
+        # Look for potential deposits nearby (only cells that hold resources)
         x, y = agent.position
-        neighbors = world.get_neighboring_cells(x, y, 5)  # Search in a larger radius
+        neighbors = world.resource_manager.get_occupied_cells(x, y, 5)  # Search in a larger radius
         
         # Check for suitable locations
         potential_stone = []
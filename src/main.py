@@ -105,6 +105,10 @@ def run_simulation(world: World, config: Config, headless: bool = False):
             # Step the world
             world.step()
             
+            # Report threat notifications raised during the step
+            for _, _, message in world.threat_manager.drain_events():
+                print(message)
+            
             # Step each agent
             for agent in world.agents[:]:  # Copy list to allow removal during iteration
                 agent.step(world, 1.0)  # 1.0 = one tick
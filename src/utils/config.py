@@ -36,6 +36,9 @@ class Config:
             'agent_learning_rate': 1.0,  # How quickly agents learn skills
             'agent_memory_size': 20,  # Number of events an agent remembers
             
+            # Performance settings
+            'simulation_threads': None,  # CPU threads for parallel kernels (None = all cores)
+            
             # Job settings
             'job_types': ['farmer', 'woodcutter', 'miner', 'builder', 'merchant'],
             'job_distribution': {  # Approximate percentage of agents with each job
@@ -0,0 +1,43 @@
+"""
+Optional Numba support for the simulation's numeric kernels.
+
+Numba is not a hard dependency. When it is missing, `njit` leaves functions
+as plain Python and `prange` falls back to `range`, so kernels still run
+(just without compilation).
+
+Kernels compiled with `parallel=True` spread their rows across Numba's
+thread pool, which works on the Population arrays in place (shared memory,
+no pickling). `set_num_threads` sizes that pool.
+"""
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+def set_num_threads(threads=None) -> int:
+    """
+    Set how many CPU threads parallel kernels may use.
+
+    Args:
+        threads: Thread count, or None to use every available core
+
+    Returns:
+        Number of threads actually in use (1 without Numba)
+    """
+    if not NUMBA_AVAILABLE:
+        return 1
+
+    limit = numba.config.NUMBA_NUM_THREADS
+    threads = limit if threads is None else max(1, min(int(threads), limit))
+    numba.set_num_threads(threads)
+    return threads
@@ -0,0 +1,123 @@
+"""
+Resource type definitions and per-type lookup tables.
+
+Kept free of simulation imports so low-level modules (e.g. buildings) can use
+ResourceType without importing the environment package.
+"""
+import numpy as np
+from typing import List, Optional
+from enum import Enum, auto
+
+class ResourceType(Enum):
+    """Enumeration of different resource types in the world"""
+    WOOD = auto()       # Processed wood
+    STONE = auto()      # Stone resource
+    IRON = auto()       # Iron ore (deprecated, use IRON_ORE)
+    FOOD_BERRY = auto() # Berry bush
+    FOOD_FISH = auto()  # Fish in water
+    FOOD_WHEAT = auto() # Wheat crops
+    WATER = auto()      # Water source
+    CLAY = auto()       # Clay for pottery/building
+    TREE = auto()       # Trees for wood harvesting
+    STONE_BLOCK = auto() # Processed stone for building
+    IRON_ORE = auto()   # Raw iron ore
+    IRON_INGOT = auto() # Processed iron
+    HERB = auto()       # Medicinal herb
+    BASIC_TOOLS = auto() # Basic tools for various jobs
+    WEAPONS = auto()    # Weapons for defense
+    ADVANCED_TOOLS = auto() # Advanced tools for specialized jobs
+    POTION = auto()     # Healing potion
+    
+    @classmethod
+    def get_color(cls, resource_type):
+        """Get color for visualization purposes"""
+        if isinstance(resource_type, ResourceType):
+            return _COLOR_TUPLES[resource_type.value]
+        return UNKNOWN_RESOURCE_COLOR
+    
+    @classmethod
+    def get_colors(cls, type_ids: np.ndarray) -> np.ndarray:
+        """
+        Get colors for many resources at once.
+        
+        Args:
+            type_ids: Array of ResourceType values
+            
+        Returns:
+            (N, 3) uint8 array of RGB colors
+        """
+        return _COLOR_LUT[type_ids]
+    
+    @classmethod
+    def is_raw_resource(cls, resource_type):
+        """Determine if a resource is a raw (natural) resource type"""
+        return resource_type in RAW_RESOURCES
+    
+    @classmethod
+    def is_processed_resource(cls, resource_type):
+        """Determine if a resource is a processed resource type"""
+        return resource_type in PROCESSED_RESOURCES
+    
+    @classmethod
+    def is_crafted_item(cls, resource_type):
+        """Determine if a resource is a crafted item"""
+        return resource_type in CRAFTED_ITEMS
+
+# Resource type categories (module-level, since sets in an Enum body would become members)
+RAW_RESOURCES = frozenset({
+    ResourceType.TREE, ResourceType.STONE, ResourceType.IRON_ORE, ResourceType.FOOD_BERRY,
+    ResourceType.FOOD_FISH, ResourceType.FOOD_WHEAT, ResourceType.WATER, ResourceType.CLAY,
+    ResourceType.HERB
+})
+PROCESSED_RESOURCES = frozenset({
+    ResourceType.WOOD, ResourceType.STONE_BLOCK, ResourceType.IRON_INGOT
+})
+CRAFTED_ITEMS = frozenset({
+    ResourceType.BASIC_TOOLS, ResourceType.WEAPONS, ResourceType.ADVANCED_TOOLS, ResourceType.POTION
+})
+
+# Visualization colors by resource type
+RESOURCE_COLORS = {
+    ResourceType.WOOD: (139, 69, 19),      # Brown
+    ResourceType.STONE: (169, 169, 169),   # Grey
+    ResourceType.IRON: (105, 105, 105),    # Dark Grey
+    ResourceType.FOOD_BERRY: (255, 0, 0),  # Red
+    ResourceType.FOOD_FISH: (70, 130, 180), # Steel Blue
+    ResourceType.FOOD_WHEAT: (218, 165, 32), # Golden
+    ResourceType.WATER: (0, 0, 255),       # Blue
+    ResourceType.CLAY: (205, 133, 63),     # Peru
+    ResourceType.TREE: (34, 139, 34),      # Forest Green
+    ResourceType.STONE_BLOCK: (192, 192, 192), # Silver
+    ResourceType.IRON_ORE: (94, 94, 94),   # Dark Grey
+    ResourceType.IRON_INGOT: (211, 211, 211), # Light Grey
+    ResourceType.HERB: (124, 252, 0),      # Lawn Green
+    ResourceType.BASIC_TOOLS: (160, 82, 45),  # Sienna
+    ResourceType.WEAPONS: (178, 34, 34),     # Firebrick
+    ResourceType.ADVANCED_TOOLS: (85, 107, 47), # Dark Olive Green
+    ResourceType.POTION: (148, 0, 211),     # Dark Violet
+}
+UNKNOWN_RESOURCE_COLOR = (0, 0, 0)
+
+# Number of type id slots: tables indexed by ResourceType value (slot 0 unused)
+NUM_TYPE_IDS = max(t.value for t in ResourceType) + 1
+
+# ResourceType for each type id (None for unused slots)
+TYPES_BY_ID: List[Optional[ResourceType]] = [None] * NUM_TYPE_IDS
+for _resource_type in ResourceType:
+    TYPES_BY_ID[_resource_type.value] = _resource_type
+
+# Per-type flags indexed by type id, so array code never touches the Enum
+TYPE_IS_FOOD = np.zeros(NUM_TYPE_IDS, dtype=bool)
+for _resource_type in ResourceType:
+    TYPE_IS_FOOD[_resource_type.value] = _resource_type.name.startswith("FOOD")
+TYPE_IS_WATER = np.zeros(NUM_TYPE_IDS, dtype=bool)
+TYPE_IS_WATER[ResourceType.WATER.value] = True
+TYPE_IS_TREE = np.zeros(NUM_TYPE_IDS, dtype=bool)
+TYPE_IS_TREE[ResourceType.TREE.value] = True
+
+# Color lookup tables indexed by type id: tuples for single lookups,
+# an array for batched rendering
+_COLOR_TUPLES = [UNKNOWN_RESOURCE_COLOR] * NUM_TYPE_IDS
+for _resource_type, _color in RESOURCE_COLORS.items():
+    _COLOR_TUPLES[_resource_type.value] = _color
+_COLOR_LUT = np.array(_COLOR_TUPLES, dtype=np.uint8)
@@ -0,0 +1,50 @@
+import random
+import numpy as np
+from typing import Optional
+
+_shared_rng: Optional[np.random.Generator] = None
+
+def shared_rng() -> np.random.Generator:
+    """
+    Get the process-wide NumPy generator for code without a world to draw from.
+    It is created on first use, seeded from `random`, so runs seeded with
+    random.seed() stay reproducible.
+    """
+    global _shared_rng
+    if _shared_rng is None:
+        _shared_rng = np.random.default_rng(random.getrandbits(64))
+    return _shared_rng
+
+class UniformBuffer:
+    """
+    Pre-drawn uniform random samples for code that needs one value at a time.
+    Samples are drawn from a NumPy generator in large batches, so each value
+    costs a list index instead of a Python-level RNG call.
+    """
+
+    def __init__(self, rng: np.random.Generator, low: float, high: float, size: int = 4096):
+        """
+        Initialize the buffer.
+
+        Args:
+            rng: Random generator to draw from
+            low: Lower bound of the samples (inclusive)
+            high: Upper bound of the samples (exclusive)
+            size: Number of samples drawn per refill
+        """
+        self.rng = rng
+        self.low = low
+        self.high = high
+        self.size = size
+        self._values = []
+        self._next = 0
+
+    def next(self) -> float:
+        """Get the next sample, refilling the buffer when it runs out"""
+        if self._next >= len(self._values):
+            self._values = self.rng.uniform(self.low, self.high, self.size).tolist()
+            self._next = 0
+
+        value = self._values[self._next]
+        self._next += 1
+        return value
@@ -118,8 +118,11 @@ class Renderer:
         Args:
             surface: The surface to render on
         """
-        # Let the resource manager handle rendering
-        self.world.resource_manager.render(surface)
+        # Let the resource manager handle rendering, culled to the grid surface.
+        # Resources are drawn at their world cells (no camera offset), so the view
+        # is in the same space; the extra row keeps tree foliage from the row below.
+        view = (0, 0, self.grid_width, self.grid_height + 1)
+        self.world.resource_manager.render(surface, view)
     
     def _render_buildings(self, surface: pygame.Surface):
         """
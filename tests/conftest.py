@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Render to an off-screen surface so pygame works without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import the environment package first; it sets up the agents/jobs/buildings imports
+import src.environment  # noqa: E402,F401
@@ -0,0 +1,68 @@
+import pytest
+
+from src.buildings.building import resource_array, resource_slot
+from src.buildings.house import House, HouseManager
+from src.environment.world import World
+from src.utils.config import Config
+from src.utils.resource_types import ResourceType
+
+def test_house_manager_release_keeps_handles_consistent():
+    config = Config()
+    manager = HouseManager()
+    houses = [House(config, (i, i)) for i in range(10)]
+    for i, house in enumerate(houses):
+        manager.adopt(house)
+        house.condition = float(i)
+    insulation = {house: house.insulation for house in houses}
+    
+    for house in houses[1::3]:
+        HouseManager(capacity=1).adopt(house)
+    
+    assert len(manager) == 7
+    for row, house in enumerate(manager.houses):
+        assert house._manager is manager and house._idx == row
+    for i, house in enumerate(houses):
+        assert house.condition == float(i)
+        assert house.insulation == insulation[house]
+
+def test_house_insulation_is_the_manager_column():
+    house = House(Config(), (0, 0))
+    manager = HouseManager()
+    manager.adopt(house)
+    assert "insulation" not in house.properties
+    
+    house.insulation = 0.25
+    assert manager.insulation[house._idx] == 0.25
+    manager.insulation[house._idx] = 0.75
+    assert house.insulation == 0.75
+    assert house.get_shelter_quality() == 0.75 * house.condition / 100.0
+
+def test_removed_house_leaves_the_world_manager():
+    config = Config()
+    world = World(config)
+    count = len(world.house_manager)
+    house = House(config, (2, 2))
+    house.condition = 50.0
+    
+    world.add_building(house, 2, 2)
+    assert len(world.house_manager) == count + 1
+    assert world.remove_building(house)
+    assert len(world.house_manager) == count
+    assert house._manager is not world.house_manager and house.condition == 50.0
+
+def test_building_stores_non_resource_keys():
+    building = House(Config(), (0, 0))
+    assert building.store_resource("WOOD", 5.0) == 5.0
+    assert building.store_resource("trinkets", 2.0) == 2.0
+    
+    assert building.get_stored_resources()["trinkets"] == 2.0
+    assert building.retrieve_resource("trinkets", 5.0) == 2.0
+    assert building.retrieve_resource("WOOD", 1.0) == 1.0
+
+def test_resource_array_rejects_unknown_names():
+    array = resource_array({"WOOD": 3.0, ResourceType.STONE: 2.0})
+    assert array[resource_slot("WOOD")] == 3.0 and array[resource_slot("STONE")] == 2.0
+    assert array.sum() == 5.0
+    
+    with pytest.raises(KeyError):
+        resource_array({"WOOD": 3.0, "trinkets": 1.0})
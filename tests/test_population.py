@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from src.agents import population as population_module
+from src.agents.agent import Agent, NEED_ACTIONS, NEED_ATTENTION_THRESHOLD, select_need_actions
+from src.agents.population import ActionType, Population
+from src.utils.config import Config
+
+def random_population(seed, count=300):
+    rng = np.random.default_rng(seed)
+    population = Population()
+    for _ in range(count):
+        population.allocate(None)
+    population.needs[:count] = rng.choice([5.0, 15.0, 35.0, 60.0, 90.0], population.needs[:count].shape)
+    population.health[:count] = rng.uniform(0.0, 100.0, count)
+    population.health[:count:10] = 100.0
+    return population
+
+@pytest.mark.skipif(not population_module.NUMBA_AVAILABLE, reason="Numba is not installed")
+@pytest.mark.parametrize("seed", range(3))
+def test_health_kernel_matches_fallback(monkeypatch, seed):
+    compiled = random_population(seed)
+    fallback = random_population(seed)
+    
+    for _ in range(5):
+        compiled.update_health()
+        with monkeypatch.context() as patch:
+            patch.setattr(population_module, "NUMBA_AVAILABLE", False)
+            fallback.update_health()
+        np.testing.assert_allclose(compiled.health[:compiled.size], fallback.health[:fallback.size], rtol=1e-6)
+
+def test_release_keeps_handles_consistent():
+    config = Config()
+    population = Population()
+    agents = [Agent(config) for _ in range(12)]
+    for i, agent in enumerate(agents):
+        population.adopt(agent)
+        agent.position = (i, 2 * i)
+        agent.needs["food"] = float(i)
+    
+    for agent in agents[::4]:
+        Population(capacity=1).adopt(agent)
+    
+    assert population.size == 9
+    for row, agent in enumerate(population.agents):
+        assert agent.population is population and agent.idx == row
+    for i, agent in enumerate(agents):
+        assert agent.position == (i, 2 * i)
+        assert agent.needs["food"] == float(i)
+
+def test_need_actions_address_the_lowest_need():
+    rng = np.random.default_rng(0)
+    needs = rng.uniform(0.0, 100.0, (500, 5)).astype(np.float32)
+    has_home = rng.random(500) < 0.5
+    codes = select_need_actions(needs, has_home)
+    
+    for row, home, code in zip(needs, has_home, codes):
+        if row.min() >= NEED_ATTENTION_THRESHOLD:
+            expected = ActionType.NONE
+        else:
+            expected = NEED_ACTIONS[int(np.argmin(row))]
+            if expected == ActionType.GO_HOME and not home:
+                expected = ActionType.FIND_SHELTER
+        assert code == expected
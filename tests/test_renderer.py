@@ -0,0 +1,26 @@
+import random
+
+import pygame
+
+from src.environment.world import World
+from src.utils.config import Config
+from src.visualization.renderer import Renderer
+
+def test_resources_render_the_same_after_the_camera_pans():
+    random.seed(0)
+    pygame.init()
+    config = Config()
+    world = World(config)
+    renderer = Renderer(world, config)
+    size = (renderer.grid_width * renderer.cell_size, renderer.grid_height * renderer.cell_size)
+    
+    # Reference: every resource on the surface, as drawn without a view
+    expected = pygame.Surface(size)
+    world.resource_manager.render(expected)
+    
+    renderer.camera_x, renderer.camera_y = 5, 7
+    panned = pygame.Surface(size)
+    renderer._render_resources(panned)
+    
+    assert pygame.image.tobytes(panned, "RGB") == pygame.image.tobytes(expected, "RGB")
+    assert any(x < 5 or y < 7 for x, y in (resource.position for resource in world.resource_manager.resources))
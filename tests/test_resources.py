@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from src.environment import resources
+from src.environment.resources import (
+    ResourceTable, ResourceType, _cluster_cells_vectorized, _cluster_kernel
+)
+
+def make_table(seed, count=500):
+    """A table with a mix of full, partly grown and depleted rows"""
+    rng = np.random.default_rng(seed)
+    table = ResourceTable()
+    max_quantities = rng.uniform(10.0, 100.0, count)
+    quantities = max_quantities * rng.choice([1.0, 0.5, 0.0], count)
+    table.add_rows(ResourceType.WOOD, rng.integers(0, 50, count), rng.integers(0, 50, count),
+                   quantities, max_quantities, 0.5)
+    table.depleted[:count] = quantities == 0.0
+    table.quantity[:count][table.depleted[:count]] = 0.0
+    return table
+
+@pytest.mark.parametrize("cluster_size", [3, 5, 7])
+@pytest.mark.parametrize("center", [(25, 25), (1, 48), (-2, 3)])
+def test_cluster_kernel_matches_vectorized(center, cluster_size):
+    rng = np.random.default_rng(cluster_size)
+    cells = (2 * cluster_size + 1) ** 2
+    rolls, fills = rng.random(cells), rng.uniform(0.6, 1.0, cells)
+    
+    args = (center[0], center[1], cluster_size, 0.7, 100.0, 50, 50, rolls, fills)
+    for compiled, vectorized in zip(_cluster_kernel(*args), _cluster_cells_vectorized(*args)):
+        assert compiled.dtype == vectorized.dtype
+        np.testing.assert_allclose(compiled, vectorized)
+
+@pytest.mark.skipif(not resources.NUMBA_AVAILABLE, reason="Numba is not installed")
+@pytest.mark.parametrize("seed", range(3))
+def test_regrow_kernel_matches_fallback(monkeypatch, seed):
+    compiled = make_table(seed)
+    fallback = make_table(seed)
+    compiled_rng = np.random.default_rng(seed)
+    fallback_rng = np.random.default_rng(seed)
+    
+    for _ in range(30):
+        compiled.regrow(1.3, 0.8, compiled_rng)
+        with monkeypatch.context() as patch:
+            patch.setattr(resources, "NUMBA_AVAILABLE", False)
+            fallback.regrow(1.3, 0.8, fallback_rng)
+        
+        n = compiled.size
+        np.testing.assert_array_equal(compiled.depleted[:n], fallback.depleted[:n])
+        np.testing.assert_allclose(compiled.quantity[:n], fallback.quantity[:n], rtol=1e-6)
+        np.testing.assert_allclose(compiled.fill[:n], fallback.fill[:n], rtol=1e-6)
+        np.testing.assert_array_equal(np.sort(compiled._worklist), np.sort(fallback._worklist))
+
+def test_extract_bulk_matches_single_extracts():
+    bulk = make_table(0, count=50)
+    single = make_table(0, count=50)
+    rng = np.random.default_rng(1)
+    rows = rng.integers(0, 50, 200)
+    amounts = rng.uniform(0.0, 30.0, 200).astype(np.float32)
+    
+    taken = bulk.extract_bulk(rows, amounts)
+    expected = [single.resources[row].extract(float(amount)) for row, amount in zip(rows.tolist(), amounts)]
+    
+    np.testing.assert_allclose(taken, expected, rtol=1e-6)
+    np.testing.assert_allclose(bulk.quantity[:50], single.quantity[:50], rtol=1e-6)
+    np.testing.assert_array_equal(bulk.depleted[:50], single.depleted[:50])
+
+def test_release_keeps_handles_and_worklist_consistent():
+    table = make_table(2, count=100)
+    expected = {resource: (resource.position, resource.quantity) for resource in table.resources}
+    
+    for resource in table.resources[::7]:
+        ResourceTable(capacity=1).adopt(resource)
+    
+    for row, resource in enumerate(table.resources):
+        assert resource._table is table and resource._idx == row
+        assert (resource.position, resource.quantity) == expected[resource]
+    
+    n = table.size
+    needs_work = np.flatnonzero(table.depleted[:n] | (table.quantity[:n] < table.max_quantity[:n]))
+    np.testing.assert_array_equal(np.sort(table._refresh_worklist()), needs_work)
@@ -0,0 +1,84 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.environment import storage
+from src.environment.resources import ResourceType
+from src.environment.storage import Granary, Stockpile, StorageManager, StorageTable, Warehouse
+from src.environment.world import World
+from src.utils.config import Config
+
+@pytest.fixture
+def manager():
+    random.seed(0)
+    world = World(Config())
+    manager = StorageManager(world)
+    rng = np.random.default_rng(0)
+    kinds = (Warehouse, Granary, Stockpile)
+    for i, (x, y) in enumerate(rng.integers(0, 50, size=(120, 2)).tolist()):
+        manager.add_facility(kinds[i % len(kinds)]((x, y)))
+    return manager
+
+def linear_scan_near(manager, position, distance):
+    x, y = position
+    return [facility for facility in manager.storage_facilities
+            if abs(facility.position[0] - x) <= distance and abs(facility.position[1] - y) <= distance]
+
+def test_get_facilities_near_matches_linear_scan(manager):
+    rng = np.random.default_rng(1)
+    for _ in range(300):
+        position = tuple(rng.integers(-10, 60, size=2).tolist())
+        distance = int(rng.integers(0, 70))
+        assert manager.get_facilities_near(position, distance) == linear_scan_near(manager, position, distance)
+
+def test_get_facilities_near_after_removals(manager):
+    for facility in list(manager.storage_facilities[::3]):
+        assert manager.remove_facility(facility.id)
+    
+    for position, distance in (((25, 25), 0), ((25, 25), 10), ((0, 49), 8), ((25, 25), 100)):
+        assert manager.get_facilities_near(position, distance) == linear_scan_near(manager, position, distance)
+
+def test_remove_facility_keeps_rows_consistent(manager):
+    for facility in manager.storage_facilities:
+        facility.add_resource(ResourceType.WOOD, float(facility.id % 17))
+    expected = {facility: facility.get_amount(ResourceType.WOOD) for facility in manager.storage_facilities}
+    
+    removed = manager.storage_facilities[4]
+    assert manager.remove_facility(removed.id)
+    
+    table = manager.table
+    assert table.size == len(manager.storage_facilities)
+    for row, facility in enumerate(table.facilities):
+        assert facility._table is table and facility._row == row
+    for facility, amount in expected.items():
+        assert facility.get_amount(ResourceType.WOOD) == amount
+    assert removed._table is not table
+
+def damaged_table(seed):
+    rng = np.random.default_rng(seed)
+    table = StorageTable()
+    for _ in range(200):
+        table.allocate(None)
+    n = table.size
+    table.capacity[:n] = 1000.0
+    table.condition[:n] = rng.uniform(0.0, 100.0, n)
+    table.stock[:n] = rng.uniform(0.0, 50.0, table.stock[:n].shape)
+    return table
+
+@pytest.mark.skipif(not storage.NUMBA_AVAILABLE, reason="Numba is not installed")
+@pytest.mark.parametrize("seed", range(3))
+def test_damage_kernel_matches_fallback(monkeypatch, seed):
+    compiled = damaged_table(seed)
+    fallback = damaged_table(seed)
+    damage = np.random.default_rng(seed + 100).uniform(0.0, 80.0, compiled.size)
+    
+    taken, lost = compiled.apply_damage(damage, np.random.default_rng(seed))
+    monkeypatch.setattr(storage, "NUMBA_AVAILABLE", False)
+    expected_taken, expected_lost = fallback.apply_damage(damage, np.random.default_rng(seed))
+    
+    assert lost.any()
+    np.testing.assert_array_equal(lost, expected_lost)
+    np.testing.assert_allclose(taken, expected_taken)
+    np.testing.assert_allclose(compiled.condition[:compiled.size], fallback.condition[:fallback.size])
+    np.testing.assert_allclose(compiled.stock[:compiled.size], fallback.stock[:fallback.size])
@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.environment import threats
+from src.environment.threats import (
+    SPATIAL_INDEX_MIN_THREATS, Threat, ThreatStatus, ThreatTable, ThreatType
+)
+from src.environment.world import World
+from src.utils.config import Config
+
+
+def make_table(count, seed=0, extent=200):
+    """Build a table of `count` threats at random positions (some off the map)"""
+    rng = np.random.default_rng(seed)
+    table = ThreatTable()
+    for x, y in rng.integers(-20, extent, size=(count, 2)).tolist():
+        table.adopt(Threat(ThreatType.WOLVES, (x, y)))
+    return table
+
+def brute_force_near(table, position, radius):
+    return [row for row in range(table.size)
+            if max(abs(int(table.positions[row, 0]) - position[0]),
+                   abs(int(table.positions[row, 1]) - position[1])) <= radius]
+
+@pytest.mark.parametrize("count", [10, SPATIAL_INDEX_MIN_THREATS - 1, SPATIAL_INDEX_MIN_THREATS, 500])
+def test_rows_near_matches_brute_force(count):
+    table = make_table(count, seed=count)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        position = tuple(rng.integers(-30, 230, size=2).tolist())
+        radius = int(rng.integers(0, 60))
+        assert table.rows_near(position, radius).tolist() == brute_force_near(table, position, radius)
+
+def test_rows_near_sees_moves_and_releases():
+    table = make_table(200)
+    table.rows_near((0, 0), 5)  # Build the bucket index
+    
+    moved = table.threats[7]
+    moved.position = (1000, 1000)
+    assert table.rows_near((1000, 1000), 0).tolist() == [moved._row]
+    
+    table.release(3)
+    for position, radius in (((1000, 1000), 0), ((50, 50), 40), ((0, 0), 300)):
+        assert table.rows_near(position, radius).tolist() == brute_force_near(table, position, radius)
+
+def test_swap_pop_release_keeps_handles_consistent():
+    table = make_table(20)
+    expected = {threat: threat.position for threat in table.threats}
+    
+    released = [table.threats[0], table.threats[5], table.threats[-1]]
+    for threat in released:
+        ThreatTable(capacity=1).adopt(threat)
+        assert threat.position == expected[threat]
+    
+    assert table.size == 17
+    for row, threat in enumerate(table.threats):
+        assert threat._table is table and threat._row == row
+        assert threat.position == expected[threat]
+
+def random_update_table(count, seed):
+    """A table with a mix of approaching and attacking threats, some with targets"""
+    rng = np.random.default_rng(seed)
+    table = make_table(count, seed=seed, extent=60)
+    n = table.size
+    table.statuses[:n] = rng.choice(
+        [ThreatStatus.APPROACHING.value, ThreatStatus.ATTACKING.value, ThreatStatus.DEFEATED.value], n)
+    table.approach_times[:n] = rng.uniform(-1.0, 2.0, n)
+    table.targets[:n] = rng.integers(-5, 65, size=(n, 2))
+    table.has_target[:n] = rng.random(n) < 0.7
+    return table
+
+@pytest.mark.skipif(not threats.NUMBA_AVAILABLE, reason="Numba is not installed")
+@pytest.mark.parametrize("seed", range(5))
+def test_update_kernel_matches_fallback(monkeypatch, seed):
+    compiled = random_update_table(300, seed)
+    fallback = random_update_table(300, seed)
+    
+    for _ in range(10):
+        arrived, moved = compiled.update(0.37, 50, 50)
+        with monkeypatch.context() as patch:
+            patch.setattr(threats, "NUMBA_AVAILABLE", False)
+            expected_arrived, expected_moved = fallback.update(0.37, 50, 50)
+        
+        np.testing.assert_array_equal(arrived, expected_arrived)
+        np.testing.assert_array_equal(moved, expected_moved)
+        n = compiled.size
+        np.testing.assert_array_equal(compiled.positions[:n], fallback.positions[:n])
+        np.testing.assert_array_equal(compiled.statuses[:n], fallback.statuses[:n])
+        np.testing.assert_array_equal(compiled.approach_times[:n], fallback.approach_times[:n])
+
+def test_update_empty_table():
+    arrived, moved = ThreatTable().update(1.0, 50, 50)
+    assert arrived.size == 0 and moved.size == 0
+
+def generate_threats(seed):
+    """Generate and wound a few threats in a seeded world; return what was drawn"""
+    random.seed(seed)
+    world = World(Config())
+    manager = world.threat_manager
+    state = random.getstate()
+    
+    for _ in range(20):
+        threat = manager._generate_threat()
+        threat.take_damage(threat.health * 0.8)
+    
+    assert random.getstate() == state  # Threats draw only from the world's generator
+    return [(threat.id, threat.threat_type, threat.position, threat.size, threat.approach_time,
+             threat.aggression, threat.status) for threat in manager.threats]
+
+def test_threat_rolls_come_from_the_world_generator():
+    assert generate_threats(3) == generate_threats(3)
+    assert generate_threats(3) != generate_threats(4)